@@ -0,0 +1,132 @@
+"""Throughput and latency of the sync and async course routers under concurrent
+clients. Each mode runs in its own uvicorn process against the configured
+database.
+
+In sync mode, response serialization also runs in the Starlette threadpool
+(40 threads). Once concurrency exceeds threadpool plus connection pool size,
+handlers waiting for a connection hold every thread while finished requests
+hold every connection waiting for a thread, and the server stalls until the
+pool timeout fires. Those requests are reported as errors.
+
+    ENV=local uv run -m scripts.benchmarks.concurrency --clients 50 200 1000
+"""
+
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+
+import httpx
+
+from scripts.benchmarks.utils import BenchmarkResult, report
+from techconnect_classes_api.core.log import setup_logger
+
+setup_logger()
+log = logging.getLogger(__name__)
+
+
+def start_server(
+    port: int, async_routes: bool, pool_size: int, max_overflow: int
+) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "ASYNC_COURSE_ROUTES": str(async_routes),
+        "POSTGRES_POOL_SIZE": str(pool_size),
+        "POSTGRES_MAX_OVERFLOW": str(max_overflow),
+        "RATE_LIMIT_ENABLED": "False",
+        "LOG_LEVEL": "WARNING",
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "techconnect_classes_api.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/", timeout=1).raise_for_status()
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("Server did not start in time")
+
+
+async def run_clients(
+    base_url: str, path: str, clients: int, requests_per_client: int, timeout: float
+) -> tuple[BenchmarkResult, int]:
+    latencies: list[float] = []
+    errors = 0
+
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                response.raise_for_status()
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=timeout
+    ) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(clients)))
+        total = time.perf_counter() - start
+
+    return BenchmarkResult(path, len(latencies), total, latencies or [0.0]), errors
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--requests-per-client", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--path", nargs="+", default=["/courses/all", "/courses/1"])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--max-overflow", type=int, default=30)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    results = []
+    for async_routes in [False, True]:
+        mode = "async" if async_routes else "sync"
+        server = start_server(
+            args.port, async_routes, args.pool_size, args.max_overflow
+        )
+        try:
+            for path in args.path:
+                for clients in args.clients:
+                    result, errors = asyncio.run(
+                        run_clients(
+                            f"http://127.0.0.1:{args.port}",
+                            path,
+                            clients,
+                            args.requests_per_client,
+                            args.timeout,
+                        )
+                    )
+                    result.name = f"{mode} x{clients}: GET {path} ({errors} errors)"
+                    results.append(result)
+        finally:
+            server.terminate()
+            server.wait()
+    report(results)
@@ -0,0 +1,72 @@
+"""Requests/second on /courses/all and /courses/{course_id} with a per-request
+engine (previous behaviour) versus the process-wide pooled engine.
+
+Run against a seeded database:
+    ENV=local uv run -m scripts.benchmarks.connection_pool --requests 500
+"""
+
+import logging
+from argparse import ArgumentParser
+from typing import Generator
+
+from fastapi.testclient import TestClient
+
+from scripts.benchmarks.utils import measure, report
+from techconnect_classes_api.api.limiter import limiter
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.core.log import setup_logger
+from techconnect_classes_api.database import (
+    get_db,
+    get_local_session,
+    get_sqlalchemy_db_url,
+)
+from techconnect_classes_api.main import app
+
+setup_logger()
+log = logging.getLogger(__name__)
+
+
+def get_db_per_request_engine() -> Generator:
+    """Previous `get_db`: build a new engine and pool for every request."""
+    session_local = get_local_session(get_sqlalchemy_db_url(settings))
+    db = session_local()
+    try:
+        yield db
+    finally:
+        db.close()
+        # The old code left the pool to the garbage collector; dispose it here so
+        # the benchmark doesn't exhaust the server's connection limit.
+        session_local.kw["bind"].dispose()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--course-id", type=int, default=1)
+    args = parser.parse_args()
+
+    limiter.enabled = False
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("techconnect_classes_api").setLevel(logging.INFO)
+
+    paths = ["/courses/all", f"/courses/{args.course_id}"]
+    results = []
+    with TestClient(app) as client:
+        for mode, override in [
+            ("per-request engine", get_db_per_request_engine),
+            ("pooled engine", None),
+        ]:
+            if override:
+                app.dependency_overrides[get_db] = override
+            else:
+                app.dependency_overrides.pop(get_db, None)
+            for path in paths:
+                client.get(path).raise_for_status()  # warm up
+                results.append(
+                    measure(
+                        f"{mode}: GET {path}",
+                        lambda: client.get(path).raise_for_status(),
+                        args.requests,
+                    )
+                )
+    report(results)
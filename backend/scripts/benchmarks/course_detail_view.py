@@ -0,0 +1,62 @@
+"""Latency of `course_crud.get_detail` reading one row of the `course_details`
+materialized view against assembling the detail from the joined catalog tables.
+
+Creates and refreshes the view if needed, then reads random courses from the
+configured database:
+    ENV=local uv run -m scripts.benchmarks.course_detail_view
+"""
+
+import logging
+import random
+from argparse import ArgumentParser
+
+from sqlalchemy import select
+
+from scripts.benchmarks.utils import measure, report
+from scripts.core.create_tables import (
+    create_course_details_view,
+    refresh_course_details_view,
+)
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.core.log import setup_logger
+from techconnect_classes_api.crud.course import course_crud
+from techconnect_classes_api.database import get_db_engine, get_managed_db
+from techconnect_classes_api.models import Course
+
+setup_logger()
+log = logging.getLogger(__name__)
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=5_000)
+    args = parser.parse_args()
+
+    engine = get_db_engine()
+    create_course_details_view(engine)
+    refresh_course_details_view(engine)
+
+    with get_managed_db() as db:
+        all_ids = db.scalars(select(Course.id)).all()
+        # Courses with invalid stored data raise on both paths
+        course_ids = [c.id for c in course_crud.get_details_many(db, all_ids).courses]
+    log.info(f"{len(course_ids)} courses")
+
+    results = []
+    for name, view_enabled in [("joins", False), ("materialized view", True)]:
+        settings.COURSE_DETAIL_VIEW_ENABLED = view_enabled
+        ids = random.Random(0).choices(course_ids, k=args.iterations)
+        with get_managed_db() as db:
+            # Warm up the connection and the statement caches
+            for course_id in ids[:100]:
+                course_crud.get_detail(db, course_id)
+            next_id = iter(ids).__next__
+            results.append(
+                measure(
+                    f"get_detail: {name}",
+                    lambda db=db, next_id=next_id: course_crud.get_detail(
+                        db, next_id()
+                    ),
+                    args.iterations,
+                )
+            )
+    report(results)
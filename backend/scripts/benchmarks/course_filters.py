@@ -0,0 +1,85 @@
+"""Latency of a /courses/all page with filters: SQL joins versus the catalog
+snapshot's bitmap index, on synthetic catalogs of each given size.
+
+DROPS AND RESEEDS every table in the configured database. Run against a scratch
+database and restore it with `scripts.initdb --drop-all` afterwards:
+    ENV=local uv run -m scripts.benchmarks.course_filters --drop-all --sizes 400 100000
+"""
+
+import logging
+import time
+from argparse import ArgumentParser
+
+from scripts.benchmarks.synthetic import seed_synthetic_catalog
+from scripts.benchmarks.utils import measure, report
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.core.log import setup_logger
+from techconnect_classes_api.crud.course import course_crud
+from techconnect_classes_api.database import get_db_engine, get_managed_db
+from techconnect_classes_api.schemas.course import CourseNodeQuery
+
+setup_logger()
+log = logging.getLogger(__name__)
+
+
+def filter_queries(series_names: list[str]) -> dict[str, CourseNodeQuery]:
+    return {
+        "level": CourseNodeQuery(level=["beginner"]),
+        "2 series": CourseNodeQuery(series=series_names[:2]),
+        "2 levels + format + 3 series": CourseNodeQuery(
+            level=["beginner", "intermediate"],
+            format=["class"],
+            series=series_names[:3],
+        ),
+    }
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[400, 100_000])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument(
+        "--drop-all",
+        help="Confirm that every table in the configured database may be dropped",
+        action="store_true",
+        required=True,
+    )
+    args = parser.parse_args()
+
+    settings.CATALOG_CACHE_MODE = False
+    results = []
+    for size in args.sizes:
+        seed_synthetic_catalog(get_db_engine(), size)
+
+        with get_managed_db() as db:
+            start = time.perf_counter()
+            snapshot = course_crud.build_catalog_snapshot(db)
+            log.info(
+                f"{size} courses: snapshot built in {time.perf_counter() - start:.2f}s"
+            )
+
+            for name, query in filter_queries(snapshot.series.series).items():
+                sql_page = course_crud.get_multiple_filtered(db, query)
+                bitmap_page = snapshot.filter_courses(query)
+                assert sql_page == bitmap_page, name
+                log.info(
+                    f"{size} courses, {name}: {len(bitmap_page.courses)} on first page"
+                )
+
+                results.append(
+                    measure(
+                        f"{size} sql: {name}",
+                        lambda query=query: course_crud.get_multiple_filtered(
+                            db, query
+                        ),
+                        args.iterations,
+                    )
+                )
+                results.append(
+                    measure(
+                        f"{size} bitmap: {name}",
+                        lambda query=query: snapshot.filter_courses(query),
+                        args.iterations,
+                    )
+                )
+    report(results)
@@ -0,0 +1,102 @@
+"""p50/p99 latency of a page of ranked full-text search results on /courses/all,
+with and without filters, against an ILIKE scan over names and descriptions.
+Logs each query plan's use of the GIN index on `courses.search_vector`.
+
+DROPS AND RESEEDS every table in the configured database unless --keep-data
+is given. Run against a scratch database:
+    ENV=local uv run -m scripts.benchmarks.course_search --drop-all --size 100000
+"""
+
+import logging
+from argparse import ArgumentParser
+
+from sqlalchemy import or_, select
+
+from scripts.benchmarks.synthetic import seed_synthetic_catalog
+from scripts.benchmarks.utils import measure, report
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.core.log import setup_logger
+from techconnect_classes_api.crud.course import course_crud
+from techconnect_classes_api.database import get_db_engine, get_managed_db
+from techconnect_classes_api.models import Course
+from techconnect_classes_api.schemas.course import CourseNodeQuery
+
+setup_logger()
+log = logging.getLogger(__name__)
+
+SEARCH_INDEX = "courses_search_vector_idx"
+
+QUERIES = {
+    "one word": CourseNodeQuery(search="robotics"),
+    "two words": CourseNodeQuery(search="robotics podcast"),
+    "phrase": CourseNodeQuery(search='"microsoft excel"'),
+    "word + level + format": CourseNodeQuery(
+        search="robotics", level=["beginner"], format=["lab"]
+    ),
+    "no match": CourseNodeQuery(search="quantum"),
+}
+
+
+def explain(db, query_params: CourseNodeQuery) -> str:
+    conn = db.connection()
+    compiled = course_crud._filtered_statement(query_params).compile(
+        dialect=conn.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    rows = conn.exec_driver_sql(f"EXPLAIN {compiled}", compiled.params)
+    return "\n".join(rows.scalars().all())
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=200)
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "--drop-all",
+        help="Confirm that every table in the configured database may be dropped",
+        action="store_true",
+    )
+    group.add_argument(
+        "--keep-data",
+        help="Benchmark the catalog already in the database",
+        action="store_true",
+    )
+    args = parser.parse_args()
+
+    settings.CATALOG_CACHE_MODE = False
+    if args.drop_all:
+        seed_synthetic_catalog(get_db_engine(), args.size)
+
+    results = []
+    with get_managed_db() as db:
+        for name, query in QUERIES.items():
+            plan = explain(db, query)
+            page = course_crud.get_multiple_filtered(db, query)
+            log.info(
+                f"{name}: {len(page.courses)} on first page, "
+                f"{'uses' if SEARCH_INDEX in plan else 'DOES NOT USE'} {SEARCH_INDEX}"
+            )
+            log.debug(plan)
+            results.append(
+                measure(
+                    f"search: {name}",
+                    lambda query=query: course_crud.get_multiple_filtered(db, query),
+                    args.iterations,
+                )
+            )
+
+        word = QUERIES["one word"].search
+        ilike = select(Course).where(
+            or_(
+                Course.course_name.ilike(f"%{word}%"),
+                Course.description.ilike(f"%{word}%"),
+            )
+        )
+        results.append(
+            measure(
+                "ilike scan: one word",
+                lambda: db.scalars(ilike).all(),
+                max(1, args.iterations // 10),
+            )
+        )
+    report(results)
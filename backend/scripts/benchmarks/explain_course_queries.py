@@ -0,0 +1,151 @@
+"""EXPLAIN every query `course_crud` issues against a synthetic large catalog and
+assert that none of them needs a sequential scan.
+
+Each CRUD method is called once with the catalog cache off, so it goes to the
+database, and every statement it executes is captured with its parameters and
+explained. Dimension tables are small enough that the planner rightly prefers
+scanning them, so plans are made with `enable_seqscan` off: a Seq Scan that is
+still chosen is one no index can replace. Scans without a filter read the
+whole table because the query wants every row, as the reference lists and the
+facet counts do; only filtering scans fail the check. The async methods build
+the same statements and are not run separately.
+
+DROPS AND RESEEDS every table in the configured database. Run against a scratch
+database and restore it with `scripts.initdb --drop-all` afterwards:
+    ENV=local uv run -m scripts.benchmarks.explain_course_queries --drop-all
+"""
+
+import logging
+from argparse import ArgumentParser
+from typing import Callable, Iterator
+
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from scripts.benchmarks.synthetic import seed_synthetic_catalog
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.core.log import setup_logger
+from techconnect_classes_api.crud.course import course_crud
+from techconnect_classes_api.database import get_db_engine, get_managed_db
+from techconnect_classes_api.models import Course, Prerequisite, Series
+from techconnect_classes_api.schemas.course import CourseNodeQuery
+
+setup_logger()
+log = logging.getLogger(__name__)
+
+
+def capture_statements(
+    engine: Engine, fn: Callable[[], object]
+) -> list[tuple[str, object]]:
+    """Statements and parameters `fn` executes on `engine`."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+def plan_nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def explain(engine: Engine, statement: str, parameters: object) -> list[dict]:
+    """Nodes of the plan of a statement, with sequential scans disabled."""
+    with engine.begin() as conn:
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        (plan,) = conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        ).scalar_one()
+    return list(plan_nodes(plan["Plan"]))
+
+
+def crud_calls(db: Session) -> dict[str, Callable[[], object]]:
+    """One call of every `course_crud` database path, keyed by name."""
+    course_ids = db.scalars(select(Course.id).order_by(Course.id).limit(50)).all()
+    course_id = db.scalar(select(func.min(Prerequisite.course_id)))
+    unlocked_id = db.scalar(select(func.max(Prerequisite.prereq_id)))
+    series = db.scalars(select(Series.series_name).order_by(Series.id).limit(2)).all()
+    filters = {"level": ["beginner"], "format": ["class", "lab"], "series": series}
+    next_cursor = course_crud.get_multiple_filtered(
+        db, CourseNodeQuery(limit=10)
+    ).next_cursor
+
+    return {
+        "list": lambda: course_crud.get_multiple_filtered(db, CourseNodeQuery()),
+        "list: next page": lambda: course_crud.get_multiple_filtered(
+            db, CourseNodeQuery(limit=10, cursor=next_cursor)
+        ),
+        "list: filtered": lambda: course_crud.get_multiple_filtered(
+            db, CourseNodeQuery(**filters)
+        ),
+        "list: search": lambda: course_crud.get_multiple_filtered(
+            db, CourseNodeQuery(search="python data", series=series)
+        ),
+        "facets": lambda: course_crud.get_facets(db, CourseNodeQuery(**filters)),
+        "detail": lambda: course_crud.get_detail(db, course_id),
+        "details many": lambda: course_crud.get_details_many(db, course_ids),
+        "export: first chunk": lambda: next(course_crud.export_details(db)),
+        "upcoming": lambda: course_crud.get_upcoming(db, course_id),
+        "handouts": lambda: course_crud.get_handouts(db, course_id),
+        "additional materials": lambda: course_crud.get_additional_materials(
+            db, course_id
+        ),
+        "ancestry": lambda: course_crud.get_ancestry(db, course_id),
+        "unlocks": lambda: course_crud.get_unlocks(db, unlocked_id),
+        "prerequisites": lambda: course_crud.get_prerequisites(db, course_id, True),
+        "learning path": lambda: course_crud.get_learning_path(db, course_id),
+        "formats": lambda: course_crud.get_all_formats(db),
+        "levels": lambda: course_crud.get_all_levels(db),
+        "series": lambda: course_crud.get_all_series(db),
+        "languages": lambda: course_crud.get_all_languages(db),
+        "catalog snapshot": lambda: course_crud.build_catalog_snapshot(db),
+    }
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument(
+        "--drop-all",
+        help="Confirm that every table in the configured database may be dropped",
+        action="store_true",
+        required=True,
+    )
+    args = parser.parse_args()
+
+    settings.CATALOG_CACHE_MODE = False
+    settings.COURSE_DETAIL_VIEW_ENABLED = False
+    engine = get_db_engine()
+    seed_synthetic_catalog(engine, args.size, prerequisite_layers=(10, 5))
+
+    seq_scans = []
+    with get_managed_db() as db:
+        for name, call in crud_calls(db).items():
+            statements = capture_statements(engine, call)
+            indexes = set()
+            for statement, parameters in statements:
+                nodes = explain(engine, statement, parameters)
+                indexes |= {n["Index Name"] for n in nodes if "Index Name" in n}
+                seq_scans += [
+                    (name, n["Relation Name"], n["Filter"])
+                    for n in nodes
+                    if n["Node Type"] == "Seq Scan" and "Filter" in n
+                ]
+            log.info(
+                f"{name}: {len(statements)} statements, "
+                f"indexes {', '.join(sorted(indexes))}"
+            )
+
+    for name, table, condition in seq_scans:
+        log.error(f"{name}: sequential scan on {table} filtering {condition}")
+    assert not seq_scans, f"{len(seq_scans)} sequential scans"
+    log.info("No sequential scans")
@@ -0,0 +1,115 @@
+"""Latency of a course's full prerequisite ancestry and of its unlocks: one
+recursive CTE (`course_crud.get_ancestry` / `get_unlocks`) against naive
+iterative lookups, one query per course or per level, on a layered prerequisite
+chain. The in-memory graph of the catalog snapshot is listed for reference.
+
+DROPS AND RESEEDS every table in the configured database. Run against a scratch
+database and restore it with `scripts.initdb --drop-all` afterwards:
+    ENV=local uv run -m scripts.benchmarks.prerequisite_queries --drop-all
+"""
+
+import logging
+from argparse import ArgumentParser
+
+from sqlalchemy import select
+
+from scripts.benchmarks.synthetic import seed_synthetic_catalog
+from scripts.benchmarks.utils import measure, report
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.core.log import setup_logger
+from techconnect_classes_api.crud.course import course_crud
+from techconnect_classes_api.database import get_db_engine, get_managed_db
+from techconnect_classes_api.models import Prerequisite
+
+setup_logger()
+log = logging.getLogger(__name__)
+
+
+def per_course_lookups(db, course_id: int, unlocks: bool) -> set[int]:
+    """Breadth-first search issuing one query per visited course."""
+    near, far = (Prerequisite.course_id, Prerequisite.prereq_id)
+    if unlocks:
+        near, far = far, near
+    seen: set[int] = set()
+    queue = [course_id]
+    while queue:
+        current = queue.pop()
+        for found in db.scalars(select(far).where(near == current)):
+            if found not in seen:
+                seen.add(found)
+                queue.append(found)
+    return seen
+
+
+def per_level_lookups(db, course_id: int, unlocks: bool) -> set[int]:
+    """Breadth-first search issuing one IN query per level."""
+    near, far = (Prerequisite.course_id, Prerequisite.prereq_id)
+    if unlocks:
+        near, far = far, near
+    seen: set[int] = set()
+    frontier = {course_id}
+    while frontier:
+        frontier = set(db.scalars(select(far).where(near.in_(frontier)))) - seen
+        seen |= frontier
+    return seen
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--depth", type=int, default=50)
+    parser.add_argument("--fan-out", type=int, default=5)
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument(
+        "--drop-all",
+        help="Confirm that every table in the configured database may be dropped",
+        action="store_true",
+        required=True,
+    )
+    args = parser.parse_args()
+
+    settings.CATALOG_CACHE_MODE = False
+    seed_synthetic_catalog(
+        get_db_engine(),
+        max(args.size, (args.depth + 1) * args.fan_out),
+        prerequisite_layers=(args.depth, args.fan_out),
+    )
+    top, bottom = 1, args.depth * args.fan_out + 1
+
+    results = []
+    with get_managed_db() as db:
+        graph = course_crud.build_catalog_snapshot(db).prerequisites
+        for name, course_id, unlocks, crud_method in [
+            ("ancestry", top, False, course_crud.get_ancestry),
+            ("unlocks", bottom, True, course_crud.get_unlocks),
+        ]:
+            expected = {c.id for c in crud_method(db, course_id)}
+            assert per_course_lookups(db, course_id, unlocks) == expected
+            assert per_level_lookups(db, course_id, unlocks) == expected
+            log.info(f"{name} of course {course_id}: {len(expected)} courses")
+
+            results += [
+                measure(
+                    f"{name}: recursive cte",
+                    lambda m=crud_method, c=course_id: m(db, c),
+                    args.iterations,
+                ),
+                measure(
+                    f"{name}: one query per course",
+                    lambda c=course_id, u=unlocks: per_course_lookups(db, c, u),
+                    max(1, args.iterations // 10),
+                ),
+                measure(
+                    f"{name}: one query per level",
+                    lambda c=course_id, u=unlocks: per_level_lookups(db, c, u),
+                    args.iterations,
+                ),
+            ]
+        results.append(
+            measure(
+                "ancestry: in-memory graph",
+                lambda: graph.prerequisites(top, transitive=True),
+                args.iterations,
+            )
+        )
+    report(results)
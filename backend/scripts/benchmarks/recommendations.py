@@ -0,0 +1,149 @@
+"""Latency of `RecommendationEngine`: building it for a synthetic catalog, and
+scoring every course for each of a population of synthetic users, against a
+per-course Python loop computing the same scores.
+
+Runs without a database:
+    uv run -m scripts.benchmarks.recommendations --courses 10000 --users 100000
+"""
+
+import logging
+import math
+import time
+from argparse import ArgumentParser
+
+import numpy as np
+
+from scripts.benchmarks.synthetic import synthetic_catalog_dfs
+from scripts.benchmarks.utils import measure, report
+from techconnect_classes_api.core.log import setup_logger
+from techconnect_classes_api.schemas.course import CourseNodeResponse
+from techconnect_classes_api.services import recommendation_service
+from techconnect_classes_api.services.recommendation_service import (
+    RecommendationEngine,
+)
+
+setup_logger()
+log = logging.getLogger(__name__)
+
+
+def build_engine(dfs) -> RecommendationEngine:
+    courses = dfs["courses"]
+    return RecommendationEngine.build(
+        [
+            CourseNodeResponse(id=i, course_name=n)
+            for i, n in zip(courses["id"].tolist(), courses["course_name"].tolist())
+        ],
+        courses["level_id"].tolist(),
+        courses["format_id"].tolist(),
+        dfs["course_series"][["course_id", "series_id"]].itertuples(index=False),
+        dfs["prerequisites"][["course_id", "prereq_id"]].itertuples(index=False),
+    )
+
+
+def synthetic_users(dfs, n_users: int, seed: int = 0) -> list[tuple[list, list]]:
+    """(taken course ids, interested series ids) per user: up to 20 courses and
+    5 series each."""
+    rng = np.random.default_rng(seed)
+    course_ids = dfs["courses"]["id"].to_numpy()
+    series_ids = dfs["series"]["id"].to_numpy()
+    return [
+        (
+            rng.choice(course_ids, rng.integers(0, 21), replace=False).tolist(),
+            rng.choice(series_ids, rng.integers(0, 6), replace=False).tolist(),
+        )
+        for _ in range(n_users)
+    ]
+
+
+def python_scorer(dfs):
+    """A function computing the engine's scores course by course, with the
+    catalog's features and prerequisites in dicts of sets."""
+    series = dfs["course_series"].groupby("course_id")["series_id"].apply(set)
+    prereqs = dfs["prerequisites"].groupby("course_id")["prereq_id"].apply(set)
+    features = {
+        course_id: {("s", s) for s in series.get(course_id, ())}
+        | {("l", level_id), ("f", format_id)}
+        for course_id, level_id, format_id in dfs["courses"][
+            ["id", "level_id", "format_id"]
+        ].itertuples(index=False)
+    }
+    prereqs = {course_id: prereqs.get(course_id, set()) for course_id in features}
+
+    def score(taken_ids, series_ids):
+        taken = set(taken_ids)
+        history = {}
+        for course_id in taken:
+            keys = features[course_id]
+            for key in keys:
+                history[key] = history.get(key, 0) + 1 / math.sqrt(len(keys))
+        history_norm = math.sqrt(sum(v * v for v in history.values())) or 1
+        interests = {("s", s) for s in series_ids}
+
+        scores = []
+        for course_id, keys in features.items():
+            required = prereqs[course_id]
+            if course_id in taken or not required <= taken:
+                scores.append(-math.inf)
+                continue
+            score = sum(history.get(k, 0) for k in keys) / history_norm
+            if interests:
+                score += len(keys & interests) / math.sqrt(len(interests))
+            score /= math.sqrt(len(keys))
+            if required & taken:
+                score += recommendation_service.NEXT_STEP_WEIGHT
+            scores.append(score)
+        return scores
+
+    return score
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--courses", type=int, default=10_000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--python-users", type=int, default=20)
+    args = parser.parse_args()
+
+    dfs = synthetic_catalog_dfs(args.courses)
+    start = time.perf_counter()
+    engine = build_engine(dfs)
+    log.info(
+        f"Engine for {args.courses} courses built in "
+        f"{time.perf_counter() - start:.2f}s: {engine.features.shape[1]} features, "
+        f"{len(engine.edge_courses)} prerequisite edges, "
+        f"{engine.features.nbytes / 2**20:.1f} MiB"
+    )
+    users = synthetic_users(dfs, args.users)
+
+    python_scores = python_scorer(dfs)
+    for taken, series in users[:10]:
+        np.testing.assert_allclose(
+            engine.score(taken, series), python_scores(taken, series), rtol=1e-5
+        )
+
+    results = []
+    for name, fn in [
+        ("score", engine.score),
+        (
+            f"recommend top {args.limit}",
+            lambda taken, series: engine.recommend(taken, series, args.limit),
+        ),
+    ]:
+        queue = iter(users)
+        results.append(
+            measure(
+                f"{name}: {args.users} users",
+                lambda fn=fn, queue=queue: fn(*next(queue)),
+                args.users,
+            )
+        )
+    queue = iter(users)
+    results.append(
+        measure(
+            f"python loop: {args.python_users} users",
+            lambda queue=queue: python_scores(*next(queue)),
+            args.python_users,
+        )
+    )
+    report(results)
@@ -0,0 +1,92 @@
+"""Serialization cost of course detail responses: FastAPI's default path (dump,
+validation against the route's return annotation, dump again, stdlib
+`json.dumps`) against the pre-serialized fast path of `json_response`.
+
+Reads the course with the most handouts and materials, and a batch of 100
+courses, from the configured database; nothing is written:
+    ENV=local uv run -m scripts.benchmarks.serialization
+"""
+
+import logging
+from argparse import ArgumentParser
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from sqlalchemy import func, select
+
+from scripts.benchmarks.utils import measure, report
+from techconnect_classes_api.api.responses import json_response
+from techconnect_classes_api.api.routes.courses import router
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.core.log import setup_logger
+from techconnect_classes_api.crud.course import course_crud
+from techconnect_classes_api.database import get_managed_db
+from techconnect_classes_api.models import AdditionalMaterial, Handout
+
+setup_logger()
+log = logging.getLogger(__name__)
+
+
+def richest_course_id(db) -> int:
+    urls = (
+        select(Handout.course_id.label("course_id"))
+        .union_all(select(AdditionalMaterial.course_id))
+        .subquery()
+    )
+    return db.scalars(
+        select(urls.c.course_id)
+        .group_by(urls.c.course_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    ).one()
+
+
+def fastapi_default(route: APIRoute, content) -> bytes:
+    # serialize_response only awaits for sync routes; drive it without a loop
+    # so event loop overhead stays out of the measurement.
+    coroutine = serialize_response(field=route.response_field, response_content=content)
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return JSONResponse(done.value).body
+    raise RuntimeError("serialize_response suspended")
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=10_000)
+    args = parser.parse_args()
+
+    routes = {r.path: r for r in router.routes}
+    with get_managed_db() as db:
+        course_id = richest_course_id(db)
+        detail = course_crud.get_detail(db, course_id)
+        batch = course_crud.get_details_many(db, list(range(1, 101)))
+    log.info(
+        f"Course {course_id}: {len(detail.available_handouts)} handouts, "
+        f"{len(detail.additional_materials)} additional materials"
+    )
+
+    settings.FAST_JSON_RESPONSES = True
+    results = []
+    for name, path, content, iterations in [
+        ("detail", "/courses/{course_id}", detail, args.iterations),
+        ("batch of 100", "/courses/batch", batch, args.iterations // 20),
+    ]:
+        route = routes[path]
+        assert fastapi_default(route, content) == json_response(content).body
+        results.append(
+            measure(
+                f"{name}: fastapi default",
+                lambda route=route, content=content: fastapi_default(route, content),
+                iterations,
+            )
+        )
+        results.append(
+            measure(
+                f"{name}: json_response",
+                lambda content=content: json_response(content).body,
+                iterations,
+            )
+        )
+    report(results)
@@ -0,0 +1,185 @@
+"""Synthetic course catalogs of arbitrary size for benchmarks.
+
+`seed_synthetic_catalog` DROPS AND RECREATES every table in the given database
+before seeding. Point it at a scratch database and run
+`scripts.initdb --drop-all` afterwards to restore the real catalog.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from scripts.core.seeding import seed_table_one
+from techconnect_classes_api.database.db import Base
+from techconnect_classes_api.models.course_detail import course_details
+
+log = logging.getLogger(__name__)
+
+LEVELS = ["beginner", "intermediate", "advanced"]
+FORMATS = ["class", "lab", "workshop", "self-paced"]
+LANGUAGES = {"en": "English", "es": "Spanish", "zh": "Chinese", "fr": "French"}
+WORDS = [
+    "python", "excel", "data", "analysis", "web", "design", "security", "privacy",
+    "email", "smartphone", "internet", "coding", "spreadsheet", "formulas",
+    "functions", "charts", "photo", "editing", "video", "social", "media", "resume",
+    "job", "search", "cloud", "storage", "google", "microsoft", "word", "slides",
+    "javascript", "html", "css", "database", "sql", "typing", "computer", "basics",
+    "tablet", "accessibility", "scratch", "robotics", "printing", "podcast", "audio",
+    "budget", "finance", "networking", "linux", "windows", "mac", "ai", "chatbots",
+]  # fmt: skip
+
+
+def layered_prerequisites(depth: int, fan_out: int) -> pd.DataFrame:
+    """Prerequisite chain `depth` levels deep: courses 1..fan_out form level 0, the
+    next `fan_out` ids level 1, and so on; every course requires every course of
+    the next level. A level-0 course has `depth * fan_out` ancestors reached by
+    `fan_out ** depth` distinct paths."""
+    levels = np.arange(depth * fan_out) // fan_out
+    course_ids = np.arange(1, depth * fan_out + 1)
+    return pd.DataFrame(
+        {
+            "course_id": np.repeat(course_ids, fan_out),
+            "prereq_id": (np.repeat(levels + 1, fan_out) * fan_out)
+            + np.tile(np.arange(1, fan_out + 1), len(course_ids)),
+        }
+    )
+
+
+def synthetic_catalog_dfs(
+    n_courses: int,
+    n_series: int = 200,
+    max_series_per_course: int = 3,
+    max_prereqs_per_course: int = 2,
+    n_filler_terms: int = 2000,
+    prerequisite_layers: tuple[int, int] | None = None,
+    seed: int = 0,
+) -> dict[str, pd.DataFrame]:
+    """DataFrames for every catalog table, keyed by table name in seeding order.
+
+    `prerequisite_layers=(depth, fan_out)` replaces the random prerequisites
+    with `layered_prerequisites(depth, fan_out)`.
+    """
+    rng = np.random.default_rng(seed)
+    words = np.array(WORDS)
+    # Filler terms keep each real word in a small share of descriptions
+    vocabulary = np.concatenate([words, [f"term{i}" for i in range(n_filler_terms)]])
+
+    series = pd.DataFrame(
+        {
+            "id": np.arange(1, n_series + 1),
+            "series_name": [
+                f"{' '.join(rng.choice(words, 2))} {i}" for i in range(n_series)
+            ],
+        }
+    )
+
+    course_ids = np.arange(1, n_courses + 1)
+    courses = pd.DataFrame(
+        {
+            "id": course_ids,
+            "course_name": [
+                f"{' '.join(rng.choice(words, 3)).title()} {i}" for i in course_ids
+            ],
+            "description": [
+                " ".join(rng.choice(vocabulary, rng.integers(20, 40)))
+                for _ in range(n_courses)
+            ],
+            "level_id": rng.integers(1, len(LEVELS) + 1, n_courses),
+            "format_id": rng.integers(1, len(FORMATS) + 1, n_courses),
+        }
+    )
+
+    # Skewed series sizes, like the real catalog: a few big topics, many small ones
+    series_weights = 1 / np.arange(1, n_series + 1)
+    series_weights /= series_weights.sum()
+    series_counts = rng.integers(0, max_series_per_course + 1, n_courses)
+    course_series = pd.DataFrame(
+        {
+            "course_id": np.repeat(course_ids, series_counts),
+            "series_id": rng.choice(
+                series["id"], series_counts.sum(), p=series_weights
+            ),
+        }
+    ).drop_duplicates()
+
+    # Prerequisites always point at a lower id, so the graph stays acyclic
+    prereq_counts = rng.integers(0, max_prereqs_per_course + 1, n_courses)
+    prereq_counts[0] = 0
+    prereq_course_ids = np.repeat(course_ids, prereq_counts)
+    prerequisites = pd.DataFrame(
+        {
+            "course_id": prereq_course_ids,
+            "prereq_id": (rng.random(len(prereq_course_ids)) * (prereq_course_ids - 1))
+            .astype(int)
+            .clip(min=0)
+            + 1,
+        }
+    ).drop_duplicates()
+    if prerequisite_layers:
+        prerequisites = layered_prerequisites(*prerequisite_layers)
+
+    handouts = pd.DataFrame(
+        {
+            "course_id": course_ids,
+            "language_code": "en",
+            "url": [f"https://example.com/handouts/{i}.pdf" for i in course_ids],
+        }
+    )
+    additional_materials = pd.DataFrame(
+        {
+            "course_id": course_ids[::2],
+            "url": [f"https://example.com/materials/{i}" for i in course_ids[::2]],
+        }
+    )
+
+    return {
+        "levels": pd.DataFrame({"id": range(1, len(LEVELS) + 1), "level_name": LEVELS}),
+        "formats": pd.DataFrame(
+            {"id": range(1, len(FORMATS) + 1), "format_name": FORMATS}
+        ),
+        "series": series,
+        "languages": pd.DataFrame(
+            {
+                "language_code": list(LANGUAGES),
+                "language_name": list(LANGUAGES.values()),
+            }
+        ),
+        "courses": courses,
+        "prerequisites": prerequisites,
+        "handouts": handouts,
+        "additional_materials": additional_materials,
+        "course_series": course_series,
+        "catalog_versions": pd.DataFrame(
+            {"version": [f"synthetic-{n_courses}-{n_series}-{seed}"]}
+        ),
+    }
+
+
+def seed_synthetic_catalog(engine: Engine, n_courses: int, **kwargs) -> None:
+    """Drop all tables, recreate them and seed a synthetic catalog."""
+    log.info(f"Seeding synthetic catalog with {n_courses} courses")
+    # The view depends on the catalog tables
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"DROP MATERIALIZED VIEW IF EXISTS {course_details.name}")
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    for table_name, df in synthetic_catalog_dfs(n_courses, **kwargs).items():
+        seed_table_one(
+            df, table_name, connection=engine, method="multi", chunksize=1000
+        )
+
+    # Ids were inserted explicitly; move the sequences past them
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if "id" in table.c and table.c.id.autoincrement in (True, "auto"):
+                conn.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                        f"coalesce(max(id), 0) + 1, false) FROM {table.name}"
+                    )
+                )
+        conn.exec_driver_sql("ANALYZE")
@@ -0,0 +1,53 @@
+import logging
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    iterations: int
+    total_seconds: float
+    latencies_ms: list[float]
+
+    @property
+    def per_second(self) -> float:
+        return self.iterations / self.total_seconds if self.total_seconds else 0.0
+
+    @property
+    def p50_ms(self) -> float:
+        return statistics.median(self.latencies_ms)
+
+    @property
+    def p99_ms(self) -> float:
+        return percentile(self.latencies_ms, 99)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(name: str, fn: Callable[[], object], iterations: int) -> BenchmarkResult:
+    """Call `fn` `iterations` times and record the latency of each call."""
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - call_start) * 1000)
+    total = time.perf_counter() - start
+    return BenchmarkResult(name, iterations, total, latencies)
+
+
+def report(results: list[BenchmarkResult]) -> None:
+    log.info(f"{'benchmark':<45} {'ops/s':>10} {'p50 ms':>10} {'p99 ms':>10}")
+    for r in results:
+        log.info(
+            f"{r.name:<45} {r.per_second:>10.1f} {r.p50_ms:>10.3f} {r.p99_ms:>10.3f}"
+        )
@@ -1,9 +1,65 @@
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateColumn, CreateIndex
+
 from techconnect_classes_api.core.config import settings
 from techconnect_classes_api.database import get_engine, get_sqlalchemy_db_url
 from techconnect_classes_api.database.db import Base
+from techconnect_classes_api.models import Course
+from techconnect_classes_api.models.course_detail import (
+    COURSE_DETAILS_QUERY,
+    course_details,
+)
+
+
+def upgrade_courses_table(engine: Engine) -> None:
+    """Add the full-text search column and the indexes of `courses` to an existing
+    table. `create_all` skips tables that already exist."""
+    table = Course.__table__
+    column_ddl = CreateColumn(table.c.search_vector).compile(dialect=engine.dialect)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            f"ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {column_ddl}"
+        )
+        for index in table.indexes:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def create_indexes(engine: Engine) -> None:
+    """Create the indexes declared in the models that an existing database lacks.
+    `create_all` only creates the indexes of the tables it creates."""
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def create_course_details_view(engine: Engine) -> None:
+    """Create the `course_details` materialized view and the unique index that
+    lets it be refreshed concurrently, if they don't exist yet."""
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            f"CREATE MATERIALIZED VIEW IF NOT EXISTS {course_details.name} AS "
+            f"{COURSE_DETAILS_QUERY}"
+        )
+        conn.exec_driver_sql(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {course_details.name}_id_idx "
+            f"ON {course_details.name} (id)"
+        )
+
+
+def refresh_course_details_view(engine: Engine) -> None:
+    """Rebuild the detail documents after the catalog tables changed. Readers
+    keep seeing the previous rows until the refresh commits."""
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            f"REFRESH MATERIALIZED VIEW CONCURRENTLY {course_details.name}"
+        )
 
 
 def create_tables() -> None:
     database_url = get_sqlalchemy_db_url(settings)
     engine = get_engine(database_url)
     Base.metadata.create_all(bind=engine)
+    upgrade_courses_table(engine)
+    create_indexes(engine)
+    create_course_details_view(engine)
@@ -1,9 +1,13 @@
 from techconnect_classes_api.core.config import settings
 from techconnect_classes_api.database import get_engine, get_sqlalchemy_db_url
 from techconnect_classes_api.database.db import Base
+from techconnect_classes_api.models.course_detail import course_details
 
 
 def drop_tables() -> None:
     database_url = get_sqlalchemy_db_url(settings)
     engine = get_engine(database_url)
+    # The view depends on the catalog tables
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"DROP MATERIALIZED VIEW IF EXISTS {course_details.name}")
     Base.metadata.drop_all(bind=engine)
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 from pathlib import Path
 from typing import Literal
@@ -6,6 +7,7 @@ import pandas as pd
 from sqlalchemy import select
 from sqlalchemy.engine import Engine
 
+from scripts.core.create_tables import refresh_course_details_view
 from scripts.core.data_transformations import (
     create_additional_materials_df,
     create_course_series_df,
@@ -36,6 +38,9 @@ from techconnect_classes_api.models import (
     Prerequisite,
     Series,
 )
+from techconnect_classes_api.schemas.course import CourseNodeResponse
+from techconnect_classes_api.services.catalog_bundle import write_catalog_bundle
+from techconnect_classes_api.services.prerequisite_graph import PrerequisiteGraph
 
 log = logging.getLogger(__name__)
 
@@ -53,6 +58,55 @@ def validate_inserted_row_nums(table_model: ModelType, df: pd.DataFrame) -> bool
     return True
 
 
+def validate_prerequisite_graph(prerequisites_df: pd.DataFrame) -> None:
+    """Raise PrerequisiteCycleError before a prerequisite cycle is seeded."""
+    with get_managed_db() as session:
+        courses = [
+            CourseNodeResponse(id=course_id, course_name=course_name)
+            for course_id, course_name in session.execute(
+                select(Course.id, Course.course_name)
+            )
+        ]
+    PrerequisiteGraph.build(
+        courses,
+        prerequisites_df[["course_id", "prereq_id"]].itertuples(index=False),
+    )
+    log.info("Prerequisite graph validated")
+
+
+def read_seeded_tables(connection: Engine) -> dict[str, pd.DataFrame]:
+    """Seeded tables by name, with the ids the database assigned; the seed
+    DataFrames don't have them. Computed columns are left out."""
+    tables = {}
+    for table_model in (
+        Level,
+        Format,
+        Series,
+        Language,
+        Course,
+        Prerequisite,
+        Handout,
+        AdditionalMaterial,
+        CourseSeries,
+    ):
+        table = table_model.__table__
+        columns = [c for c in table.columns if c.computed is None]
+        tables[table.name] = pd.read_sql(
+            select(*columns).order_by(*table.primary_key.columns), connection
+        )
+    return tables
+
+
+def hash_catalog(tables: dict[str, pd.DataFrame]) -> str:
+    """Catalog version: a SHA-256 of the seeded rows, ids included, so any
+    change to the data or to how it is transformed gives a new version."""
+    digest = hashlib.sha256()
+    for name, df in tables.items():
+        digest.update(f"{name}\n".encode())
+        digest.update(df.to_csv(index=False).encode())
+    return digest.hexdigest()
+
+
 def seed_table_one(
     df_to_seed: pd.DataFrame,
     table_name: str,
@@ -91,6 +145,7 @@ def seed_database(env: str, resource_file_path: Path) -> None:
     seed_table_one(courses_df, "courses", connection=engine, method="multi")
 
     prerequisites_df = create_prerequisites_df(course_info)
+    validate_prerequisite_graph(prerequisites_df)
     seed_table_one(prerequisites_df, "prerequisites", connection=engine, method="multi")
 
     handouts_df = create_handouts_df(course_info)
@@ -117,3 +172,19 @@ def seed_database(env: str, resource_file_path: Path) -> None:
     validate_inserted_row_nums(Handout, handouts_df)
     validate_inserted_row_nums(AdditionalMaterial, additional_materials_df)
     validate_inserted_row_nums(CourseSeries, course_series_df)
+
+    refresh_course_details_view(engine)
+    log.info("'course_details' refreshed")
+
+    # Identifies the catalog for HTTP caching; reseeding the same rows keeps it
+    seeded_tables = read_seeded_tables(engine)
+    catalog_version = hash_catalog(seeded_tables)
+    seed_table_one(
+        pd.DataFrame({"version": [catalog_version]}),
+        "catalog_versions",
+        connection=engine,
+    )
+    log.info(f"Catalog version: {catalog_version}")
+
+    # Columnar snapshot of the same tables for analytics consumers
+    write_catalog_bundle(settings.CATALOG_BUNDLE_DIR, catalog_version, seeded_tables)
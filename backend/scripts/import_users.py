@@ -0,0 +1,28 @@
+"""Import users from a CSV file with `username` and `hashed_password` columns,
+whose passwords are already bcrypt hashes. Existing usernames are skipped:
+    ENV=local uv run -m scripts.import_users branch_users.csv
+"""
+
+import csv
+import logging
+from argparse import ArgumentParser
+
+from techconnect_classes_api.core.log import setup_logger
+from techconnect_classes_api.crud.user import user_crud
+from techconnect_classes_api.database import get_managed_db
+
+setup_logger()
+log = logging.getLogger(__name__)
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("path", help="CSV file of usernames and bcrypt hashes")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with open(args.path, newline="") as file, get_managed_db() as db:
+        users = (
+            (row["username"], row["hashed_password"]) for row in csv.DictReader(file)
+        )
+        created = user_crud.bulk_import(db, users, batch_size=args.batch_size)
+    log.info(f"{created} users created from {args.path}")
@@ -1,11 +1,16 @@
-from techconnect_classes_api.api.routes.courses import router as course_router
+from techconnect_classes_api.core.config import settings
 from techconnect_classes_api.api.routes.users import router as user_router
 from techconnect_classes_api.api.routes.auth import router as auth_router
-# from techconnect_classes_api.api.routes.recommendations import router as recommendation_router
+from techconnect_classes_api.api.routes.recommendations import router as recommendation_router
+
+if settings.ASYNC_COURSE_ROUTES:
+    from techconnect_classes_api.api.routes.courses_async import router as course_router
+else:
+    from techconnect_classes_api.api.routes.courses import router as course_router
 
 __all__ = [
     "course_router",
     "user_router",
     "auth_router",
-    # "recommendation_router"
+    "recommendation_router",
 ]
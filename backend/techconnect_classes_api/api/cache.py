@@ -0,0 +1,94 @@
+from typing import Callable, Iterable
+
+from fastapi import Request, Response, status
+from fastapi.routing import APIRoute
+
+from techconnect_classes_api.api.dependencies import etag_matches
+from techconnect_classes_api.api.limiter import limiter
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.services.catalog import (
+    catalog_version_tracker,
+    served_catalog_version,
+)
+from techconnect_classes_api.services.response_cache import (
+    canonical_query,
+    response_cache,
+)
+
+CACHE_POLICY_ATTR = "__response_cache_policy__"
+
+
+def cache_response(ttl_setting: str, unordered: Iterable[str] = ()) -> Callable:
+    """Mark a route of a `CachedRoute` router as cacheable. `ttl_setting` names
+    the Settings field holding the TTL in seconds; `unordered` lists query
+    parameters whose repeated values may come in any order."""
+
+    def decorator(func: Callable) -> Callable:
+        setattr(func, CACHE_POLICY_ATTR, (ttl_setting, tuple(unordered)))
+        return func
+
+    return decorator
+
+
+class CachedRoute(APIRoute):
+    """Route class serving `cache_response` routes from `response_cache`.
+
+    The lookup happens before dependencies and parameters are resolved, so a hit
+    opens no database session and builds no models: the stored bytes are sent
+    back with the headers of the original response. Only 200 responses are
+    stored. The route's `@limiter.limit` is checked before the lookup, so hits
+    count against it like any other request.
+
+    Keys include the version of the served catalog, so a reseed is never
+    answered from responses of the previous catalog. When the version is due
+    for a refresh the lookup is skipped and the route's dependencies re-read
+    it; the response is stored under the version it was built from.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        policy = getattr(self.endpoint, CACHE_POLICY_ATTR, None)
+        if policy is None:
+            return handler
+        ttl_setting, unordered = policy
+
+        async def cached_route_handler(request: Request) -> Response:
+            if not settings.RESPONSE_CACHE_ENABLED:
+                return await handler(request)
+
+            # The check slowapi's wrapper would run; marked done so that a miss
+            # reaching the wrapper is not counted twice
+            limiter._check_request_limit(request, self.endpoint, False)
+            request.state._rate_limiting_complete = True
+
+            key = f"{request.url.path}?{canonical_query(request.url.query, unordered)}"
+            entry = None
+            if not catalog_version_tracker.is_stale():
+                entry = response_cache.get(f"{key}#{served_catalog_version()}")
+            if entry:
+                etag = entry.headers.get("etag")
+                if etag and etag_matches(request.headers.get("if-none-match"), etag):
+                    return Response(
+                        status_code=status.HTTP_304_NOT_MODIFIED,
+                        headers={
+                            k: v
+                            for k, v in entry.headers.items()
+                            if k in ("etag", "cache-control")
+                        },
+                    )
+                return Response(content=entry.body, headers=entry.headers)
+
+            response = await handler(request)
+            if response.status_code == status.HTTP_200_OK and hasattr(response, "body"):
+                headers = {
+                    k: v for k, v in response.headers.items() if k != "content-length"
+                }
+                response_cache.set(
+                    f"{key}#{served_catalog_version()}",
+                    response.body,
+                    headers,
+                    getattr(settings, ttl_setting),
+                )
+            return response
+
+        return cached_route_handler
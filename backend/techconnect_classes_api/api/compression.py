@@ -0,0 +1,202 @@
+import gzip
+import hashlib
+import math
+import zlib
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.services.response_cache import ResponseCache
+
+# Cached variants are compressed once, so they get the best ratio
+VARIANT_LEVELS = {"br": 11, "gzip": 9}
+STREAMING_LEVELS = {"br": 5, "gzip": 6}
+# Compressing these would delay events until the compressor flushes
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
+
+def supported_encodings() -> list[str]:
+    """Content codings this server can produce, most preferred first."""
+    return ["br", "gzip"]
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Best supported coding acceptable to the client, or None for identity.
+
+    Honours q-values and `*`; on equal q the server's preference wins.
+    """
+    if not accept_encoding:
+        return None
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        qualities[coding.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for coding in supported_encodings():
+        q = qualities.get(coding, qualities.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class StreamCompressor:
+    """Incremental gzip or brotli compressor for streamed responses."""
+
+    def __init__(self, encoding: str) -> None:
+        self.encoding = encoding
+        level = STREAMING_LEVELS[encoding]
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=level)
+        else:
+            self._zlib = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes, final: bool) -> bytes:
+        if self.encoding == "br":
+            data = self._brotli.process(chunk)
+            return data + (self._brotli.finish() if final else self._brotli.flush())
+        data = self._zlib.compress(chunk)
+        return data + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionResponder:
+    """Sends one response with the negotiated coding, or as is when `encoding`
+    is None.
+
+    Responses that are already encoded, event streams, and files served with
+    byte ranges (ranges refer to the identity body) pass through untouched, as
+    do bodies sent in one message below `minimum_size`. Every other response
+    varies by Accept-Encoding.
+
+    A response sent in one message that carries an ETag is a cacheable catalog
+    payload: its compressed variant is looked up by a hash of the body and only
+    compressed on the first request for that body, so each catalog version is
+    compressed once per coding. Streamed responses are compressed as they go.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        encoding: str | None,
+        variants: ResponseCache,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoding = encoding
+        self.variants = variants
+        self.send: Send | None = None
+        self.initial_message: Message | None = None
+        self.passthrough = False
+        self.started = False
+        self.stream: StreamCompressor | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body shows how to set the headers
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or "accept-ranges" in headers
+                or headers.get("content-type", "").startswith(EXCLUDED_CONTENT_TYPES)
+            )
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.started:
+            if self.stream is not None:
+                body = self.stream.compress(body, final=not more_body)
+        elif len(body) < self.minimum_size and not more_body:
+            pass
+        else:
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if self.encoding is not None:
+                body = self.compress_first(headers, body, more_body)
+        await self.start()
+        await self.send({**message, "body": body})
+
+    async def start(self) -> None:
+        if not self.started:
+            self.started = True
+            await self.send(self.initial_message)
+
+    def compress_first(
+        self, headers: MutableHeaders, body: bytes, more_body: bool
+    ) -> bytes:
+        """Compress the first body message and set the headers to match."""
+        has_etag = "etag" in headers
+        # Each coding is a different representation; keep matching ETags weakly
+        if has_etag and not headers["etag"].startswith("W/"):
+            headers["etag"] = f"W/{headers['etag']}"
+        headers["Content-Encoding"] = self.encoding
+        if more_body:
+            del headers["Content-Length"]
+            self.stream = StreamCompressor(self.encoding)
+            return self.stream.compress(body, final=False)
+
+        if has_etag:
+            body = self.cached_variant(body)
+        else:
+            body = compress(body, self.encoding, STREAMING_LEVELS[self.encoding])
+        headers["Content-Length"] = str(len(body))
+        return body
+
+    def cached_variant(self, body: bytes) -> bytes:
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        key = f"{self.encoding}:{digest}"
+        if variant := self.variants.get(key):
+            return variant.body
+        compressed = compress(body, self.encoding, VARIANT_LEVELS[self.encoding])
+        # Keyed by content, so a variant never goes stale; LRU bounds the memory
+        self.variants.set(key, compressed, {}, ttl_seconds=math.inf)
+        return compressed
+
+
+class CompressionMiddleware:
+    """Negotiated gzip/brotli compression of responses of at least
+    COMPRESSION_MIN_SIZE bytes, enabled by COMPRESSION_ENABLED."""
+
+    def __init__(self, app: ASGIApp, variants: ResponseCache) -> None:
+        self.app = app
+        self.variants = variants
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(
+            self.app,
+            settings.COMPRESSION_MIN_SIZE,
+            negotiate_encoding(Headers(scope=scope).get("accept-encoding")),
+            self.variants,
+        )
+        await responder(scope, receive, send)
+
+
+compressed_variants = ResponseCache(settings.COMPRESSION_VARIANTS_MAX_BYTES)
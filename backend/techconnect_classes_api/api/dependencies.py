@@ -1,26 +1,33 @@
-from typing import Annotated
+import time
+from typing import Annotated, Callable
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import ExpiredSignatureError, PyJWTError
-from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from techconnect_classes_api.core.config import settings
 from techconnect_classes_api.core.exceptions import credentials_exception
-from techconnect_classes_api.database import get_db
+from techconnect_classes_api.crud.course import course_crud
+from techconnect_classes_api.crud.user import user_crud
+from techconnect_classes_api.database import get_async_db, get_db
 from techconnect_classes_api.models import User
 from techconnect_classes_api.schemas.auth import TokenPayload
-from techconnect_classes_api.crud.user import user_crud
+from techconnect_classes_api.schemas.user import CurrentUser
+from techconnect_classes_api.services.auth_cache import token_cache, user_cache
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
 def get_token(token: Annotated[str, Depends(oauth2_scheme)]) -> TokenPayload:
+    """Retrive jwt token from payload. Verified payloads are cached by token
+    signature until the token expires, so repeated requests skip the HMAC."""
+    signature = token.rpartition(".")[2]
+    if cached := token_cache.get(signature):
+        return cached
     try:
-        """Retrive jwt token from payload"""
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
@@ -31,26 +38,105 @@ def get_token(token: Annotated[str, Depends(oauth2_scheme)]) -> TokenPayload:
         raise credentials_exception(detail="Token has expired")
     except PyJWTError:
         raise credentials_exception()
-    return TokenPayload(sub=sub)
+    token_payload = TokenPayload(sub=sub)
+    expires_in = payload["exp"] - time.time() if "exp" in payload else None
+    token_cache.set(signature, token_payload, ttl_seconds=expires_in)
+    return token_payload
 
 
 def get_current_user(
     db: Annotated[Session, Depends(get_db)],
     token: Annotated[TokenPayload, Depends(get_token)],
-) -> User:
+) -> CurrentUser:
+    """Identity of the token's user, from the user cache when possible."""
     try:
         user_id = int(token.sub)
     except (ValueError, TypeError):
         raise credentials_exception(detail="Invalid token")
+    if cached := user_cache.get(user_id):
+        return cached
     user = user_crud.get(db, User.id == user_id)
     if user is None:
         raise credentials_exception()
-    return user
+    current_user = CurrentUser.model_validate(user)
+    user_cache.set(user_id, current_user)
+    return current_user
 
 
-def get_current_active_user(current_user: Annotated[User, Depends(get_current_user)]):
+def get_current_active_user(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+) -> CurrentUser:
     if not current_user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
         )
     return current_user
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match check; uses weak comparison as RFC 9110 requires."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def set_catalog_cache_headers(
+    request: Request, response: Response, cache_control: str, version: str | None
+) -> None:
+    """Set ETag and Cache-Control, or raise a 304 if the client's copy is current.
+    `version` is the version of the catalog the response is built from."""
+    headers = {"Cache-Control": cache_control}
+    if version:
+        headers["ETag"] = f'"{version}"'
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+    response.headers.update(headers)
+
+
+def catalog_version(db: Annotated[Session, Depends(get_db)]) -> str | None:
+    """Router dependency of the course routes: the version of the catalog they
+    serve, reloading the catalog snapshot when a reseed left it behind."""
+    return course_crud.refresh_catalog_version(db)
+
+
+async def catalog_version_async(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> str | None:
+    """`catalog_version` for the async course router."""
+    return await course_crud.refresh_catalog_version_async(db)
+
+
+def catalog_conditional(cache_control_setting: str) -> Callable:
+    """Route dependency for responses that only change when the catalog is
+    reseeded. A matching If-None-Match ends the request with a 304 before the
+    route runs. `cache_control_setting` names the Settings field to send as
+    Cache-Control."""
+
+    def dependency(
+        request: Request,
+        response: Response,
+        version: Annotated[str | None, Depends(catalog_version)],
+    ) -> None:
+        set_catalog_cache_headers(
+            request, response, getattr(settings, cache_control_setting), version
+        )
+
+    return dependency
+
+
+def catalog_conditional_async(cache_control_setting: str) -> Callable:
+    """`catalog_conditional` for the async course router."""
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        version: Annotated[str | None, Depends(catalog_version_async)],
+    ) -> None:
+        set_catalog_cache_headers(
+            request, response, getattr(settings, cache_control_setting), version
+        )
+
+    return dependency
@@ -0,0 +1,133 @@
+from contextlib import contextmanager
+from typing import AsyncIterable, Iterable, Iterator, TypeVar
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
+from pydantic import BaseModel, HttpUrl
+
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.schemas.course import (
+    CatalogBundleResponse,
+    CatalogBundleTableResponse,
+)
+from techconnect_classes_api.services.catalog import catalog_version_tracker
+from techconnect_classes_api.services.catalog_bundle import bundle_file, read_manifest
+from techconnect_classes_api.services.pagination import InvalidCursorError
+from techconnect_classes_api.services.prerequisite_graph import PrerequisiteCycleError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def json_response(
+    model: ModelT | None, response: Response | None = None
+) -> ModelT | Response | None:
+    """Return a response model, pre-serialized when FAST_JSON_RESPONSES is set.
+
+    Course responses are built from rows already validated by the CRUD layer.
+    FastAPI would dump them to a dict, validate that again against the route's
+    return annotation, including every `HttpUrl`, dump the result once more and
+    encode it with the stdlib encoder. The fast path encodes the model straight
+    to JSON bytes with its pydantic-core serializer instead; FastAPI sends a
+    returned `Response` untouched, so headers set by dependencies on the injected `response` are
+    copied over. The OpenAPI schema still comes from the return annotation.
+    """
+    if model is None or not settings.FAST_JSON_RESPONSES:
+        return model
+    return Response(
+        content=model.__pydantic_serializer__.to_json(model),
+        headers=response.headers if response is not None else None,
+        media_type="application/json",
+    )
+
+
+# The helpers below assemble the responses of the course routes, so the sync and
+# async routers only differ in how they call the CRUD layer.
+
+
+@contextmanager
+def invalid_cursor_as_400() -> Iterator[None]:
+    """Turn an `InvalidCursorError` raised while paging into a 400."""
+    try:
+        yield
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@contextmanager
+def prerequisite_cycle_as_409() -> Iterator[None]:
+    """Turn a `PrerequisiteCycleError` met while walking prerequisites into a
+    409: the stored catalog, not the request, is at fault."""
+    try:
+        yield
+    except PrerequisiteCycleError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+def course_found(model: ModelT | None, response: Response) -> ModelT | Response | None:
+    """`json_response` of a course sub-resource, or a 404 for unknown courses."""
+    if model is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Course not found."
+        )
+    return json_response(model, response)
+
+
+def upcoming_redirect(url: HttpUrl | None) -> RedirectResponse:
+    if not url:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upcoming session link not found for this course.",
+        )
+    return RedirectResponse(url=str(url))
+
+
+def ndjson_response(
+    lines: Iterable[bytes] | AsyncIterable[bytes], response: Response
+) -> StreamingResponse:
+    """Stream `lines`, keeping the headers dependencies set on `response`."""
+    return StreamingResponse(
+        lines, media_type="application/x-ndjson", headers=response.headers
+    )
+
+
+def catalog_bundle_response(
+    request: Request, response: Response
+) -> CatalogBundleResponse | Response:
+    """Manifest of the bundle of the current catalog version, or a 404."""
+    version = catalog_version_tracker.version
+    manifest = read_manifest(version) if version else None
+    if manifest is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Catalog bundle not found."
+        )
+    return json_response(
+        CatalogBundleResponse(
+            version=version,
+            tables=[
+                CatalogBundleTableResponse(
+                    name=name,
+                    url=str(
+                        request.url_for(
+                            "fetch_catalog_bundle_table", version=version, table=name
+                        )
+                    ),
+                    **table,
+                )
+                for name, table in manifest["tables"].items()
+            ],
+        ),
+        response,
+    )
+
+
+def catalog_bundle_table_response(version: str, table: str) -> FileResponse:
+    path = bundle_file(version, table)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Bundle table not found."
+        )
+    return FileResponse(
+        path,
+        media_type="application/vnd.apache.parquet",
+        headers={"Cache-Control": settings.CACHE_CONTROL_CATALOG_BUNDLE},
+    )
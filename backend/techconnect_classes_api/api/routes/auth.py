@@ -7,7 +7,10 @@ from sqlalchemy.orm import Session
 
 from techconnect_classes_api.api.limiter import limiter
 from techconnect_classes_api.core.config import settings
-from techconnect_classes_api.core.security import create_access_token
+from techconnect_classes_api.core.security import (
+    PasswordHashQueueFullError,
+    create_access_token,
+)
 from techconnect_classes_api.crud.user import user_crud
 from techconnect_classes_api.database import get_db
 from techconnect_classes_api.schemas.auth import Token
@@ -31,7 +34,14 @@ def login_for_access_token(
     Returns:
         Token: A Token object containing the access token and token type.
     """
-    user = user_crud.authenticate_user(db, form_data.username, form_data.password)
+    try:
+        user = user_crud.authenticate_user(db, form_data.username, form_data.password)
+    except PasswordHashQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress",
+            headers={"Retry-After": "1"},
+        )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
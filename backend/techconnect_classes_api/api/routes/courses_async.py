@@ -0,0 +1,459 @@
+from typing import Annotated, AsyncIterator
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from techconnect_classes_api.api.cache import CachedRoute, cache_response
+from techconnect_classes_api.api.dependencies import (
+    catalog_conditional_async,
+    catalog_version_async,
+)
+from techconnect_classes_api.api.limiter import limiter
+from techconnect_classes_api.api.responses import (
+    catalog_bundle_response,
+    catalog_bundle_table_response,
+    course_found,
+    invalid_cursor_as_400,
+    json_response,
+    ndjson_response,
+    prerequisite_cycle_as_409,
+    upcoming_redirect,
+)
+from techconnect_classes_api.crud.course import course_crud
+from techconnect_classes_api.database import get_async_db, get_managed_async_db
+from techconnect_classes_api.schemas.course import (
+    CatalogBundleResponse,
+    CourseAdditionalMaterialsResponse,
+    CourseBatchQuery,
+    CourseBatchResponse,
+    CourseDetailResponse,
+    CourseFacetsResponse,
+    CourseFormatsResponse,
+    CourseHandoutsResponse,
+    CourseLanguagesResponse,
+    CourseLearningPathResponse,
+    CourseLevelsResponse,
+    CourseNodePage,
+    CourseNodeQuery,
+    CoursePrerequisitesResponse,
+    CourseSeriesResponse,
+)
+
+router = APIRouter(
+    prefix="/courses",
+    tags=["courses"],
+    route_class=CachedRoute,
+    dependencies=[Depends(catalog_version_async)],
+)
+
+
+@router.get(
+    "/all",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_LIST"))],
+)
+@cache_response(
+    "RESPONSE_CACHE_TTL_COURSE_LIST", unordered=("level", "format", "series")
+)
+@limiter.limit("1/second")
+async def fetch_all_courses(
+    request: Request,
+    response: Response,
+    query_params: Annotated[CourseNodeQuery, Query()],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> CourseNodePage:
+    """Fetch all courses, one page at a time.
+
+    Parameters:
+        db (AsyncSession): The async database session.
+        query_params (CourseNodeQuery):
+            level: Course levels, repeat to match any of them.
+            format: Course formats, repeat to match any of them.
+            series: Course series/topics, repeat to match any of them.
+            search: Full-text search over course names and descriptions,
+                results ordered by relevance.
+            limit: Maximum number of courses per page.
+            cursor: `next_cursor` of the previous page.
+    Returns:
+        CourseNodePage: Courses with their id, ordered by name, and the cursor
+            of the next page.
+    """
+    with invalid_cursor_as_400():
+        return json_response(
+            await course_crud.get_multiple_filtered_async(
+                db, query_params=query_params
+            ),
+            response,
+        )
+
+
+@router.get(
+    "/facets",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_LIST"))],
+)
+@cache_response(
+    "RESPONSE_CACHE_TTL_COURSE_LIST", unordered=("level", "format", "series")
+)
+@limiter.limit("1/second")
+async def fetch_course_facets(
+    request: Request,
+    response: Response,
+    query_params: Annotated[CourseNodeQuery, Query()],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> CourseFacetsResponse:
+    """Fetch a page of courses with the number of matches of every filter value.
+
+    Parameters:
+        db (AsyncSession): The async database session.
+        query_params (CourseNodeQuery): Same filters, search and paging as
+            /courses/all.
+    Returns:
+        CourseFacetsResponse: Page of matching courses, their total, and the
+            course count of every level, format and series under the other
+            filters.
+    """
+    with invalid_cursor_as_400():
+        return json_response(
+            await course_crud.get_facets_async(db, query_params=query_params), response
+        )
+
+
+@router.get(
+    "/formats",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_REFERENCE"))],
+)
+@cache_response("RESPONSE_CACHE_TTL_COURSE_REFERENCE")
+@limiter.limit("1/second")
+async def fetch_all_course_formats(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> CourseFormatsResponse:
+    """Fetch all course formats.
+
+    Parameters:
+        db (AsyncSession): The async database session.
+    Returns:
+        CourseFormatsResponse: All course formats.
+    """
+    return json_response(await course_crud.get_all_formats_async(db), response)
+
+
+@router.get(
+    "/languages",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_REFERENCE"))],
+)
+@cache_response("RESPONSE_CACHE_TTL_COURSE_REFERENCE")
+@limiter.limit("1/second")
+async def fetch_all_course_languages(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> CourseLanguagesResponse:
+    """Fetch all course languages.
+
+    Parameters:
+        db (AsyncSession): The async database session.
+    Returns:
+        CourseLanguagesResponse: All course languages.
+    """
+    return json_response(await course_crud.get_all_languages_async(db), response)
+
+
+@router.get(
+    "/levels",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_REFERENCE"))],
+)
+@cache_response("RESPONSE_CACHE_TTL_COURSE_REFERENCE")
+@limiter.limit("1/second")
+async def fetch_all_course_levels(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> CourseLevelsResponse:
+    """Fetch all course levels.
+
+    Parameters:
+        db (AsyncSession): The async database session.
+    Returns:
+        CourseLevelsResponse: All course levels.
+    """
+    return json_response(await course_crud.get_all_levels_async(db), response)
+
+
+@router.get(
+    "/series",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_REFERENCE"))],
+)
+@cache_response("RESPONSE_CACHE_TTL_COURSE_REFERENCE")
+@limiter.limit("1/second")
+async def fetch_all_course_series(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> CourseSeriesResponse:
+    """Fetch all course series/topics.
+
+    Parameters:
+        db (AsyncSession): The async database session.
+    Returns:
+        CourseSeriesResponse: All course series/topics.
+    """
+    return json_response(await course_crud.get_all_series_async(db), response)
+
+
+@router.get(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_DETAIL"))],
+)
+@cache_response("RESPONSE_CACHE_TTL_COURSE_DETAIL")
+@limiter.limit("1/second")
+async def fetch_course_details_batch(
+    request: Request,
+    response: Response,
+    query_params: Annotated[CourseBatchQuery, Query()],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> CourseBatchResponse:
+    """Fetch detailed information of several courses in one call.
+
+    Parameters:
+        db (AsyncSession): The async database session.
+        query_params (CourseBatchQuery):
+            ids: Course ids, comma separated or repeated (at most 100).
+    Returns:
+        CourseBatchResponse: Course details in the requested order, and the
+            requested ids that have no course.
+    """
+    return json_response(
+        await course_crud.get_details_many_async(db, course_ids=query_params.ids),
+        response,
+    )
+
+
+@router.get(
+    "/export.ndjson",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_LIST"))],
+)
+@limiter.limit("1/second")
+async def export_courses(request: Request, response: Response) -> StreamingResponse:
+    """Stream the detailed information of every course, one JSON object per line.
+
+    Returns:
+        StreamingResponse: Newline-delimited course details with their id,
+            ordered by id.
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        # The request's session is closed before the body is sent
+        async with get_managed_async_db() as db:
+            async for chunk in course_crud.export_details_async(db):
+                yield chunk
+
+    return ndjson_response(lines(), response)
+
+
+@router.get(
+    "/bundle",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_LIST"))],
+)
+@limiter.limit("1/second")
+async def fetch_catalog_bundle(
+    request: Request, response: Response
+) -> CatalogBundleResponse:
+    """Fetch the manifest of the columnar bundle of the current catalog.
+
+    Returns:
+        CatalogBundleResponse: Catalog version, and the rows, columns and url of
+            the Parquet file of each normalized table.
+    """
+    return catalog_bundle_response(request, response)
+
+
+@router.get(
+    "/bundle/{version}/{table}.parquet",
+    status_code=status.HTTP_200_OK,
+    response_class=FileResponse,
+)
+@limiter.limit("10/second")
+async def fetch_catalog_bundle_table(
+    request: Request, version: Annotated[str, Path()], table: Annotated[str, Path()]
+) -> FileResponse:
+    """Download one table of a catalog bundle as Parquet. Supports Range
+    requests, so readers can fetch the footer and only the columns they need.
+
+    Parameters:
+        version (Path): Catalog version of the bundle.
+        table (Path): Table name, as listed in the bundle manifest.
+    Returns:
+        FileResponse: The Parquet file; bundles never change once written.
+    """
+    return catalog_bundle_table_response(version, table)
+
+
+@router.get(
+    "/{course_id}/handouts",
+    status_code=status.HTTP_200_OK,
+)
+@cache_response("RESPONSE_CACHE_TTL_COURSE_DETAIL")
+@limiter.limit("1/second")
+async def fetch_handouts_by_id(
+    request: Request,
+    course_id: Annotated[int, Path()],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> CourseHandoutsResponse | None:
+    """Fetch handouts by course id.
+
+    Parameters:
+        course_id (Path): Course id.
+        db (AsyncSession): The async database session.
+    Returns:
+        CourseHandoutsResponse: Object containing a list of handout objects with language code and handout url.
+    """
+    return json_response(await course_crud.get_handouts_async(db, course_id=course_id))
+
+
+@router.get(
+    "/{course_id}/additional-materials",
+    status_code=status.HTTP_200_OK,
+)
+@cache_response("RESPONSE_CACHE_TTL_COURSE_DETAIL")
+@limiter.limit("1/second")
+async def fetch_additional_materials_by_id(
+    request: Request,
+    course_id: Annotated[int, Path()],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> CourseAdditionalMaterialsResponse | None:
+    """Fetch additional materials by course id.
+
+    Parameters:
+        course_id (Path): Course id.
+        db (AsyncSession): The async database session.
+    Returns:
+        CourseAdditionalMaterialsResponse: Object containing a list of additional material urls.
+    """
+    return json_response(
+        await course_crud.get_additional_materials_async(db, course_id=course_id)
+    )
+
+
+@router.get(
+    "/{course_id}/upcoming",
+    status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+)
+@limiter.limit("1/second")
+async def redirect_to_upcoming_session_link_by_id(
+    request: Request,
+    course_id: Annotated[int, Path()],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> RedirectResponse:
+    """Fetch additional materials by course id.
+
+    Parameters:
+        course_id (Path): Course id.
+        db (AsyncSession): The async database session.
+    Returns:
+        RedirectResponse: To NYPL TechConnect page of upcoming classes.
+    """
+    url = await course_crud.get_upcoming_async(db, course_id=course_id)
+    return upcoming_redirect(url)
+
+
+@router.get(
+    "/{course_id}/prerequisites",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_DETAIL"))],
+)
+@cache_response("RESPONSE_CACHE_TTL_COURSE_DETAIL")
+@limiter.limit("1/second")
+async def fetch_prerequisites_by_id(
+    request: Request,
+    response: Response,
+    course_id: Annotated[int, Path()],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    transitive: Annotated[bool, Query()] = False,
+) -> CoursePrerequisitesResponse:
+    """Fetch the prerequisites of a course from the prerequisite graph.
+
+    Parameters:
+        course_id (Path): Course id.
+        db (AsyncSession): The async database session.
+        transitive (Query): Include prerequisites of prerequisites.
+    Returns:
+        CoursePrerequisitesResponse: Prerequisites, each listed after its own
+            prerequisites.
+    """
+    with prerequisite_cycle_as_409():
+        prerequisites = await course_crud.get_prerequisites_async(
+            db, course_id=course_id, transitive=transitive
+        )
+    return course_found(prerequisites, response)
+
+
+@router.get(
+    "/{course_id}/learning-path",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_DETAIL"))],
+)
+@cache_response("RESPONSE_CACHE_TTL_COURSE_DETAIL")
+@limiter.limit("1/second")
+async def fetch_learning_path_by_id(
+    request: Request,
+    response: Response,
+    course_id: Annotated[int, Path()],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> CourseLearningPathResponse:
+    """Fetch an ordered plan to take a course: every prerequisite, then the course.
+
+    Parameters:
+        course_id (Path): Course id.
+        db (AsyncSession): The async database session.
+    Returns:
+        CourseLearningPathResponse: Courses in an order that can be taken.
+    """
+    with prerequisite_cycle_as_409():
+        learning_path = await course_crud.get_learning_path_async(
+            db, course_id=course_id
+        )
+    return course_found(learning_path, response)
+
+
+@router.get(
+    "/{course_id}",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(catalog_conditional_async("CACHE_CONTROL_COURSE_DETAIL"))],
+)
+@cache_response("RESPONSE_CACHE_TTL_COURSE_DETAIL")
+@limiter.limit("1/second")
+async def fetch_course_detail(
+    request: Request,
+    response: Response,
+    course_id: Annotated[int, Path()],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> CourseDetailResponse | None:
+    """Fetch course detailed information by course id.
+
+    Parameters:
+        course_id (Path): Course id.
+        db (AsyncSession): The async database session.
+    Returns:
+        CourseDetailResponse: Object containing all course detail.
+    """
+    return json_response(await course_crud.get_detail_async(db, course_id), response)
@@ -1,11 +1,64 @@
-from fastapi import APIRouter, Depends
+from typing import Annotated
 
+from fastapi import APIRouter, Depends, Query, Request, status
+from sqlalchemy.orm import Session
+
+from techconnect_classes_api.api.dependencies import (
+    catalog_version,
+    get_current_active_user,
+)
 from techconnect_classes_api.api.limiter import limiter
+from techconnect_classes_api.crud.course import course_crud
+from techconnect_classes_api.crud.user_class_interest import (
+    courses_taken_crud,
+    series_interested_crud,
+)
+from techconnect_classes_api.database import get_db
+from techconnect_classes_api.schemas.recommendation import (
+    RecommendationResponse,
+    RecommendedCourse,
+)
+from techconnect_classes_api.schemas.user import CurrentUser
+from techconnect_classes_api.services.recommendation_service import (
+    recommendation_store,
+)
+
+router = APIRouter(prefix="/me", tags=["recommendation"])
+
+
+@router.get("/recommendation", status_code=status.HTTP_200_OK)
+@limiter.limit("5/second")
+def get_user_recommendation(
+    request: Request,
+    current_user: Annotated[CurrentUser, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+    version: Annotated[str | None, Depends(catalog_version)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> RecommendationResponse:
+    """Endpoint to recommend courses from the courses the current user took and
+    the series they are interested in. Courses already taken and courses whose
+    prerequisites the user hasn't taken are left out.
 
-# router = APIRouter(prefix="/me", tags=["recommendation"])
-#
-#
-# @router.get("/recommendation", response_model=...)
-# @limiter.limit("1/second")
-# def get_user_recommendation():
-#     raise
+    Parameters:
+        current_user (CurrentUser): The authenticated user.
+        db (Session): The database session.
+        version (str | None): Catalog version; the engine is rebuilt when it
+            changes.
+        limit (int): Maximum number of courses to return.
+    Returns:
+        RecommendationResponse: The recommended courses, best first.
+    """
+    engine = recommendation_store.get(
+        version, lambda: course_crud.build_recommendation_engine(db)
+    )
+    recommendations = engine.recommend(
+        courses_taken_crud.get_item_ids(db, current_user.id),
+        series_interested_crud.get_item_ids(db, current_user.id),
+        limit,
+    )
+    return RecommendationResponse(
+        courses=[
+            RecommendedCourse(id=course.id, course_name=course.course_name, score=score)
+            for course, score in recommendations
+        ]
+    )
@@ -4,12 +4,28 @@ from fastapi import APIRouter, Depends, Request, status
 from fastapi.exceptions import HTTPException
 from sqlalchemy.orm import Session
 
+from techconnect_classes_api.api.dependencies import get_current_active_user
 from techconnect_classes_api.api.limiter import limiter
-from techconnect_classes_api.core.security import get_password_hash
+from techconnect_classes_api.core.security import (
+    PasswordHashQueueFullError,
+    get_password_hash,
+)
 from techconnect_classes_api.crud.user import user_crud
+from techconnect_classes_api.crud.user_class_interest import (
+    UnknownItemsError,
+    courses_taken_crud,
+    series_interested_crud,
+)
 from techconnect_classes_api.database.db import get_db
 from techconnect_classes_api.schemas.auth import UserSignUp
-from techconnect_classes_api.schemas.user import UserInDB
+from techconnect_classes_api.schemas.course import CourseNodeResponse
+from techconnect_classes_api.schemas.user import CurrentUser
+from techconnect_classes_api.schemas.user_class_interest import (
+    CoursesTakenResponse,
+    CoursesTakenUpdate,
+    SeriesInterestedResponse,
+    SeriesInterestedUpdate,
+)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -27,20 +43,120 @@ def sign_up_user(
     Returns:
         dict[str, str]: A dictionary containing the username created.
     """
-    user = user_crud.get_user(db, user_data.username)
-    if user:
+    try:
+        hashed_password = get_password_hash(user_data.password)
+    except PasswordHashQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign ups in progress",
+            headers={"Retry-After": "1"},
+        )
+    user_id = user_crud.create_user(db, user_data.username, hashed_password)
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"'{user_data.username}' already registered",
         )
-    user_in = UserInDB(
-        username=user_data.username,
-        hashed_password=get_password_hash(user_data.password),
-    )
-    user_crud.insert(db, obj_in=user_in)
     return {"username": user_data.username}
 
 
+def to_courses_taken_response(rows: list) -> CoursesTakenResponse:
+    return CoursesTakenResponse(
+        courses=[CourseNodeResponse(id=id, course_name=name) for id, name in rows]
+    )
+
+
+@router.get("/me/courses-taken", status_code=status.HTTP_200_OK)
+@limiter.limit("10/second")
+def get_courses_taken(
+    request: Request,
+    current_user: Annotated[CurrentUser, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+) -> CoursesTakenResponse:
+    """Endpoint to list the courses the current user has taken.
+
+    Parameters:
+        current_user (CurrentUser): The authenticated user.
+        db (Session): The database session.
+    Returns:
+        CoursesTakenResponse: The courses taken, ordered by name.
+    """
+    rows = courses_taken_crud.get_items(db, current_user.id)
+    return to_courses_taken_response(rows)
+
+
+@router.put("/me/courses-taken", status_code=status.HTTP_200_OK)
+@limiter.limit("1/second")
+def replace_courses_taken(
+    request: Request,
+    update: CoursesTakenUpdate,
+    current_user: Annotated[CurrentUser, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+) -> CoursesTakenResponse:
+    """Endpoint to replace the list of courses the current user has taken.
+
+    Parameters:
+        update (CoursesTakenUpdate): Request body containing every course taken.
+        current_user (CurrentUser): The authenticated user.
+        db (Session): The database session.
+    Returns:
+        CoursesTakenResponse: The courses taken, ordered by name.
+    """
+    try:
+        rows = courses_taken_crud.replace_items(db, current_user.id, update.course_ids)
+    except UnknownItemsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+    return to_courses_taken_response(rows)
+
+
+@router.get("/me/series-interested", status_code=status.HTTP_200_OK)
+@limiter.limit("10/second")
+def get_series_interested(
+    request: Request,
+    current_user: Annotated[CurrentUser, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+) -> SeriesInterestedResponse:
+    """Endpoint to list the series the current user is interested in.
+
+    Parameters:
+        current_user (CurrentUser): The authenticated user.
+        db (Session): The database session.
+    Returns:
+        SeriesInterestedResponse: The series names, in alphabetical order.
+    """
+    rows = series_interested_crud.get_items(db, current_user.id)
+    return SeriesInterestedResponse(series=[name for _, name in rows])
+
+
+@router.put("/me/series-interested", status_code=status.HTTP_200_OK)
+@limiter.limit("1/second")
+def replace_series_interested(
+    request: Request,
+    update: SeriesInterestedUpdate,
+    current_user: Annotated[CurrentUser, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+) -> SeriesInterestedResponse:
+    """Endpoint to replace the list of series the current user is interested in.
+
+    Parameters:
+        update (SeriesInterestedUpdate): Request body containing every series of
+        interest.
+        current_user (CurrentUser): The authenticated user.
+        db (Session): The database session.
+    Returns:
+        SeriesInterestedResponse: The series names, in alphabetical order.
+    """
+    try:
+        rows = series_interested_crud.replace_items(db, current_user.id, update.series)
+    except UnknownItemsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+    return SeriesInterestedResponse(series=[name for _, name in rows])
+
+
 # @router.get("/me", response_model=...)
 # @limiter.limit("1/second")
 # def get_user_info():
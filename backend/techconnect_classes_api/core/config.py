@@ -1,10 +1,14 @@
 import logging
 import os
+from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 log = logging.getLogger(__name__)
 
+# backend/, so paths derived from it do not depend on the working directory
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -25,6 +29,46 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     POSTGRES_PORT: int
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_POOL_PRE_PING: bool = True
+
+    RATE_LIMIT_ENABLED: bool = True
+
+    ASYNC_COURSE_ROUTES: bool = False
+    CATALOG_CACHE_MODE: bool = False
+    COURSE_DETAIL_VIEW_ENABLED: bool = False
+    FAST_JSON_RESPONSES: bool = False
+    COURSE_EXPORT_CHUNK_SIZE: int = 500
+
+    CATALOG_VERSION_TTL_SECONDS: int = 30
+    CACHE_CONTROL_COURSE_REFERENCE: str = "public, max-age=3600"
+    CACHE_CONTROL_COURSE_LIST: str = "public, max-age=300"
+    CACHE_CONTROL_COURSE_DETAIL: str = "public, max-age=300"
+    CACHE_CONTROL_CATALOG_BUNDLE: str = "public, max-age=31536000, immutable"
+
+    RESPONSE_CACHE_ENABLED: bool = False
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_CACHE_TTL_COURSE_REFERENCE: int = 3600
+    RESPONSE_CACHE_TTL_COURSE_LIST: int = 300
+    RESPONSE_CACHE_TTL_COURSE_DETAIL: int = 300
+
+    COMPRESSION_ENABLED: bool = False
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_VARIANTS_MAX_BYTES: int = 32 * 1024 * 1024
+
+    CATALOG_BUNDLE_DIR: str = str(PROJECT_DIR / "bundles")
+
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUED: int = 32
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_CALIBRATE: bool = False
+    PASSWORD_HASH_TARGET_MS: int = 250
+
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAX_ENTRIES: int = 10_000
+    TOKEN_CACHE_MAX_ENTRIES: int = 10_000
 
 
 class DevSettings(Settings):
@@ -47,6 +91,7 @@ class LocalDevSettings(Settings):
     )
     ENV: str = "local"
 
+
 def get_settings(env: str = "dev") -> Settings:
     log.debug(f"Getting settings for env: {env}")
     if env.lower() in ["dev", "development"]:
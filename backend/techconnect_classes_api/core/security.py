@@ -1,12 +1,28 @@
+import logging
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable, TypeVar
 
+import bcrypt
 import jwt
 from passlib.context import CryptContext
 
 from techconnect_classes_api.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# OWASP's floor for bcrypt; calibration never goes below it
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+
+
+class PasswordHashQueueFullError(Exception):
+    """Raised when too many password hashes are already waiting for a worker."""
 
 
 def create_access_token(
@@ -21,9 +37,133 @@ def create_access_token(
     return encoded_jwt
 
 
+def bcrypt_context(rounds: int) -> CryptContext:
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+def calibrate_rounds(target_ms: float) -> int:
+    """Highest bcrypt cost whose hash takes at most `target_ms` on this machine.
+
+    Each extra round doubles the work, so one hash at the minimum cost is
+    enough to extrapolate.
+    """
+    salt = bcrypt.gensalt(MIN_BCRYPT_ROUNDS)
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", salt)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    extra_rounds = math.floor(math.log2(target_ms / elapsed_ms))
+    rounds = min(
+        MAX_BCRYPT_ROUNDS, max(MIN_BCRYPT_ROUNDS, MIN_BCRYPT_ROUNDS + extra_rounds)
+    )
+    log.info(
+        f"bcrypt cost {rounds}: ~{elapsed_ms * 2 ** (rounds - MIN_BCRYPT_ROUNDS):.0f} ms "
+        f"per hash (target {target_ms} ms)"
+    )
+    return rounds
+
+
+class PasswordHasher:
+    """bcrypt on a dedicated pool of `workers` threads.
+
+    bcrypt releases the GIL while it hashes, so the request threads waiting on
+    the pool don't slow down other requests, and at most `workers` hashes
+    compete with them for CPU however many logins arrive at once. Calls beyond
+    `max_queued` waiting hashes raise `PasswordHashQueueFullError` instead of
+    piling up.
+    """
+
+    def __init__(self, workers: int, max_queued: int, rounds: int) -> None:
+        self.workers = workers
+        self.max_queued = max_queued
+        self.rounds = rounds
+        self.context = bcrypt_context(rounds)
+        self.queued = 0
+        self.running = 0
+        self.peak_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        self._lock = threading.Lock()
+
+    def set_rounds(self, rounds: int) -> None:
+        """Hash with a new cost. Stored hashes of another cost are reported by
+        `verify_and_update` and replaced on the next successful login."""
+        self.context = bcrypt_context(rounds)
+        self.rounds = rounds
+
+    def hash(self, password: str) -> str:
+        context = self.context
+        return self._run(context.hash, password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        context = self.context
+        return self._run(context.verify, password, hashed_password)
+
+    def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Verify a password; when it matches and passlib's `needs_update` flags
+        the stored hash (another cost or scheme), also return its replacement.
+
+        The replacement is best effort: when the queue is full the login still
+        succeeds and the hash is upgraded on a later one.
+        """
+        if not self.verify(password, hashed_password):
+            return False, None
+        if not self.context.needs_update(hashed_password):
+            return True, None
+        try:
+            return True, self.hash(password)
+        except PasswordHashQueueFullError:
+            log.info("Password hash upgrade deferred; the hash queue is full")
+            return True, None
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": self.workers,
+            "rounds": self.rounds,
+            "queued": self.queued,
+            "running": self.running,
+            "peak_queued": self.peak_queued,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def _run(self, fn: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self.queued >= self.max_queued:
+                self.rejected += 1
+                log.warning(f"Password hash queue full: {self.stats()}")
+                raise PasswordHashQueueFullError
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+        future: Future = self._executor.submit(self._work, fn, *args)
+        return future.result()
+
+    def _work(self, fn: Callable[..., T], *args) -> T:
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+
+password_hasher = PasswordHasher(
+    settings.PASSWORD_HASH_WORKERS,
+    settings.PASSWORD_HASH_MAX_QUEUED,
+    settings.PASSWORD_HASH_ROUNDS,
+)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
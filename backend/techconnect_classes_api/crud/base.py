@@ -1,10 +1,12 @@
 import logging
-from typing import Generic, Optional, TypeVar
+from typing import Any, Generic, Optional, Sequence, TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Row, Select, inspect, select, tuple_
 from sqlalchemy.orm import Session
 
 from techconnect_classes_api.database.db import ModelType
+from techconnect_classes_api.services.pagination import decode_cursor, encode_cursor
 
 log = logging.getLogger(__name__)
 
@@ -12,6 +14,32 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+def keyset_statement(
+    statement: Select,
+    keys: Sequence[ColumnElement],
+    cursor: str | None,
+    limit: int,
+) -> Select:
+    """Page of `statement` ordered by `keys`, starting after `cursor`.
+
+    The key values are selected after the entity so `keyset_page` can build the
+    next cursor. One extra row is fetched to tell whether another page exists.
+    Raises `InvalidCursorError` for cursors that don't match `keys`.
+    """
+    statement = statement.add_columns(*keys).order_by(*keys).limit(limit + 1)
+    if cursor:
+        values = decode_cursor(cursor, [key.type.python_type for key in keys])
+        statement = statement.where(tuple_(*keys) > tuple_(*values))
+    return statement
+
+
+def keyset_page(rows: Sequence[Row], limit: int) -> tuple[list[Any], str | None]:
+    """Entities of a `keyset_statement` result and the cursor of the next page."""
+    items = [row[0] for row in rows[:limit]]
+    next_cursor = encode_cursor(rows[limit - 1][1:]) if len(rows) > limit else None
+    return items, next_cursor
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: ModelType) -> None:
         self.model = model
@@ -35,6 +63,27 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             .all()
         )
 
+    def get_page(
+        self,
+        db: Session,
+        *args,
+        order_by: Sequence[ColumnElement] | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+        **kwargs,
+    ) -> tuple[list[ModelType], str | None]:
+        """Keyset-paginated `get_multiple`: cost doesn't grow with page depth.
+
+        `order_by` must make rows unique (end it with the primary key); it
+        defaults to the primary key. Returns the page and the next cursor,
+        which is None on the last page.
+        """
+        log.debug(f"Retrieving {limit} records from {self.model.__name__} by cursor")
+        keys = order_by or inspect(self.model).primary_key
+        statement = select(self.model).where(*args).filter_by(**kwargs)
+        rows = db.execute(keyset_statement(statement, keys, cursor, limit)).all()
+        return keyset_page(rows, limit)
+
     def insert(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         log.debug(f"Inserting record for {self.model.__name__}: {obj_in.model_dump()}")
         obj_in_data = obj_in.model_dump(exclude_none=True, exclude_unset=True)
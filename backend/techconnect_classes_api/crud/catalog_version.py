@@ -0,0 +1,21 @@
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from techconnect_classes_api.models import CatalogVersion
+
+from .base import CRUDBase
+
+
+class CatalogVersionCRUD(CRUDBase[CatalogVersion, None, None]):
+    def _latest_version_statement(self) -> Select:
+        return select(self.model.version).order_by(self.model.id.desc()).limit(1)
+
+    def get_latest_version(self, db: Session) -> str | None:
+        return db.scalar(self._latest_version_statement())
+
+    async def get_latest_version_async(self, db: AsyncSession) -> str | None:
+        return await db.scalar(self._latest_version_statement())
+
+
+catalog_version_crud = CatalogVersionCRUD(model=CatalogVersion)
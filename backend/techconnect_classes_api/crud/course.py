@@ -1,76 +1,355 @@
-from pydantic import HttpUrl
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+import asyncio
+import logging
+import threading
+from typing import AsyncIterator, Callable, Iterator
 
-from techconnect_classes_api.models import Course, Format, Language, Level, Series
+from pydantic import BaseModel, HttpUrl, ValidationError
+from sqlalchemy import (
+    ColumnElement,
+    Double,
+    Row,
+    Select,
+    and_,
+    cast,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.crud.catalog_version import catalog_version_crud
+from techconnect_classes_api.database.db import Base, get_managed_db
+from techconnect_classes_api.models import (
+    AdditionalMaterial,
+    Course,
+    CourseSeries,
+    Format,
+    Handout,
+    Language,
+    Level,
+    Prerequisite,
+    Series,
+    course_details,
+)
 from techconnect_classes_api.schemas.course import (
     CourseAdditionalMaterialsResponse,
+    CourseBatchDetailResponse,
+    CourseBatchResponse,
     CourseDetailResponse,
+    CourseFacetCounts,
+    CourseFacetsResponse,
     CourseFormatsResponse,
     CourseHandoutsResponse,
     CourseLanguagesResponse,
+    CourseLearningPathResponse,
     CourseLevelsResponse,
+    CourseNodePage,
     CourseNodeQuery,
     CourseNodeResponse,
+    CoursePrerequisitesResponse,
     CourseSeriesResponse,
     HandoutResponse,
 )
+from techconnect_classes_api.services.bitmap_index import BitmapIndex
+from techconnect_classes_api.services.catalog import (
+    CatalogSnapshot,
+    catalog_store,
+    catalog_version_tracker,
+    served_catalog_version,
+)
+from techconnect_classes_api.services.prerequisite_graph import (
+    PrerequisiteCycleError,
+    PrerequisiteGraph,
+)
+from techconnect_classes_api.services.recommendation_service import (
+    RecommendationEngine,
+)
+from techconnect_classes_api.services.response_cache import response_cache
+
+from .base import CRUDBase, keyset_page, keyset_statement
+
+log = logging.getLogger(__name__)
 
-from .base import CRUDBase
+# Deeper prerequisite chains are cut off by the recursive queries
+PREREQUISITE_MAX_DEPTH = 100
+
+# Serializes catalog reloads, so concurrent requests noticing the same new
+# version rebuild the snapshot once
+_reload_lock = threading.Lock()
+
+
+def upcoming_sessions_link(course_name: str) -> HttpUrl:
+    return HttpUrl(
+        f"https://www.nypl.org/techconnect?keyword={course_name.replace(' ', '+')}"
+    )
 
 
 class CourseCRUD(CRUDBase[Course, None, None]):
-    def get_multiple_filtered(
-        self, db: Session, query_params: CourseNodeQuery
-    ) -> list[CourseNodeResponse]:
-        db_query = db.query(self.model)
+    def _filtered_statement(self, query_params: CourseNodeQuery) -> Select:
+        statement = select(self.model)
 
         if query_params.level:
-            db_query = db_query.join(Level).filter(
-                Level.level_name == query_params.level
+            statement = statement.join(Level).where(
+                Level.level_name.in_(query_params.level)
             )
 
         if query_params.format:
-            db_query = db_query.join(Format).filter(
-                Format.format_name == query_params.format
+            statement = statement.join(Format).where(
+                Format.format_name.in_(query_params.format)
             )
 
         if query_params.series:
-            db_query = (
-                db_query.join(self.model.courses_in_series)
+            # Semi-join rather than JOIN + DISTINCT, so ORDER BY ts_rank stays valid
+            statement = statement.where(
+                self.model.id.in_(
+                    select(CourseSeries.course_id)
+                    .join(Series)
+                    .where(Series.series_name.in_(query_params.series))
+                )
+            )
+
+        if query_params.search:
+            statement = statement.where(
+                self.model.search_vector.bool_op("@@")(
+                    self._ts_query(query_params.search)
+                )
+            )
+
+        return statement
+
+    def _sort_keys(self, query_params: CourseNodeQuery) -> list[ColumnElement]:
+        """Keyset pagination order: relevance for searches, otherwise by name.
+
+        The "C" collation makes the database order match the catalog snapshot's
+        Python string order, so cursors work the same on both paths.
+        """
+        if query_params.search:
+            # ts_rank returns real; as double it round-trips through the cursor
+            rank = cast(
+                func.ts_rank(
+                    self.model.search_vector, self._ts_query(query_params.search)
+                ),
+                Double,
+            )
+            return [-rank, self.model.id]
+        return [self.model.course_name.collate("C"), self.model.id]
+
+    @staticmethod
+    def _ts_query(search: str) -> ColumnElement:
+        return func.websearch_to_tsquery("english", search)
+
+    def _page_statement(self, query_params: CourseNodeQuery) -> Select:
+        return keyset_statement(
+            self._filtered_statement(query_params),
+            self._sort_keys(query_params),
+            query_params.cursor,
+            query_params.limit,
+        )
+
+    def _facets_statement(self, query_params: CourseNodeQuery) -> Select:
+        """(facet, value, count) rows for every level, format and series, plus a
+        ("total", NULL, count) row, in a single statement.
+
+        Each course of the search is flagged with which filters it matches; a
+        field's values are then counted over the courses matching the other
+        filters. Values are outer joined, so values without matches count 0.
+        """
+        # Filters that aren't given match every course
+        flags = {"level": true(), "format": true(), "series": true()}
+        if query_params.level:
+            flags["level"] = self.model.level_id.in_(
+                select(Level.id).where(Level.level_name.in_(query_params.level))
+            )
+        if query_params.format:
+            flags["format"] = self.model.format_id.in_(
+                select(Format.id).where(Format.format_name.in_(query_params.format))
+            )
+        if query_params.series:
+            flags["series"] = self.model.id.in_(
+                select(CourseSeries.course_id)
                 .join(Series)
-                .filter(Series.series_name == query_params.series)
-                .distinct()
+                .where(Series.series_name.in_(query_params.series))
             )
+        matched = select(
+            self.model.id,
+            self.model.level_id,
+            self.model.format_id,
+            *(flag.label(field) for field, flag in flags.items()),
+        )
+        if query_params.search:
+            matched = matched.where(
+                self.model.search_vector.bool_op("@@")(
+                    self._ts_query(query_params.search)
+                )
+            )
+        matched = matched.cte("matched")
 
-        db_courses = db_query.all()
+        def count_matching(*fields: str) -> ColumnElement:
+            return func.count(matched.c.id).filter(
+                and_(*(matched.c[f] for f in fields))
+            )
 
-        return [CourseNodeResponse.model_validate(course) for course in db_courses]
+        return union_all(
+            select(
+                literal("level"),
+                Level.level_name,
+                count_matching("format", "series"),
+            )
+            .outerjoin(matched, matched.c.level_id == Level.id)
+            .group_by(Level.level_name),
+            select(
+                literal("format"),
+                Format.format_name,
+                count_matching("level", "series"),
+            )
+            .outerjoin(matched, matched.c.format_id == Format.id)
+            .group_by(Format.format_name),
+            select(
+                literal("series"),
+                Series.series_name,
+                count_matching("level", "format"),
+            )
+            .outerjoin(CourseSeries, CourseSeries.series_id == Series.id)
+            .outerjoin(matched, matched.c.id == CourseSeries.course_id)
+            .group_by(Series.series_name),
+            select(
+                literal("total"),
+                null(),
+                count_matching("level", "format", "series"),
+            ),
+        )
 
-    def get_detail(self, db: Session, course_id: int) -> CourseDetailResponse | None:
-        db_course = (
-            db.query(self.model)
-            .join(self.model.courses_in_series)
-            .join(Series)
-            .filter(self.model.id == course_id)
-            .one_or_none()
+    def _detail_statement(self) -> Select:
+        """Course with everything the detail response needs, in five statements.
+
+        Level and format are joined into the course row. Each collection gets a
+        single IN query, with the series/prerequisite course joined into it.
+        """
+        return select(self.model).options(
+            joinedload(self.model.level),
+            joinedload(self.model.format),
+            selectinload(self.model.courses_in_series).joinedload(CourseSeries.series),
+            selectinload(self.model.prereqs).joinedload(Prerequisite.prereq_course),
+            selectinload(self.model.handouts),
+            selectinload(self.model.additional_materials),
         )
 
-        if not db_course:
+    def _course_rows_statement(
+        self, course_id: int, model: type[Base], *columns: ColumnElement
+    ) -> Select:
+        """`columns` of the `model` rows of one course, outer joined to the course
+        row: an existing course without rows yields a single row of NULLs and a
+        missing course yields no rows, so both come back in one round trip.
+        """
+        return (
+            select(*columns)
+            .select_from(self.model)
+            .outerjoin(model, model.course_id == self.model.id)
+            .where(self.model.id == course_id)
+            .order_by(model.id)
+        )
+
+    def _closure_statement(
+        self, course_id: int, unlocks: bool, max_depth: int
+    ) -> Select:
+        """The course (depth 0) and every course it transitively requires, or with
+        `unlocks` every course that transitively requires it, in one WITH
+        RECURSIVE statement over `prerequisites`.
+
+        UNION merges repeated (course, depth) pairs, so a shared prerequisite is
+        expanded once per depth instead of once per path. Recursion stops at
+        `max_depth` and never continues past the starting course, so a cycle
+        through it ends as a row of that course with `depth` > 0. Rows are in
+        learning order: farthest prerequisites first, nearest unlocks first.
+        """
+        near, far = (Prerequisite.course_id, Prerequisite.prereq_id)
+        if unlocks:
+            near, far = far, near
+
+        closure = (
+            select(self.model.id.label("id"), literal(0).label("depth"))
+            .where(self.model.id == course_id)
+            .cte("closure", recursive=True)
+        )
+        closure = closure.union(
+            select(far, closure.c.depth + 1)
+            .join(closure, near == closure.c.id)
+            .where(
+                closure.c.depth < max_depth,
+                or_(closure.c.depth == 0, closure.c.id != course_id),
+            )
+        )
+
+        # Longest distance from the course, which orders the rows topologically
+        depth = func.max(closure.c.depth)
+        return (
+            select(
+                self.model.id,
+                self.model.course_name,
+                depth.label("depth"),
+                func.min(closure.c.depth).label("min_depth"),
+            )
+            .join(closure, closure.c.id == self.model.id)
+            .group_by(self.model.id)
+            .order_by(depth if unlocks else depth.desc(), self.model.id)
+        )
+
+    @staticmethod
+    def _catalog_snapshot() -> CatalogSnapshot | None:
+        if not settings.CATALOG_CACHE_MODE:
             return None
+        return catalog_store.snapshot
 
-        series_names = [s.series.series_name for s in db_course.courses_in_series]
+    @staticmethod
+    def _to_page_response(
+        db_courses: list[Course], next_cursor: str | None
+    ) -> CourseNodePage:
+        return CourseNodePage(
+            courses=[CourseNodeResponse.model_validate(c) for c in db_courses],
+            next_cursor=next_cursor,
+        )
 
-        prereq_names = [p.prereq_course.course_name for p in db_course.prereqs]
+    @staticmethod
+    def _to_facets_response(
+        page: CourseNodePage, rows: list[Row]
+    ) -> CourseFacetsResponse:
+        counts: dict[str, dict[str, int]] = {"level": {}, "format": {}, "series": {}}
+        total = 0
+        for facet, value, count in rows:
+            if facet == "total":
+                total = count
+            else:
+                counts[facet][value] = count
+        return CourseFacetsResponse(
+            courses=page.courses,
+            next_cursor=page.next_cursor,
+            total=total,
+            facets=CourseFacetCounts(
+                **{facet: dict(sorted(c.items())) for facet, c in counts.items()}
+            ),
+        )
+
+    @staticmethod
+    def _to_detail_response(db_course: Course) -> CourseDetailResponse:
+        # Same order as the `course_details` documents
+        series_names = sorted(s.series.series_name for s in db_course.courses_in_series)
+
+        prereq_names = sorted(p.prereq_course.course_name for p in db_course.prereqs)
 
         handout_schemas = [
             HandoutResponse(language_code=h.language_code, url=h.url)
-            for h in db_course.handouts
+            for h in sorted(db_course.handouts, key=lambda h: h.id)
         ]
 
-        additional_materials_list = [m.url for m in db_course.additional_materials]
-
-        upcoming_sessions_link = f"https://www.nypl.org/techconnect?keyword={db_course.course_name.replace(' ', '+')}"
+        additional_materials_list = [
+            m.url for m in sorted(db_course.additional_materials, key=lambda m: m.id)
+        ]
 
         return CourseDetailResponse(
             course_name=db_course.course_name,
@@ -81,31 +360,95 @@ class CourseCRUD(CRUDBase[Course, None, None]):
             prereqs=prereq_names,
             available_handouts=handout_schemas,
             additional_materials=additional_materials_list,
-            link_to_upcoming_sessions=HttpUrl(upcoming_sessions_link),
+            link_to_upcoming_sessions=upcoming_sessions_link(db_course.course_name),
         )
 
-    def get_upcoming(self, db: Session, course_id: int) -> HttpUrl | None:
-        db_course = (
-            db.query(self.model).filter(self.model.id == course_id).one_or_none()
+    @classmethod
+    def _valid_details(
+        cls, db_courses: list[Course]
+    ) -> dict[int, CourseDetailResponse]:
+        """Detail responses by id, leaving out courses with invalid stored data."""
+        details = {}
+        for db_course in db_courses:
+            try:
+                details[db_course.id] = cls._to_detail_response(db_course)
+            except ValidationError as e:
+                log.warning(f"Course {db_course.id} has invalid detail data: {e}")
+        return details
+
+    @staticmethod
+    def _document_to_detail_response(document: dict) -> CourseDetailResponse:
+        """Detail response from a `course_details` document.
+
+        Names are sorted here rather than trusting the view's ORDER BY, whose
+        collation may not order them as `_to_detail_response` does.
+        """
+        detail = CourseDetailResponse(
+            **document,
+            link_to_upcoming_sessions=upcoming_sessions_link(document["course_name"]),
         )
+        detail.series.sort()
+        if detail.prereqs:
+            detail.prereqs.sort()
+        return detail
 
-        if not db_course:
-            return None
+    @classmethod
+    def _valid_documents(cls, rows: list[Row]) -> dict[int, CourseDetailResponse]:
+        """`_valid_details` for (id, document) rows of `course_details`."""
+        details = {}
+        for course_id, document in rows:
+            try:
+                details[course_id] = cls._document_to_detail_response(document)
+            except ValidationError as e:
+                log.warning(f"Course {course_id} has invalid detail data: {e}")
+        return details
 
-        return HttpUrl(
-            f"https://www.nypl.org/techconnect?keyword={db_course.course_name.replace(' ', '+')}"
+    @staticmethod
+    def _to_batch_response(
+        course_ids: list[int], details: dict[int, CourseDetailResponse]
+    ) -> CourseBatchResponse:
+        requested = list(dict.fromkeys(course_ids))
+        return CourseBatchResponse(
+            # Details are already validated; only the id is added
+            courses=[
+                CourseBatchDetailResponse.model_construct(id=i, **dict(details[i]))
+                for i in requested
+                if i in details
+            ],
+            missing_ids=[i for i in requested if i not in details],
         )
 
-    def get_handouts(
-        self, db: Session, course_id: int
-    ) -> CourseHandoutsResponse | None:
-        db_course = (
-            db.query(self.model).filter(self.model.id == course_id).one_or_none()
+    def _export_statement(self) -> Select:
+        """Every course with its detail relationships, ordered by id, fetched
+        through a server-side cursor in chunks of COURSE_EXPORT_CHUNK_SIZE. The
+        collection loaders run once per chunk, for the ids of that chunk."""
+        return (
+            self._detail_statement()
+            .order_by(self.model.id)
+            .execution_options(yield_per=settings.COURSE_EXPORT_CHUNK_SIZE)
         )
 
-        if not db_course:
-            return None
+    @staticmethod
+    def _to_export_lines(details: dict[int, CourseDetailResponse]) -> bytes:
+        """NDJSON lines of course details, each with its course id."""
+        return b"".join(
+            CourseBatchDetailResponse.model_construct(id=i, **dict(detail))
+            .model_dump_json()
+            .encode()
+            + b"\n"
+            for i, detail in details.items()
+        )
 
+    @classmethod
+    def _snapshot_export(cls, snapshot: CatalogSnapshot) -> Iterator[bytes]:
+        course_ids = sorted(snapshot.details)
+        chunk_size = settings.COURSE_EXPORT_CHUNK_SIZE
+        for start in range(0, len(course_ids), chunk_size):
+            chunk = course_ids[start : start + chunk_size]
+            yield cls._to_export_lines({i: snapshot.details[i] for i in chunk})
+
+    @staticmethod
+    def _to_handouts_response(db_course: Course) -> CourseHandoutsResponse:
         handout_schemas = [
             HandoutResponse(language_code=h.language_code, url=h.url)
             for h in db_course.handouts
@@ -113,43 +456,641 @@ class CourseCRUD(CRUDBase[Course, None, None]):
 
         return CourseHandoutsResponse(handouts=handout_schemas)
 
-    def get_additional_materials(
-        self, db: Session, course_id: int
-    ) -> CourseAdditionalMaterialsResponse | None:
-        db_course = (
-            db.query(self.model).filter(self.model.id == course_id).one_or_none()
+    @staticmethod
+    def _checked_closure(rows: list[Row], course_id: int) -> list[Row] | None:
+        if not rows:
+            return None
+        if any(r.id == course_id and r.depth > 0 for r in rows):
+            raise PrerequisiteCycleError(
+                f"Prerequisite cycle through course {course_id}"
+            )
+        return rows
+
+    @staticmethod
+    def _closure_to_nodes(
+        rows: list[Row] | None,
+        course_id: int,
+        include_course: bool = False,
+        direct: bool = False,
+    ) -> list[CourseNodeResponse] | None:
+        if rows is None:
+            return None
+        return [
+            CourseNodeResponse(id=r.id, course_name=r.course_name)
+            for r in rows
+            if (include_course or r.id != course_id)
+            and (not direct or r.min_depth == 1)
+        ]
+
+    @staticmethod
+    def _to_prerequisites_response(
+        prerequisites: list[CourseNodeResponse] | None,
+    ) -> CoursePrerequisitesResponse | None:
+        if prerequisites is None:
+            return None
+        return CoursePrerequisitesResponse(prerequisites=prerequisites)
+
+    @staticmethod
+    def _to_learning_path_response(
+        steps: list[CourseNodeResponse] | None,
+    ) -> CourseLearningPathResponse | None:
+        if steps is None:
+            return None
+        return CourseLearningPathResponse(steps=steps)
+
+    @staticmethod
+    def _rows_to_handouts_response(rows: list[Row]) -> CourseHandoutsResponse | None:
+        if not rows:
+            return None
+
+        return CourseHandoutsResponse(
+            handouts=[
+                HandoutResponse(language_code=r.language_code, url=r.url)
+                for r in rows
+                if r.url is not None
+            ]
         )
 
-        if not db_course:
+    @staticmethod
+    def _rows_to_additional_materials_response(
+        rows: list[Row],
+    ) -> CourseAdditionalMaterialsResponse | None:
+        if not rows:
             return None
 
+        return CourseAdditionalMaterialsResponse(
+            additional_materials=[r.url for r in rows if r.url is not None]
+        )
+
+    @staticmethod
+    def _to_additional_materials_response(
+        db_course: Course,
+    ) -> CourseAdditionalMaterialsResponse:
         additional_materials_list = [m.url for m in db_course.additional_materials]
 
         return CourseAdditionalMaterialsResponse(
             additional_materials=additional_materials_list
         )
 
-    def get_all_formats(self, db: Session) -> CourseFormatsResponse:
-        db_formats = db.scalars(select(Format)).all()
+    @staticmethod
+    def _to_formats_response(db_formats: list[Format]) -> CourseFormatsResponse:
         return CourseFormatsResponse(formats=[str(f.format_name) for f in db_formats])
 
-    def get_all_levels(self, db: Session) -> CourseLevelsResponse:
-        db_levels = db.scalars(select(Level)).all()
+    @staticmethod
+    def _to_levels_response(db_levels: list[Level]) -> CourseLevelsResponse:
         return CourseLevelsResponse(
             levels=[str(level.level_name) for level in db_levels]
         )
 
-    def get_all_series(self, db: Session) -> CourseSeriesResponse:
-        db_series = db.scalars(select(Series)).all()
+    @staticmethod
+    def _to_series_response(db_series: list[Series]) -> CourseSeriesResponse:
         return CourseSeriesResponse(series=[str(s.series_name) for s in db_series])
 
-    def get_all_languages(self, db: Session) -> CourseLanguagesResponse:
-        db_langs = db.scalars(select(Language)).all()
+    @staticmethod
+    def _to_languages_response(db_langs: list[Language]) -> CourseLanguagesResponse:
         return CourseLanguagesResponse(
             languages={
                 str(lang.language_name): str(lang.language_code) for lang in db_langs
             }
         )
 
+    def build_catalog_snapshot(self, db: Session) -> CatalogSnapshot:
+        """Load every course with its relationships and build all read responses."""
+        # Read first: a reseed committed while loading makes the snapshot look
+        # older than it is, so it is rebuilt once more rather than never
+        version = catalog_version_crud.get_latest_version(db)
+        # Same order as unfiltered /courses/all pages, so snapshot cursors match
+        name_order = self._sort_keys(CourseNodeQuery())
+        db_courses = db.scalars(self._detail_statement().order_by(*name_order)).all()
+
+        def build_valid(to_response: Callable[[Course], BaseModel]) -> dict:
+            responses = {}
+            for db_course in db_courses:
+                try:
+                    responses[db_course.id] = to_response(db_course)
+                except ValidationError as e:
+                    log.warning(
+                        f"Course {db_course.id} left out of catalog snapshot: {e}"
+                    )
+            return responses
+
+        courses = [CourseNodeResponse.model_validate(c) for c in db_courses]
+        return CatalogSnapshot(
+            courses=courses,
+            index=BitmapIndex.build(
+                len(db_courses),
+                {
+                    "level": [[c.level.level_name] for c in db_courses],
+                    "format": [[c.format.format_name] for c in db_courses],
+                    "series": [
+                        [cs.series.series_name for cs in c.courses_in_series]
+                        for c in db_courses
+                    ],
+                },
+            ),
+            prerequisites=PrerequisiteGraph.build(
+                courses, [(c.id, p.prereq_id) for c in db_courses for p in c.prereqs]
+            ),
+            details=build_valid(self._to_detail_response),
+            handouts=build_valid(self._to_handouts_response),
+            additional_materials=build_valid(self._to_additional_materials_response),
+            upcoming_links={
+                c.id: upcoming_sessions_link(c.course_name) for c in db_courses
+            },
+            formats=self._to_formats_response(db.scalars(select(Format)).all()),
+            levels=self._to_levels_response(db.scalars(select(Level)).all()),
+            series=self._to_series_response(db.scalars(select(Series)).all()),
+            languages=self._to_languages_response(db.scalars(select(Language)).all()),
+            catalog_version=version,
+        )
+
+    def build_recommendation_engine(self, db: Session) -> RecommendationEngine:
+        """Load the columns the recommendation features need, in four queries."""
+        db_courses = db.execute(
+            select(
+                self.model.id,
+                self.model.course_name,
+                self.model.level_id,
+                self.model.format_id,
+            ).order_by(*self._sort_keys(CourseNodeQuery()))
+        ).all()
+        return RecommendationEngine.build(
+            [
+                CourseNodeResponse(id=c.id, course_name=c.course_name)
+                for c in db_courses
+            ],
+            [c.level_id for c in db_courses],
+            [c.format_id for c in db_courses],
+            db.execute(select(CourseSeries.course_id, CourseSeries.series_id)).tuples(),
+            db.execute(select(Prerequisite.course_id, Prerequisite.prereq_id)).tuples(),
+        )
+
+    def reload_catalog(self, db: Session) -> CatalogSnapshot | None:
+        """Reload hook: rebuild the catalog snapshot and swap it in atomically.
+
+        Called at startup and by `refresh_catalog_version` when the database
+        holds a newer catalog version. Requests already being served keep the
+        snapshot they started with. Cached responses are dropped.
+
+        A catalog whose prerequisites form a cycle is not swapped in: the
+        current snapshot keeps being served (none at startup, so reads go to
+        the database) and is returned.
+        """
+        try:
+            snapshot = self.build_catalog_snapshot(db)
+        except PrerequisiteCycleError as e:
+            log.error(f"Catalog snapshot not reloaded: {e}")
+            return self._catalog_snapshot()
+        snapshot = catalog_store.swap(snapshot)
+        response_cache.invalidate()
+        return snapshot
+
+    def _snapshot_is_behind(self, version: str | None) -> bool:
+        snapshot = self._catalog_snapshot()
+        return snapshot is not None and snapshot.catalog_version != version
+
+    def _reload_if_behind(self, db: Session, version: str | None) -> str | None:
+        """Reload the snapshot if it wasn't built from `version`; returns the
+        version the snapshot is now built from, which is still the old one if
+        the reload was refused."""
+        with _reload_lock:
+            if self._snapshot_is_behind(version):
+                log.info(f"Catalog version changed to {version}; reloading")
+                version = self.reload_catalog(db).catalog_version
+        return version
+
+    def _reload_if_behind_managed(self, version: str | None) -> str | None:
+        with get_managed_db() as db:
+            return self._reload_if_behind(db, version)
+
+    @staticmethod
+    def _set_catalog_version(version: str | None) -> None:
+        if catalog_version_tracker.version not in (None, version):
+            response_cache.invalidate()
+        catalog_version_tracker.set(version)
+
+    def refresh_catalog_version(self, db: Session) -> str | None:
+        """Version of the catalog being served, the latest one re-read from
+        the database at most once per CATALOG_VERSION_TTL_SECONDS.
+
+        Seeding writes a new version, usually from another process. When the
+        catalog snapshot was built from an older one, it is reloaded before
+        the tracker moves on, so every worker serves a reseeded catalog within
+        one TTL, without a restart. Cached responses of the old version are
+        dropped.
+        """
+        if catalog_version_tracker.is_stale():
+            version = catalog_version_crud.get_latest_version(db)
+            if self._snapshot_is_behind(version):
+                version = self._reload_if_behind(db, version)
+            self._set_catalog_version(version)
+        return served_catalog_version()
+
+    async def refresh_catalog_version_async(self, db: AsyncSession) -> str | None:
+        """`refresh_catalog_version` for the async course router. The snapshot
+        is built from sync ORM queries, so a reload runs off the event loop."""
+        if catalog_version_tracker.is_stale():
+            version = await catalog_version_crud.get_latest_version_async(db)
+            if self._snapshot_is_behind(version):
+                version = await asyncio.to_thread(
+                    self._reload_if_behind_managed, version
+                )
+            self._set_catalog_version(version)
+        return served_catalog_version()
+
+    def get_multiple_filtered(
+        self, db: Session, query_params: CourseNodeQuery
+    ) -> CourseNodePage:
+        """Page of matching courses. Raises `InvalidCursorError` for bad cursors."""
+        # Ranked search needs the tsvector index, so it always goes to the database
+        if not query_params.search and (snapshot := self._catalog_snapshot()):
+            return snapshot.filter_courses(query_params)
+
+        statement = self._page_statement(query_params)
+        db_courses, next_cursor = keyset_page(
+            db.execute(statement).all(), query_params.limit
+        )
+
+        return self._to_page_response(db_courses, next_cursor)
+
+    def get_facets(
+        self, db: Session, query_params: CourseNodeQuery
+    ) -> CourseFacetsResponse:
+        """Page of matching courses with per-value counts of every filter, from
+        one grouped query. Raises `InvalidCursorError` for bad cursors."""
+        if not query_params.search and (snapshot := self._catalog_snapshot()):
+            return snapshot.facets(query_params)
+
+        page = self.get_multiple_filtered(db, query_params=query_params)
+        rows = db.execute(self._facets_statement(query_params)).all()
+        return self._to_facets_response(page, rows)
+
+    def get_detail(self, db: Session, course_id: int) -> CourseDetailResponse | None:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.details.get(course_id)
+
+        if settings.COURSE_DETAIL_VIEW_ENABLED:
+            document = db.scalar(
+                select(course_details.c.detail).where(course_details.c.id == course_id)
+            )
+            if document is None:
+                return None
+            return self._valid_documents([(course_id, document)]).get(course_id)
+
+        db_course = db.scalars(
+            self._detail_statement().where(self.model.id == course_id)
+        ).one_or_none()
+
+        if not db_course:
+            return None
+
+        return self._valid_details([db_course]).get(course_id)
+
+    def get_details_many(
+        self, db: Session, course_ids: list[int]
+    ) -> CourseBatchResponse:
+        """Details of several courses in the statements of `get_detail`."""
+        if snapshot := self._catalog_snapshot():
+            return self._to_batch_response(course_ids, snapshot.details)
+
+        if settings.COURSE_DETAIL_VIEW_ENABLED:
+            rows = db.execute(
+                select(course_details).where(course_details.c.id.in_(course_ids))
+            ).all()
+            return self._to_batch_response(course_ids, self._valid_documents(rows))
+
+        db_courses = db.scalars(
+            self._detail_statement().where(self.model.id.in_(course_ids))
+        ).all()
+
+        return self._to_batch_response(course_ids, self._valid_details(db_courses))
+
+    def export_details(self, db: Session) -> Iterator[bytes]:
+        """Details of every course as NDJSON, ordered by id, one chunk of lines
+        at a time. The session only holds weak references to loaded courses, so
+        each chunk is freed once written and memory stays flat whatever the size
+        of the catalog."""
+        if snapshot := self._catalog_snapshot():
+            yield from self._snapshot_export(snapshot)
+            return
+
+        for db_courses in db.scalars(self._export_statement()).partitions():
+            yield self._to_export_lines(self._valid_details(db_courses))
+
+    def get_upcoming(self, db: Session, course_id: int) -> HttpUrl | None:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.upcoming_links.get(course_id)
+
+        course_name = db.scalar(
+            select(self.model.course_name).where(self.model.id == course_id)
+        )
+
+        if not course_name:
+            return None
+
+        return upcoming_sessions_link(course_name)
+
+    def get_handouts(
+        self, db: Session, course_id: int
+    ) -> CourseHandoutsResponse | None:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.handouts.get(course_id)
+
+        rows = db.execute(
+            self._course_rows_statement(
+                course_id, Handout, Handout.language_code, Handout.url
+            )
+        ).all()
+
+        return self._rows_to_handouts_response(rows)
+
+    def get_additional_materials(
+        self, db: Session, course_id: int
+    ) -> CourseAdditionalMaterialsResponse | None:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.additional_materials.get(course_id)
+
+        rows = db.execute(
+            self._course_rows_statement(
+                course_id, AdditionalMaterial, AdditionalMaterial.url
+            )
+        ).all()
+
+        return self._rows_to_additional_materials_response(rows)
+
+    def _prerequisite_closure(
+        self, db: Session, course_id: int, unlocks: bool, max_depth: int
+    ) -> list[Row] | None:
+        rows = db.execute(self._closure_statement(course_id, unlocks, max_depth)).all()
+        return self._checked_closure(rows, course_id)
+
+    def get_ancestry(
+        self, db: Session, course_id: int, max_depth: int = PREREQUISITE_MAX_DEPTH
+    ) -> list[CourseNodeResponse] | None:
+        """Every course that `course_id` transitively requires, up to `max_depth`
+        levels away, in learning order; one query, no catalog snapshot needed.
+        """
+        rows = self._prerequisite_closure(db, course_id, False, max_depth)
+        return self._closure_to_nodes(rows, course_id)
+
+    def get_unlocks(
+        self, db: Session, course_id: int, max_depth: int = PREREQUISITE_MAX_DEPTH
+    ) -> list[CourseNodeResponse] | None:
+        """Every course that transitively requires `course_id`, up to `max_depth`
+        levels away, nearest first; one query, no catalog snapshot needed.
+        """
+        rows = self._prerequisite_closure(db, course_id, True, max_depth)
+        return self._closure_to_nodes(rows, course_id)
+
+    def get_prerequisites(
+        self, db: Session, course_id: int, transitive: bool = False
+    ) -> CoursePrerequisitesResponse | None:
+        if snapshot := self._catalog_snapshot():
+            prerequisites = snapshot.prerequisites.prerequisites(course_id, transitive)
+        else:
+            rows = self._prerequisite_closure(
+                db, course_id, False, PREREQUISITE_MAX_DEPTH
+            )
+            prerequisites = self._closure_to_nodes(
+                rows, course_id, direct=not transitive
+            )
+
+        return self._to_prerequisites_response(prerequisites)
+
+    def get_learning_path(
+        self, db: Session, course_id: int
+    ) -> CourseLearningPathResponse | None:
+        if snapshot := self._catalog_snapshot():
+            steps = snapshot.prerequisites.learning_path(course_id)
+        else:
+            rows = self._prerequisite_closure(
+                db, course_id, False, PREREQUISITE_MAX_DEPTH
+            )
+            steps = self._closure_to_nodes(rows, course_id, include_course=True)
+
+        return self._to_learning_path_response(steps)
+
+    def get_all_formats(self, db: Session) -> CourseFormatsResponse:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.formats
+
+        return self._to_formats_response(db.scalars(select(Format)).all())
+
+    def get_all_levels(self, db: Session) -> CourseLevelsResponse:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.levels
+
+        return self._to_levels_response(db.scalars(select(Level)).all())
+
+    def get_all_series(self, db: Session) -> CourseSeriesResponse:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.series
+
+        return self._to_series_response(db.scalars(select(Series)).all())
+
+    def get_all_languages(self, db: Session) -> CourseLanguagesResponse:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.languages
+
+        return self._to_languages_response(db.scalars(select(Language)).all())
+
+    # Async versions for AsyncSession. Relationships can't be lazy loaded on the
+    # event loop, so every relationship the response needs is loaded up front.
+    async def get_multiple_filtered_async(
+        self, db: AsyncSession, query_params: CourseNodeQuery
+    ) -> CourseNodePage:
+        # Ranked search needs the tsvector index, so it always goes to the database
+        if not query_params.search and (snapshot := self._catalog_snapshot()):
+            return snapshot.filter_courses(query_params)
+
+        statement = self._page_statement(query_params)
+        db_courses, next_cursor = keyset_page(
+            (await db.execute(statement)).all(), query_params.limit
+        )
+
+        return self._to_page_response(db_courses, next_cursor)
+
+    async def get_facets_async(
+        self, db: AsyncSession, query_params: CourseNodeQuery
+    ) -> CourseFacetsResponse:
+        if not query_params.search and (snapshot := self._catalog_snapshot()):
+            return snapshot.facets(query_params)
+
+        page = await self.get_multiple_filtered_async(db, query_params=query_params)
+        rows = (await db.execute(self._facets_statement(query_params))).all()
+        return self._to_facets_response(page, rows)
+
+    async def get_detail_async(
+        self, db: AsyncSession, course_id: int
+    ) -> CourseDetailResponse | None:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.details.get(course_id)
+
+        if settings.COURSE_DETAIL_VIEW_ENABLED:
+            document = await db.scalar(
+                select(course_details.c.detail).where(course_details.c.id == course_id)
+            )
+            if document is None:
+                return None
+            return self._valid_documents([(course_id, document)]).get(course_id)
+
+        db_course = (
+            await db.scalars(self._detail_statement().where(self.model.id == course_id))
+        ).one_or_none()
+
+        if not db_course:
+            return None
+
+        return self._valid_details([db_course]).get(course_id)
+
+    async def get_details_many_async(
+        self, db: AsyncSession, course_ids: list[int]
+    ) -> CourseBatchResponse:
+        if snapshot := self._catalog_snapshot():
+            return self._to_batch_response(course_ids, snapshot.details)
+
+        if settings.COURSE_DETAIL_VIEW_ENABLED:
+            rows = (
+                await db.execute(
+                    select(course_details).where(course_details.c.id.in_(course_ids))
+                )
+            ).all()
+            return self._to_batch_response(course_ids, self._valid_documents(rows))
+
+        db_courses = (
+            await db.scalars(
+                self._detail_statement().where(self.model.id.in_(course_ids))
+            )
+        ).all()
+
+        return self._to_batch_response(course_ids, self._valid_details(db_courses))
+
+    async def export_details_async(self, db: AsyncSession) -> AsyncIterator[bytes]:
+        if snapshot := self._catalog_snapshot():
+            for lines in self._snapshot_export(snapshot):
+                yield lines
+            return
+
+        result = await db.stream_scalars(self._export_statement())
+        async for db_courses in result.partitions():
+            yield self._to_export_lines(self._valid_details(db_courses))
+
+    async def get_upcoming_async(
+        self, db: AsyncSession, course_id: int
+    ) -> HttpUrl | None:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.upcoming_links.get(course_id)
+
+        course_name = await db.scalar(
+            select(self.model.course_name).where(self.model.id == course_id)
+        )
+
+        if not course_name:
+            return None
+
+        return upcoming_sessions_link(course_name)
+
+    async def get_handouts_async(
+        self, db: AsyncSession, course_id: int
+    ) -> CourseHandoutsResponse | None:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.handouts.get(course_id)
+
+        result = await db.execute(
+            self._course_rows_statement(
+                course_id, Handout, Handout.language_code, Handout.url
+            )
+        )
+
+        return self._rows_to_handouts_response(result.all())
+
+    async def get_additional_materials_async(
+        self, db: AsyncSession, course_id: int
+    ) -> CourseAdditionalMaterialsResponse | None:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.additional_materials.get(course_id)
+
+        result = await db.execute(
+            self._course_rows_statement(
+                course_id, AdditionalMaterial, AdditionalMaterial.url
+            )
+        )
+
+        return self._rows_to_additional_materials_response(result.all())
+
+    async def _prerequisite_closure_async(
+        self, db: AsyncSession, course_id: int, unlocks: bool, max_depth: int
+    ) -> list[Row] | None:
+        result = await db.execute(
+            self._closure_statement(course_id, unlocks, max_depth)
+        )
+        return self._checked_closure(result.all(), course_id)
+
+    async def get_ancestry_async(
+        self, db: AsyncSession, course_id: int, max_depth: int = PREREQUISITE_MAX_DEPTH
+    ) -> list[CourseNodeResponse] | None:
+        rows = await self._prerequisite_closure_async(db, course_id, False, max_depth)
+        return self._closure_to_nodes(rows, course_id)
+
+    async def get_unlocks_async(
+        self, db: AsyncSession, course_id: int, max_depth: int = PREREQUISITE_MAX_DEPTH
+    ) -> list[CourseNodeResponse] | None:
+        rows = await self._prerequisite_closure_async(db, course_id, True, max_depth)
+        return self._closure_to_nodes(rows, course_id)
+
+    async def get_prerequisites_async(
+        self, db: AsyncSession, course_id: int, transitive: bool = False
+    ) -> CoursePrerequisitesResponse | None:
+        if snapshot := self._catalog_snapshot():
+            prerequisites = snapshot.prerequisites.prerequisites(course_id, transitive)
+        else:
+            rows = await self._prerequisite_closure_async(
+                db, course_id, False, PREREQUISITE_MAX_DEPTH
+            )
+            prerequisites = self._closure_to_nodes(
+                rows, course_id, direct=not transitive
+            )
+
+        return self._to_prerequisites_response(prerequisites)
+
+    async def get_learning_path_async(
+        self, db: AsyncSession, course_id: int
+    ) -> CourseLearningPathResponse | None:
+        if snapshot := self._catalog_snapshot():
+            steps = snapshot.prerequisites.learning_path(course_id)
+        else:
+            rows = await self._prerequisite_closure_async(
+                db, course_id, False, PREREQUISITE_MAX_DEPTH
+            )
+            steps = self._closure_to_nodes(rows, course_id, include_course=True)
+
+        return self._to_learning_path_response(steps)
+
+    async def get_all_formats_async(self, db: AsyncSession) -> CourseFormatsResponse:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.formats
+
+        return self._to_formats_response((await db.scalars(select(Format))).all())
+
+    async def get_all_levels_async(self, db: AsyncSession) -> CourseLevelsResponse:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.levels
+
+        return self._to_levels_response((await db.scalars(select(Level))).all())
+
+    async def get_all_series_async(self, db: AsyncSession) -> CourseSeriesResponse:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.series
+
+        return self._to_series_response((await db.scalars(select(Series))).all())
+
+    async def get_all_languages_async(
+        self, db: AsyncSession
+    ) -> CourseLanguagesResponse:
+        if snapshot := self._catalog_snapshot():
+            return snapshot.languages
+
+        return self._to_languages_response((await db.scalars(select(Language))).all())
+
 
 course_crud = CourseCRUD(model=Course)
@@ -1,35 +1,115 @@
+import logging
+from itertools import batched
+from typing import Iterable
+
+from pydantic import BaseModel
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from techconnect_classes_api.core.security import verify_password
+from techconnect_classes_api.core.security import password_hasher
 from techconnect_classes_api.models import User
+from techconnect_classes_api.services.auth_cache import user_cache
 
 from .base import CRUDBase
 
+log = logging.getLogger(__name__)
+
 
 class UserCRUD(CRUDBase):
     def get_user(self, db: Session, username: str) -> User | None:
         return self.get(db, self.model.username == username)
 
+    def _insert_new_users_statement(self):
+        """INSERT that skips usernames already taken and returns the new ids."""
+        return (
+            insert(self.model)
+            .on_conflict_do_nothing(index_elements=[self.model.username])
+            .returning(self.model.id)
+        )
+
+    def create_user(
+        self, db: Session, username: str, hashed_password: str
+    ) -> int | None:
+        """Insert a user in one statement; None if the username is taken.
+
+        The uniqueness check is the insert itself, so concurrent sign-ups of
+        the same username can't both succeed.
+        """
+        user_id = db.scalar(
+            self._insert_new_users_statement().values(
+                username=username, hashed_password=hashed_password
+            )
+        )
+        db.commit()
+        return user_id
+
+    def bulk_import(
+        self,
+        db: Session,
+        users: Iterable[tuple[str, str]],
+        batch_size: int = 1000,
+    ) -> int:
+        """Insert (username, bcrypt hash) pairs from any iterable, one multi-row
+        INSERT and commit per `batch_size` users, so memory stays flat and a
+        failed batch doesn't undo earlier ones. Existing usernames are
+        skipped. Returns the number of users created.
+
+        Raises `ValueError` for a password that is not a bcrypt hash; batches
+        before it stay imported.
+        """
+        statement = self._insert_new_users_statement()
+        created = 0
+        for batch in batched(users, batch_size):
+            rows = []
+            for username, hashed_password in batch:
+                if password_hasher.context.identify(hashed_password) != "bcrypt":
+                    raise ValueError(f"Password of '{username}' is not a bcrypt hash")
+                rows.append({"username": username, "hashed_password": hashed_password})
+            created += len(db.scalars(statement, rows).all())
+            db.commit()
+            log.info(f"Imported {created} users")
+        return created
+
     def authenticate_user(
         self, db: Session, username: str, password: str
     ) -> User | None:
-        """Authenticate user on login"""
+        """Authenticate user on login. A stored hash of an outdated bcrypt cost is
+        replaced with one of the current cost."""
         user = self.get_user(db, username)
         if not user:
             return None
-        if not verify_password(password, str(user.hashed_password)):
+        valid, new_hash = password_hasher.verify_and_update(
+            password, str(user.hashed_password)
+        )
+        if not valid:
             return None
+        if new_hash is not None:
+            user.hashed_password = new_hash
+            db.add(user)
+            db.commit()
+            db.refresh(user)
         return user
 
     @staticmethod
     def is_active_user(user: User) -> bool:
         return user.is_active
 
+    def update(self, db: Session, *, db_obj: User, obj_in: BaseModel) -> User:
+        user = super().update(db, db_obj=db_obj, obj_in=obj_in)
+        user_cache.invalidate(user.id)
+        return user
+
+    def delete(self, db: Session, *, id: int) -> User | None:
+        user = super().delete(db, id=id)
+        user_cache.invalidate(id)
+        return user
+
     def deactivate_user(self, db: Session, user: User) -> User:
         user.is_active = False
         db.add(user)
         db.commit()
         db.refresh(user)
+        user_cache.invalidate(user.id)
         return user
 
 
@@ -0,0 +1,108 @@
+import logging
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from techconnect_classes_api.models import (
+    Course,
+    CourseTaken,
+    Series,
+    SeriesInterested,
+    User,
+)
+
+from .base import CRUDBase
+
+log = logging.getLogger(__name__)
+
+
+class UnknownItemsError(ValueError):
+    """Raised when an update names courses or series that don't exist."""
+
+
+class UserSelectionCRUD(CRUDBase):
+    """A user's set of courses or series, stored as (user_id, item_id) rows of
+    `model`. Items are named by `key` (an id or a unique name) in requests and
+    listed as (id, name) rows ordered by name.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        item_id: ColumnElement,
+        item: Any,
+        name: ColumnElement,
+        key: ColumnElement,
+    ) -> None:
+        super().__init__(model)
+        self.item_id = item_id
+        self.item = item
+        self.name = name
+        self.key = key
+
+    def get_items(self, db: Session, user_id: int) -> list[Row]:
+        """The user's items with their names, in one joined query."""
+        return db.execute(
+            select(self.item.id, self.name)
+            .join(self.model, self.item_id == self.item.id)
+            .where(self.model.user_id == user_id)
+            .order_by(self.name)
+        ).all()
+
+    def get_item_ids(self, db: Session, user_id: int) -> list[int]:
+        """The ids of the user's items, without joining the items' table."""
+        return list(
+            db.scalars(select(self.item_id).where(self.model.user_id == user_id))
+        )
+
+    def replace_items(self, db: Session, user_id: int, keys: list) -> list[Row]:
+        """Make the user's items exactly `keys` in one transaction: rows of
+        items no longer listed are deleted and the new ones inserted, each in
+        one statement, whatever the size of the lists. Raises
+        `UnknownItemsError`, changing nothing, if any key doesn't exist.
+
+        The user's row is locked first, so concurrent replacements of the same
+        user apply one after the other instead of interleaving.
+        """
+        db.execute(select(User.id).where(User.id == user_id).with_for_update())
+        items = db.execute(
+            select(self.item.id, self.name, self.key.label("key"))
+            .where(self.key.in_(keys))
+            .order_by(self.name)
+        ).all()
+        unknown = set(keys) - {item.key for item in items}
+        if unknown:
+            db.rollback()
+            raise UnknownItemsError(
+                f"Unknown {self.item.__tablename__}: {sorted(unknown)}"
+            )
+
+        item_ids = [item.id for item in items]
+        db.execute(
+            delete(self.model).where(
+                self.model.user_id == user_id, self.item_id.not_in(item_ids)
+            )
+        )
+        if item_ids:
+            db.execute(
+                insert(self.model)
+                .values([{"user_id": user_id, self.item_id.name: i} for i in item_ids])
+                .on_conflict_do_nothing()
+            )
+        db.commit()
+        log.debug(f"{self.model.__name__} of user {user_id}: {len(item_ids)} items")
+        return [item[:2] for item in items]
+
+
+courses_taken_crud = UserSelectionCRUD(
+    CourseTaken, CourseTaken.course_id, Course, Course.course_name, Course.id
+)
+series_interested_crud = UserSelectionCRUD(
+    SeriesInterested,
+    SeriesInterested.series_id,
+    Series,
+    Series.series_name,
+    Series.series_name,
+)
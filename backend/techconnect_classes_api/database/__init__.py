@@ -1,3 +1,19 @@
-from techconnect_classes_api.database.db import get_db, get_managed_db, get_sqlalchemy_db_url
-from techconnect_classes_api.database.session import get_engine, get_local_session
+from techconnect_classes_api.database.db import (
+    close_async_db,
+    close_db,
+    get_async_db,
+    get_db,
+    get_db_engine,
+    get_managed_async_db,
+    get_managed_db,
+    get_sqlalchemy_async_db_url,
+    get_sqlalchemy_db_url,
+    init_async_db,
+    init_db,
+)
+from techconnect_classes_api.database.session import (
+    get_async_engine,
+    get_engine,
+    get_local_session,
+)
 from techconnect_classes_api.database.utils import show_tables
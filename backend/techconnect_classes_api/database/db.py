@@ -1,12 +1,15 @@
 import logging
-from contextlib import contextmanager
-from typing import Generator, TypeVar
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator, TypeVar
 
 from sqlalchemy import MetaData
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy.orm import declarative_base, sessionmaker
 
 from techconnect_classes_api.core.config import Settings, settings
-from techconnect_classes_api.database.session import get_local_session
+from techconnect_classes_api.database.session import get_async_engine, get_engine
 
 log = logging.getLogger(__name__)
 
@@ -24,15 +27,99 @@ Base = declarative_base(
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Process-wide pooled engine and the session factory bound to it
+_engine: Engine | None = None
+_session_local: sessionmaker | None = None
+_session_local_lock = threading.Lock()
+
+# Async counterparts, used when the course routes run on the event loop
+_async_engine: AsyncEngine | None = None
+_async_session_local: async_sessionmaker | None = None
+
 
 def get_sqlalchemy_db_url(_settings: Settings) -> str:
     return f"postgresql://{_settings.POSTGRES_USER}:{_settings.POSTGRES_PASSWORD}@{_settings.POSTGRES_HOST}:{_settings.POSTGRES_PORT}/{_settings.POSTGRES_DB}"
 
 
+def get_sqlalchemy_async_db_url(_settings: Settings) -> str:
+    return f"postgresql+asyncpg://{_settings.POSTGRES_USER}:{_settings.POSTGRES_PASSWORD}@{_settings.POSTGRES_HOST}:{_settings.POSTGRES_PORT}/{_settings.POSTGRES_DB}"
+
+
+def init_db(_settings: Settings = settings) -> sessionmaker:
+    """Create the pooled engine and session factory shared by the whole process.
+
+    Called once from the application lifespan. Calling it again returns the
+    existing factory, so it is also safe to use lazily from scripts.
+    """
+    global _engine, _session_local
+    with _session_local_lock:
+        if _session_local is None:
+            log.info(
+                f"Creating database engine (pool_size={_settings.POSTGRES_POOL_SIZE}, max_overflow={_settings.POSTGRES_MAX_OVERFLOW})"
+            )
+            _engine = get_engine(
+                get_sqlalchemy_db_url(_settings),
+                pool_size=_settings.POSTGRES_POOL_SIZE,
+                max_overflow=_settings.POSTGRES_MAX_OVERFLOW,
+                pool_recycle=_settings.POSTGRES_POOL_RECYCLE,
+                pool_pre_ping=_settings.POSTGRES_POOL_PRE_PING,
+            )
+            _session_local = sessionmaker(
+                autocommit=False, autoflush=False, bind=_engine
+            )
+        return _session_local
+
+
+def get_db_engine() -> Engine:
+    """Return the process-wide pooled engine, creating it if needed."""
+    init_db()
+    return _engine
+
+
+def close_db() -> None:
+    """Dispose the process-wide engine and close all pooled connections."""
+    global _engine, _session_local
+    with _session_local_lock:
+        if _engine is not None:
+            log.info("Disposing database engine")
+            _engine.dispose()
+        _engine = None
+        _session_local = None
+
+
+def init_async_db(_settings: Settings = settings) -> async_sessionmaker:
+    """Create the pooled async engine and `AsyncSession` factory for the process."""
+    global _async_engine, _async_session_local
+    if _async_session_local is None:
+        log.info(
+            f"Creating async database engine (pool_size={_settings.POSTGRES_POOL_SIZE}, max_overflow={_settings.POSTGRES_MAX_OVERFLOW})"
+        )
+        _async_engine = get_async_engine(
+            get_sqlalchemy_async_db_url(_settings),
+            pool_size=_settings.POSTGRES_POOL_SIZE,
+            max_overflow=_settings.POSTGRES_MAX_OVERFLOW,
+            pool_recycle=_settings.POSTGRES_POOL_RECYCLE,
+            pool_pre_ping=_settings.POSTGRES_POOL_PRE_PING,
+        )
+        _async_session_local = async_sessionmaker(
+            autoflush=False, expire_on_commit=False, bind=_async_engine
+        )
+    return _async_session_local
+
+
+async def close_async_db() -> None:
+    """Dispose the async engine and close all pooled connections."""
+    global _async_engine, _async_session_local
+    if _async_engine is not None:
+        log.info("Disposing async database engine")
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_local = None
+
+
 def get_db() -> Generator:
     log.debug("Getting database session")
-    database_url = get_sqlalchemy_db_url(settings)
-    session_local = get_local_session(database_url)
+    session_local = init_db()
     db = session_local()
     try:
         yield db
@@ -44,11 +131,27 @@ def get_db() -> Generator:
 @contextmanager
 def get_managed_db() -> Generator:
     log.debug("Getting database session")
-    database_url = get_sqlalchemy_db_url(settings)
-    session_local = get_local_session(database_url)
+    session_local = init_db()
     db = session_local()
     try:
         yield db
     finally:
         log.debug("Closing database session")
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator:
+    log.debug("Getting async database session")
+    session_local = init_async_db()
+    async with session_local() as db:
+        yield db
+        log.debug("Closing async database session")
+
+
+@asynccontextmanager
+async def get_managed_async_db() -> AsyncGenerator:
+    log.debug("Getting async database session")
+    session_local = init_async_db()
+    async with session_local() as db:
+        yield db
+        log.debug("Closing async database session")
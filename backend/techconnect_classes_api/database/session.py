@@ -1,12 +1,21 @@
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 
-def get_engine(database_url: str, echo: bool = False) -> Engine:
-    return create_engine(url=database_url, echo=echo)
+def get_engine(database_url: str, echo: bool = False, **pool_options) -> Engine:
+    return create_engine(url=database_url, echo=echo, **pool_options)
 
 
-def get_local_session(database_url: str, echo: bool = False) -> sessionmaker:
-    engine = get_engine(database_url, echo)
+def get_local_session(
+    database_url: str, echo: bool = False, **pool_options
+) -> sessionmaker:
+    engine = get_engine(database_url, echo, **pool_options)
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def get_async_engine(
+    database_url: str, echo: bool = False, **pool_options
+) -> AsyncEngine:
+    return create_async_engine(url=database_url, echo=echo, **pool_options)
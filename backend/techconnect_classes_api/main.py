@@ -1,3 +1,6 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -5,20 +8,55 @@ from slowapi.errors import RateLimitExceeded
 from techconnect_classes_api.api import (
     auth_router,
     course_router,
-    # recommendation_router,
+    recommendation_router,
     user_router,
 )
+from techconnect_classes_api.api.compression import (
+    CompressionMiddleware,
+    compressed_variants,
+)
 from techconnect_classes_api.api.limiter import limiter
+from techconnect_classes_api.core.config import settings
 from techconnect_classes_api.core.log import setup_logger
+from techconnect_classes_api.core.security import calibrate_rounds, password_hasher
+from techconnect_classes_api.crud.course import course_crud
+from techconnect_classes_api.database import (
+    close_async_db,
+    close_db,
+    get_managed_db,
+    init_async_db,
+    init_db,
+)
 
 setup_logger()
 
-app = FastAPI()
+log = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_db()
+    if settings.PASSWORD_HASH_CALIBRATE:
+        password_hasher.set_rounds(calibrate_rounds(settings.PASSWORD_HASH_TARGET_MS))
+    if settings.ASYNC_COURSE_ROUTES:
+        init_async_db()
+    if settings.CATALOG_CACHE_MODE:
+        with get_managed_db() as db:
+            course_crud.reload_catalog(db)
+    yield
+    log.info(f"Password hashing: {password_hasher.stats()}")
+    close_db()
+    await close_async_db()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(auth_router)
 app.include_router(course_router)
 app.include_router(user_router)
-# app.include_router(recommendation_router)
+app.include_router(recommendation_router)
+
+app.add_middleware(CompressionMiddleware, variants=compressed_variants)
 
 app.state.limiter = limiter
 
@@ -1,5 +1,7 @@
 from techconnect_classes_api.models.additional_material import AdditionalMaterial
+from techconnect_classes_api.models.catalog_version import CatalogVersion
 from techconnect_classes_api.models.course import Course
+from techconnect_classes_api.models.course_detail import course_details
 from techconnect_classes_api.models.format import Format
 from techconnect_classes_api.models.handout import Handout
 from techconnect_classes_api.models.language import Language
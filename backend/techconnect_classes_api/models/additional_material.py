@@ -9,7 +9,7 @@ class AdditionalMaterial(Base):
     __tablename__ = "additional_materials"
 
     id = Column(Integer, primary_key=True)
-    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
+    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False, index=True)
     url = Column(String, nullable=False)
 
     course = relationship("Course", back_populates="additional_materials")
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, func
+from sqlalchemy.types import DateTime, Integer, String
+
+from techconnect_classes_api.database.db import Base
+
+
+class CatalogVersion(Base):
+    """One row per seeding run; the latest row identifies the served catalog."""
+
+    __tablename__ = "catalog_versions"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(String, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
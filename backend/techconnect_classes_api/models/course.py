@@ -1,5 +1,6 @@
-from sqlalchemy import Column, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.types import Integer, String, Text
 
 from techconnect_classes_api.database.db import Base
@@ -11,8 +12,27 @@ class Course(Base):
     id = Column(Integer, primary_key=True)
     course_name = Column(String, nullable=False, unique=True)
     description = Column(Text, nullable=False)
-    level_id = Column(Integer, ForeignKey("levels.id"), nullable=False)
-    format_id = Column(Integer, ForeignKey("formats.id"), nullable=False)
+    level_id = Column(Integer, ForeignKey("levels.id"), nullable=False, index=True)
+    format_id = Column(Integer, ForeignKey("formats.id"), nullable=False, index=True)
+
+    # Names weigh more than descriptions in ts_rank. Deferred so plain course
+    # loads don't pull the vector.
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('english', course_name), 'A') || "
+                "setweight(to_tsvector('english', description), 'B')",
+                persisted=True,
+            ),
+        )
+    )
+
+    __table_args__ = (
+        Index(None, "search_vector", postgresql_using="gin"),
+        # Keyset pagination order; "C" collation sorts like Python str comparison
+        Index("courses_course_name_id_idx", course_name.collate("C"), id),
+    )
 
     level = relationship("Level", back_populates="courses")
     format = relationship("Format", back_populates="courses")
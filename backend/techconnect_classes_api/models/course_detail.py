@@ -0,0 +1,51 @@
+from sqlalchemy import Column, MetaData, Table
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import Integer
+
+# Materialized view, so it is kept out of `Base.metadata` and never created or
+# dropped as a table; scripts/core/create_tables.py manages it.
+course_details = Table(
+    "course_details",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("detail", JSONB, nullable=False),
+)
+
+# One row per course holding its detail document, all but the upcoming
+# sessions link, which is derived from the name. Lists are ordered so the
+# document is stable across refreshes.
+COURSE_DETAILS_QUERY = """
+SELECT
+    c.id,
+    jsonb_build_object(
+        'course_name', c.course_name,
+        'description', c.description,
+        'series', COALESCE(
+            (SELECT jsonb_agg(s.series_name ORDER BY s.series_name)
+             FROM course_series cs JOIN series s ON s.id = cs.series_id
+             WHERE cs.course_id = c.id),
+            '[]'::jsonb),
+        'level', l.level_name,
+        'format', f.format_name,
+        'prereqs', COALESCE(
+            (SELECT jsonb_agg(p.course_name ORDER BY p.course_name)
+             FROM prerequisites pr JOIN courses p ON p.id = pr.prereq_id
+             WHERE pr.course_id = c.id),
+            '[]'::jsonb),
+        'available_handouts', COALESCE(
+            (SELECT jsonb_agg(
+                 jsonb_build_object('language_code', h.language_code, 'url', h.url)
+                 ORDER BY h.id)
+             FROM handouts h
+             WHERE h.course_id = c.id),
+            '[]'::jsonb),
+        'additional_materials', COALESCE(
+            (SELECT jsonb_agg(m.url ORDER BY m.id)
+             FROM additional_materials m
+             WHERE m.course_id = c.id),
+            '[]'::jsonb)
+    ) AS detail
+FROM courses c
+JOIN levels l ON l.id = c.level_id
+JOIN formats f ON f.id = c.format_id
+"""
@@ -9,7 +9,7 @@ class Handout(Base):
     __tablename__ = "handouts"
 
     id = Column(Integer, primary_key=True)
-    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
+    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False, index=True)
     language_code = Column(
         CHAR(length=2), ForeignKey("languages.language_code"), nullable=False
     )
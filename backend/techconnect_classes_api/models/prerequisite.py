@@ -9,7 +9,8 @@ class Prerequisite(Base):
     __tablename__ = "prerequisites"
 
     course_id = Column(Integer, ForeignKey("courses.id"), primary_key=True)
-    prereq_id = Column(Integer, ForeignKey("courses.id"), primary_key=True)
+    # The primary key only serves lookups by course_id
+    prereq_id = Column(Integer, ForeignKey("courses.id"), primary_key=True, index=True)
 
     course = relationship("Course", back_populates="prereqs", foreign_keys=[course_id])
     prereq_course = relationship(
@@ -19,7 +19,8 @@ class CourseSeries(Base):
     __tablename__ = "course_series"
 
     course_id = Column(Integer, ForeignKey("courses.id"), primary_key=True)
-    series_id = Column(Integer, ForeignKey("series.id"), primary_key=True)
+    # The primary key only serves lookups by course_id
+    series_id = Column(Integer, ForeignKey("series.id"), primary_key=True, index=True)
 
     course = relationship("Course", back_populates="courses_in_series")
     series = relationship("Series", back_populates="courses")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
 
 # Base schemas
@@ -15,11 +15,32 @@ class HandoutResponse(BaseModel):
 
 # API endpoint schemas
 class CourseNodeQuery(BaseModel):
-    """Schema for the query parameters of /courses endpoint."""
+    """Schema for the query parameters of /courses endpoint.
+
+    Each filter takes one or more values (`?series=python&series=excel`). A
+    course matches when it has any of the values of a filter, and every given
+    filter has to match. `search` is a web-style full-text query over course
+    names and descriptions; results are then ordered by relevance instead of
+    by name. Pages hold at most `limit` courses.
+    """
+
+    level: list[str] | None = None
+    format: list[str] | None = None
+    series: list[str] | None = None
+    search: str | None = Field(
+        None, max_length=200, examples=["python functions", '"microsoft excel"']
+    )
+    limit: int = Field(100, ge=1, le=500)
+    cursor: str | None = Field(
+        None, description="`next_cursor` of the previous page", max_length=1000
+    )
 
-    level: str | None = None
-    format: str | None = None
-    series: str | None = None
+    @field_validator("level", "format", "series", mode="before")
+    @classmethod
+    def wrap_single_value(cls, value: str | list[str] | None) -> list[str] | None:
+        if isinstance(value, str):
+            return [value]
+        return value
 
 
 class CourseNodeResponse(CourseBase):
@@ -30,6 +51,34 @@ class CourseNodeResponse(CourseBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CourseNodePage(BaseModel):
+    """Schema for a page of the /courses/all endpoint."""
+
+    courses: list[CourseNodeResponse]
+    next_cursor: str | None = Field(
+        None, description="Pass as `cursor` for the next page; null on the last page"
+    )
+
+
+class CourseFacetCounts(BaseModel):
+    """Number of matching courses for each level, format and series.
+
+    The counts of a filter ignore that filter's own values, so every value shows
+    how many courses it would match together with the other filters.
+    """
+
+    level: dict[str, int]
+    format: dict[str, int]
+    series: dict[str, int]
+
+
+class CourseFacetsResponse(CourseNodePage):
+    """Schema for the response from /courses/facets."""
+
+    total: int = Field(..., ge=0, description="Number of matching courses.")
+    facets: CourseFacetCounts
+
+
 class CourseDetailResponse(CourseBase):
     """Schema for the /courses/{id}/ endpoint."""
 
@@ -51,6 +100,57 @@ class CourseDetailResponse(CourseBase):
     )
 
 
+class CourseBatchQuery(BaseModel):
+    """Schema for the query parameters of /courses/batch endpoint.
+
+    Accepts `?ids=1,2,3` as well as repeated `?ids=1&ids=2`.
+    """
+
+    ids: list[int] = Field(..., min_length=1, max_length=100)
+
+    @field_validator("ids", mode="before")
+    @classmethod
+    def split_comma_separated(cls, value: str | list[str]) -> list[str]:
+        values = [value] if isinstance(value, (str, int)) else value
+        parts = ",".join(str(v) for v in values).split(",")
+        return [part.strip() for part in parts if part.strip()]
+
+
+class CourseBatchDetailResponse(CourseDetailResponse):
+    """Schema for one course of the /courses/batch endpoint."""
+
+    id: int = Field(..., ge=1)
+
+
+class CourseBatchResponse(BaseModel):
+    """Schema for the response from /courses/batch."""
+
+    courses: list[CourseBatchDetailResponse] = Field(
+        ..., description="Found courses, in the requested order."
+    )
+    missing_ids: list[int] = Field(
+        ..., description="Requested ids with no course, in the requested order."
+    )
+
+
+class CoursePrerequisitesResponse(BaseModel):
+    """Schema for the response from /courses/{id}/prerequisites."""
+
+    prerequisites: list[CourseNodeResponse] = Field(
+        ..., description="Prerequisites, each listed after its own prerequisites."
+    )
+
+
+class CourseLearningPathResponse(BaseModel):
+    """Schema for the response from /courses/{id}/learning-path."""
+
+    steps: list[CourseNodeResponse] = Field(
+        ...,
+        description="Every prerequisite in an order that can be taken, then the "
+        "course itself.",
+    )
+
+
 class CourseHandoutsResponse(BaseModel):
     """Schema for the response from /courses/{id}/handouts."""
 
@@ -101,3 +201,20 @@ class CourseLanguagesResponse(BaseModel):
             }
         ],
     )
+
+
+class CatalogBundleTableResponse(BaseModel):
+    """Schema for one table of the catalog bundle."""
+
+    name: str = Field(..., examples=["courses", "course_series"])
+    rows: int = Field(..., ge=0)
+    columns: list[str]
+    size: int = Field(..., description="Size of the Parquet file in bytes.")
+    url: str = Field(..., description="Url of the Parquet file.")
+
+
+class CatalogBundleResponse(BaseModel):
+    """Schema for the response from /courses/bundle."""
+
+    version: str = Field(..., description="Catalog version of the bundle.")
+    tables: list[CatalogBundleTableResponse]
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+from techconnect_classes_api.schemas.course import CourseNodeResponse
+
+
+class RecommendedCourse(CourseNodeResponse):
+    score: float = Field(..., description="Higher scores are better matches")
+
+
+class RecommendationResponse(BaseModel):
+    """Schema for the response from /me/recommendation."""
+
+    courses: list[RecommendedCourse]
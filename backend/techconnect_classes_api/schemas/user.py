@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class UserBase(BaseModel):
@@ -8,8 +8,17 @@ class UserBase(BaseModel):
 
 class UserCreate(UserBase):
     """..."""
+
     password: str
 
 
 class UserInDB(UserBase):
     hashed_password: str
+
+
+class CurrentUser(UserBase):
+    """Identity of an authenticated user, as cached between requests."""
+
+    id: int
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
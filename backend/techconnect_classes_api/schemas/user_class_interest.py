@@ -0,0 +1,42 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from techconnect_classes_api.schemas.course import CourseNodeResponse
+
+MAX_ITEMS = 1000
+
+
+class CoursesTakenUpdate(BaseModel):
+    """Schema for the request body of PUT /users/me/courses-taken.
+
+    The full list of courses the user has taken; courses left out are removed.
+    """
+
+    course_ids: list[Annotated[int, Field(ge=1)]] = Field(
+        ..., max_length=MAX_ITEMS, examples=[[1, 12, 40]]
+    )
+
+
+class CoursesTakenResponse(BaseModel):
+    """Schema for the response from /users/me/courses-taken."""
+
+    courses: list[CourseNodeResponse]
+
+
+class SeriesInterestedUpdate(BaseModel):
+    """Schema for the request body of PUT /users/me/series-interested.
+
+    The full list of series the user is interested in; series left out are
+    removed.
+    """
+
+    series: list[str] = Field(
+        ..., max_length=MAX_ITEMS, examples=[["microsoft excel", "python"]]
+    )
+
+
+class SeriesInterestedResponse(BaseModel):
+    """Schema for the response from /users/me/series-interested."""
+
+    series: list[str] = Field(..., examples=[["microsoft excel", "python"]])
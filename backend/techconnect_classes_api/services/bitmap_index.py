@@ -0,0 +1,74 @@
+from typing import Iterable
+
+import numpy as np
+
+
+class BitmapIndex:
+    """Inverted index with one packed bitset per (field, value).
+
+    Bit `i` of a bitset is set when the item at position `i` has that value.
+    A query ORs the bitsets of the requested values within a field and ANDs
+    the results across fields, so any combination of filters costs a few
+    vectorized operations over `size / 8` bytes.
+    """
+
+    def __init__(self, size: int, bitsets: dict[str, dict[str, np.ndarray]]) -> None:
+        self.size = size
+        self._bitsets = bitsets
+        self._empty = np.zeros((size + 7) // 8, dtype=np.uint8)
+
+    @classmethod
+    def build(cls, size: int, fields: dict[str, list[Iterable[str]]]) -> "BitmapIndex":
+        """Build from per-position values: `fields[name][i]` are item i's values."""
+        bitsets: dict[str, dict[str, np.ndarray]] = {}
+        for field, values_per_item in fields.items():
+            positions: dict[str, list[int]] = {}
+            for position, values in enumerate(values_per_item):
+                for value in values:
+                    positions.setdefault(value, []).append(position)
+
+            field_bitsets = {}
+            for value, value_positions in positions.items():
+                bits = np.zeros(size, dtype=bool)
+                bits[value_positions] = True
+                field_bitsets[value] = np.packbits(bits)
+            bitsets[field] = field_bitsets
+        return cls(size, bitsets)
+
+    def values(self, field: str) -> list[str]:
+        return list(self._bitsets[field])
+
+    def bitset(self, field: str, values: Iterable[str]) -> np.ndarray:
+        """Union of the bitsets of `values` in `field`; unknown values match nothing."""
+        field_bitsets = self._bitsets[field]
+        result = self._empty
+        for value in values:
+            result = result | field_bitsets.get(value, self._empty)
+        return result
+
+    def match(self, filters: dict[str, Iterable[str] | None]) -> np.ndarray | None:
+        """Bitset of items matching every non-empty filter, or None if there are none."""
+        result = None
+        for field, values in filters.items():
+            if not values:
+                continue
+            field_bits = self.bitset(field, values)
+            result = field_bits if result is None else result & field_bits
+        return result
+
+    def positions(self, bits: np.ndarray) -> np.ndarray:
+        return np.flatnonzero(np.unpackbits(bits, count=self.size))
+
+    def count(self, bits: np.ndarray) -> int:
+        return int(np.unpackbits(bits, count=self.size).sum())
+
+    def counts(self, field: str, bits: np.ndarray | None = None) -> dict[str, int]:
+        """Number of items with each value of `field`, among the items of `bits`
+        if given. One vectorized popcount over the bitsets of the field."""
+        field_bitsets = self._bitsets[field]
+        if not field_bitsets:
+            return {}
+        stacked = np.stack(list(field_bitsets.values()))
+        if bits is not None:
+            stacked &= bits
+        return dict(zip(field_bitsets, np.bitwise_count(stacked).sum(axis=1).tolist()))
@@ -0,0 +1,195 @@
+import bisect
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+
+import numpy as np
+from pydantic import HttpUrl
+
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.schemas.course import (
+    CourseAdditionalMaterialsResponse,
+    CourseDetailResponse,
+    CourseFacetCounts,
+    CourseFacetsResponse,
+    CourseFormatsResponse,
+    CourseHandoutsResponse,
+    CourseLanguagesResponse,
+    CourseLevelsResponse,
+    CourseNodePage,
+    CourseNodeQuery,
+    CourseNodeResponse,
+    CourseSeriesResponse,
+)
+from techconnect_classes_api.services.bitmap_index import BitmapIndex
+from techconnect_classes_api.services.pagination import decode_cursor, encode_cursor
+from techconnect_classes_api.services.prerequisite_graph import PrerequisiteGraph
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Read-only, fully built copy of the course catalog.
+
+    Every map holds the exact response objects the course routes return, so
+    serving from a snapshot needs no database access or model construction.
+    """
+
+    courses: list[CourseNodeResponse]
+    details: dict[int, CourseDetailResponse]
+    handouts: dict[int, CourseHandoutsResponse]
+    additional_materials: dict[int, CourseAdditionalMaterialsResponse]
+    upcoming_links: dict[int, HttpUrl]
+    formats: CourseFormatsResponse
+    levels: CourseLevelsResponse
+    series: CourseSeriesResponse
+    languages: CourseLanguagesResponse
+    # Level/format/series bitsets over the positions of `courses`
+    index: BitmapIndex
+    prerequisites: PrerequisiteGraph
+    # catalog_versions row the snapshot was built from
+    catalog_version: str | None = None
+    version: int = 0
+
+    def filter_courses(self, query_params: CourseNodeQuery) -> CourseNodePage:
+        """Page of matching courses; `courses` is in (course_name, id) order."""
+        matches = self.index.match(
+            {
+                "level": query_params.level,
+                "format": query_params.format,
+                "series": query_params.series,
+            }
+        )
+        if matches is None:
+            positions = np.arange(len(self.courses))
+        else:
+            positions = self.index.positions(matches)
+
+        if query_params.cursor:
+            after = tuple(decode_cursor(query_params.cursor, [str, int]))
+            start = bisect.bisect_right(
+                self.courses, after, key=lambda c: (c.course_name, c.id)
+            )
+            positions = positions[np.searchsorted(positions, start) :]
+
+        page = positions[: query_params.limit]
+        next_cursor = None
+        if len(positions) > query_params.limit:
+            last = self.courses[page[-1]]
+            next_cursor = encode_cursor([last.course_name, last.id])
+        return CourseNodePage(
+            courses=[self.courses[i] for i in page], next_cursor=next_cursor
+        )
+
+    def facets(self, query_params: CourseNodeQuery) -> CourseFacetsResponse:
+        """First page of matching courses, their total, and the number of
+        matches of every level, format and series value."""
+        filters = {
+            "level": query_params.level,
+            "format": query_params.format,
+            "series": query_params.series,
+        }
+        names = {
+            "level": self.levels.levels,
+            "format": self.formats.formats,
+            "series": self.series.series,
+        }
+        counts = {}
+        for field in filters:
+            # Each field is counted under the other fields' filters only
+            others = self.index.match({f: v for f, v in filters.items() if f != field})
+            field_counts = self.index.counts(field, others)
+            counts[field] = {
+                name: field_counts.get(name, 0) for name in sorted(names[field])
+            }
+
+        matches = self.index.match(filters)
+        page = self.filter_courses(query_params)
+        return CourseFacetsResponse(
+            courses=page.courses,
+            next_cursor=page.next_cursor,
+            total=len(self.courses) if matches is None else self.index.count(matches),
+            facets=CourseFacetCounts(**counts),
+        )
+
+
+class CatalogStore:
+    """Holds the current `CatalogSnapshot` and swaps in reloaded ones atomically.
+
+    Readers take `store.snapshot` once per request and keep using that object,
+    so a reload never exposes a half-built catalog. `version` increases by one
+    on every swap.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: CatalogSnapshot | None = None
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def snapshot(self) -> CatalogSnapshot | None:
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def swap(self, snapshot: CatalogSnapshot) -> CatalogSnapshot:
+        with self._lock:
+            self._version += 1
+            self._snapshot = replace(snapshot, version=self._version)
+        log.info(
+            f"Catalog snapshot v{self._version} loaded ({len(snapshot.courses)} courses)"
+        )
+        return self._snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+
+class CatalogVersionTracker:
+    """Last known catalog version, refreshed from the database at most once per
+    `ttl_seconds` so conditional requests usually need no query.
+
+    The version is written by seeding, possibly from another process, so a
+    reseed is picked up within one TTL.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._version: str | None = None
+        self._loaded_at: float | None = None
+
+    @property
+    def version(self) -> str | None:
+        return self._version
+
+    def is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= self.ttl_seconds
+        )
+
+    def set(self, version: str | None) -> None:
+        self._version = version
+        self._loaded_at = time.monotonic()
+
+    def clear(self) -> None:
+        self._version = None
+        self._loaded_at = None
+
+
+catalog_store = CatalogStore()
+catalog_version_tracker = CatalogVersionTracker(settings.CATALOG_VERSION_TTL_SECONDS)
+
+
+def served_catalog_version() -> str | None:
+    """Version of the catalog the course routes serve: the snapshot's in
+    catalog cache mode, which may lag the tracker's while it reloads."""
+    snapshot = catalog_store.snapshot
+    if settings.CATALOG_CACHE_MODE and snapshot is not None:
+        return snapshot.catalog_version
+    return catalog_version_tracker.version
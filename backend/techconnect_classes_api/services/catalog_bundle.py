@@ -0,0 +1,86 @@
+import json
+import logging
+import re
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from techconnect_classes_api.core.config import settings
+
+log = logging.getLogger(__name__)
+
+# Normalized tables of the bundle, in seeding order
+BUNDLE_TABLES = (
+    "levels",
+    "formats",
+    "series",
+    "languages",
+    "courses",
+    "prerequisites",
+    "handouts",
+    "additional_materials",
+    "course_series",
+)
+MANIFEST_FILE = "manifest.json"
+
+_VERSION_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+def bundle_dir(version: str, root: str | Path | None = None) -> Path | None:
+    """Directory of the bundle of a catalog version; None for malformed
+    versions, so request input never escapes the bundle root."""
+    if not _VERSION_PATTERN.fullmatch(version):
+        return None
+    return Path(root if root is not None else settings.CATALOG_BUNDLE_DIR) / version
+
+
+def bundle_file(version: str, table: str) -> Path | None:
+    """Parquet file of one table of a bundle, if it was written."""
+    directory = bundle_dir(version)
+    if directory is None or table not in BUNDLE_TABLES:
+        return None
+    path = directory / f"{table}.parquet"
+    return path if path.is_file() else None
+
+
+def read_manifest(version: str) -> dict | None:
+    directory = bundle_dir(version)
+    if directory is None or not (directory / MANIFEST_FILE).is_file():
+        return None
+    return json.loads((directory / MANIFEST_FILE).read_text())
+
+
+def write_catalog_bundle(
+    root: str | Path, version: str, tables: dict[str, pd.DataFrame]
+) -> Path:
+    """Write each table as a zstd-compressed Parquet file, with a manifest of
+    their rows and columns, to `root/<version>/`.
+
+    The bundle is written next to its final place and renamed into it, so
+    readers never see a partial bundle. Returns its directory.
+    """
+    directory = bundle_dir(version, root)
+    if directory is None:
+        raise ValueError(f"Invalid catalog version: {version}")
+
+    staging = directory.with_name(f"{version}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+
+    manifest: dict = {"version": version, "tables": {}}
+    for table in BUNDLE_TABLES:
+        df = tables[table]
+        path = staging / f"{table}.parquet"
+        df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+        manifest["tables"][table] = {
+            "rows": len(df),
+            "columns": [str(c) for c in df.columns],
+            "size": path.stat().st_size,
+        }
+    (staging / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+
+    shutil.rmtree(directory, ignore_errors=True)
+    staging.rename(directory)
+    log.info(f"Catalog bundle written to {directory}")
+    return directory
@@ -0,0 +1,30 @@
+import base64
+import json
+from typing import Any, Sequence
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or belongs to another ordering."""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor holding the sort key values of the last item of a page."""
+    payload = json.dumps(list(values), separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> list[Any]:
+    """Sort key values from `cursor`, checked against the expected key types."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError as e:
+        raise InvalidCursorError("Malformed cursor") from e
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise InvalidCursorError("Cursor does not match this ordering")
+    for value, expected in zip(values, types):
+        if expected is float and isinstance(value, int):
+            continue
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise InvalidCursorError("Cursor does not match this ordering")
+    return values
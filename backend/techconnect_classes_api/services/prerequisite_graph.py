@@ -0,0 +1,109 @@
+import heapq
+from dataclasses import dataclass
+from typing import Iterable
+
+from techconnect_classes_api.schemas.course import CourseNodeResponse
+
+
+class PrerequisiteCycleError(ValueError):
+    """Raised when the prerequisites of the catalog are not a DAG."""
+
+
+@dataclass(frozen=True)
+class PrerequisiteGraph:
+    """Prerequisite DAG of the catalog with its transitive closure precomputed.
+
+    `order` lists every course after all of its prerequisites; ties are broken
+    by course id. Each course's direct and transitive prerequisites are stored
+    farthest first: by their longest distance from the course, then by id, the
+    order of `CourseCRUD._closure_statement`, so both give the same learning
+    path. Every lookup costs only the size of its answer.
+    """
+
+    courses: dict[int, CourseNodeResponse]
+    order: tuple[int, ...]
+    direct: dict[int, tuple[int, ...]]
+    transitive: dict[int, tuple[int, ...]]
+
+    @classmethod
+    def build(
+        cls,
+        courses: Iterable[CourseNodeResponse],
+        edges: Iterable[tuple[int, int]],
+    ) -> "PrerequisiteGraph":
+        """Build from (course_id, prereq_id) pairs; raises PrerequisiteCycleError
+        if the prerequisites loop back on themselves."""
+        nodes = {c.id: c for c in courses}
+        prereqs: dict[int, set[int]] = {course_id: set() for course_id in nodes}
+        unlocks: dict[int, list[int]] = {course_id: [] for course_id in nodes}
+        for course_id, prereq_id in edges:
+            prereqs[course_id].add(prereq_id)
+            unlocks[prereq_id].append(course_id)
+
+        # Kahn's algorithm; a heap keeps the order deterministic
+        missing = {course_id: len(p) for course_id, p in prereqs.items()}
+        ready = [course_id for course_id, n in missing.items() if n == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            course_id = heapq.heappop(ready)
+            order.append(course_id)
+            for unlocked in unlocks[course_id]:
+                missing[unlocked] -= 1
+                if missing[unlocked] == 0:
+                    heapq.heappush(ready, unlocked)
+
+        if len(order) < len(nodes):
+            cycle = cls._find_cycle({c: p for c, p in prereqs.items() if missing[c]})
+            names = " -> ".join(nodes[c].course_name for c in cycle)
+            raise PrerequisiteCycleError(f"Prerequisite cycle: {names}")
+
+        # Longest distance from each course to each of its ancestors
+        distances: dict[int, dict[int, int]] = {}
+        for course_id in order:
+            distance = dict.fromkeys(prereqs[course_id], 1)
+            for prereq_id in prereqs[course_id]:
+                for ancestor, d in distances[prereq_id].items():
+                    distance[ancestor] = max(distance.get(ancestor, 0), d + 1)
+            distances[course_id] = distance
+
+        def farthest_first(course_id: int, ids: Iterable[int]) -> tuple[int, ...]:
+            distance = distances[course_id]
+            return tuple(sorted(ids, key=lambda i: (-distance[i], i)))
+
+        return cls(
+            courses=nodes,
+            order=tuple(order),
+            direct={c: farthest_first(c, p) for c, p in prereqs.items()},
+            transitive={c: farthest_first(c, d) for c, d in distances.items()},
+        )
+
+    @staticmethod
+    def _find_cycle(prereqs: dict[int, set[int]]) -> list[int]:
+        """A cycle among courses that Kahn's algorithm could not order; each of
+        them has at least one prerequisite that is also left over."""
+        path: list[int] = []
+        seen: dict[int, int] = {}
+        course_id = min(prereqs)
+        while course_id not in seen:
+            seen[course_id] = len(path)
+            path.append(course_id)
+            course_id = min(p for p in prereqs[course_id] if p in prereqs)
+        return path[seen[course_id] :] + [course_id]
+
+    def prerequisites(
+        self, course_id: int, transitive: bool = False
+    ) -> list[CourseNodeResponse] | None:
+        """Prerequisites of a course, in learning order; None for unknown ids."""
+        closure = self.transitive if transitive else self.direct
+        if course_id not in closure:
+            return None
+        return [self.courses[c] for c in closure[course_id]]
+
+    def learning_path(self, course_id: int) -> list[CourseNodeResponse] | None:
+        """Every prerequisite of a course in learning order, then the course."""
+        if course_id not in self.transitive:
+            return None
+        return [self.courses[c] for c in self.transitive[course_id]] + [
+            self.courses[course_id]
+        ]
@@ -0,0 +1,170 @@
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+import numpy as np
+
+from techconnect_classes_api.schemas.course import CourseNodeResponse
+
+log = logging.getLogger(__name__)
+
+# Relative weight of the signals of a user's score
+HISTORY_WEIGHT = 1.0
+INTEREST_WEIGHT = 1.0
+NEXT_STEP_WEIGHT = 0.5
+
+
+@dataclass(frozen=True)
+class RecommendationEngine:
+    """Content-based course recommendations.
+
+    Every course is a row of `features`, the L2-normalized one-hot encoding of
+    its series, level and format. A user is the normalized sum of the rows of
+    the courses they took plus the normalized one-hot of the series they are
+    interested in, so one matrix-vector product scores every course by its
+    similarity to the user.
+
+    The prerequisite graph is kept as arrays of (course, prerequisite) edge
+    positions: one `bincount` over the edges whose prerequisite the user took
+    tells, for every course, how many of its prerequisites are met. Courses
+    with unmet prerequisites are excluded, and courses that build directly on
+    a taken course get a bonus. Taken courses are excluded too.
+    """
+
+    courses: list[CourseNodeResponse]
+    positions: dict[int, int]
+    series_columns: dict[int, int]
+    features: np.ndarray
+    edge_courses: np.ndarray
+    edge_prereqs: np.ndarray
+    prereq_counts: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        courses: list[CourseNodeResponse],
+        level_ids: Iterable[int],
+        format_ids: Iterable[int],
+        course_series: Iterable[tuple[int, int]],
+        prerequisites: Iterable[tuple[int, int]],
+    ) -> "RecommendationEngine":
+        """Build from the courses, their level and format ids in the same order,
+        and (course_id, series_id) and (course_id, prereq_id) pairs."""
+        positions = {course.id: position for position, course in enumerate(courses)}
+        n = len(courses)
+
+        pairs = np.array(list(course_series), dtype=np.int64).reshape(-1, 2)
+        pairs = pairs[np.isin(pairs[:, 0], list(positions))]
+        series_ids, series_cols = np.unique(pairs[:, 1], return_inverse=True)
+        levels, level_cols = np.unique(
+            np.fromiter(level_ids, np.int64), return_inverse=True
+        )
+        formats, format_cols = np.unique(
+            np.fromiter(format_ids, np.int64), return_inverse=True
+        )
+
+        features = np.zeros(
+            (n, len(series_ids) + len(levels) + len(formats)), np.float32
+        )
+        series_rows = np.array([positions[c] for c in pairs[:, 0]], dtype=np.int64)
+        features[series_rows, series_cols] = 1
+        features[np.arange(n), len(series_ids) + level_cols] = 1
+        features[np.arange(n), len(series_ids) + len(levels) + format_cols] = 1
+        features /= np.linalg.norm(features, axis=1, keepdims=True)
+
+        edges = np.array(
+            [
+                (positions[course_id], positions[prereq_id])
+                for course_id, prereq_id in prerequisites
+                if course_id in positions and prereq_id in positions
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+
+        return cls(
+            courses=courses,
+            positions=positions,
+            series_columns={int(s): col for col, s in enumerate(series_ids)},
+            features=features,
+            edge_courses=edges[:, 0],
+            edge_prereqs=edges[:, 1],
+            prereq_counts=np.bincount(edges[:, 0], minlength=n),
+        )
+
+    def score(self, taken_ids: Iterable[int], series_ids: Iterable[int]) -> np.ndarray:
+        """Score of every course for a user, -inf for excluded courses. Ids
+        unknown to the engine are ignored."""
+        n = len(self.courses)
+        taken = np.zeros(n, dtype=bool)
+        taken[[self.positions[c] for c in taken_ids if c in self.positions]] = True
+
+        user = np.zeros(self.features.shape[1], dtype=np.float32)
+        if taken.any():
+            history = self.features[taken].sum(axis=0)
+            user += HISTORY_WEIGHT * history / np.linalg.norm(history)
+        columns = [
+            self.series_columns[s] for s in series_ids if s in self.series_columns
+        ]
+        if columns:
+            user[columns] += INTEREST_WEIGHT / np.sqrt(len(columns))
+
+        scores = self.features @ user
+        met = np.bincount(self.edge_courses[taken[self.edge_prereqs]], minlength=n)
+        scores += NEXT_STEP_WEIGHT * (met > 0)
+        scores[taken | (met < self.prereq_counts)] = -np.inf
+        return scores
+
+    def recommend(
+        self, taken_ids: Iterable[int], series_ids: Iterable[int], limit: int
+    ) -> list[tuple[CourseNodeResponse, float]]:
+        """The `limit` best courses with their scores; ties keep course order."""
+        scores = self.score(taken_ids, series_ids)
+        limit = min(limit, len(scores))
+        if not limit:
+            return []
+        # Partial selection: everything above the limit-th best score, then the
+        # first courses tied with it
+        threshold = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+        above = np.flatnonzero(scores > threshold)
+        tied = np.flatnonzero(scores == threshold)[: limit - len(above)]
+        top = np.concatenate([above, tied])
+        top = top[np.lexsort((top, -scores[top]))]
+        return [
+            (self.courses[position], float(scores[position]))
+            for position in top
+            if np.isfinite(scores[position])
+        ]
+
+
+class RecommendationStore:
+    """Holds the `RecommendationEngine` of one catalog version. It is built on
+    first use and rebuilt on the first use after the version changes, so a
+    reseed is picked up without a restart. Readers take `store.get(...)` once
+    per request."""
+
+    def __init__(self) -> None:
+        self._current: tuple[str | None, RecommendationEngine] | None = None
+        self._lock = threading.Lock()
+
+    def get(
+        self, version: str | None, build: Callable[[], RecommendationEngine]
+    ) -> RecommendationEngine:
+        """The engine of catalog `version`, calling `build` if there is none."""
+        if (current := self._current) is not None and current[0] == version:
+            return current[1]
+        with self._lock:
+            if self._current is None or self._current[0] != version:
+                engine = build()
+                self._current = (version, engine)
+                log.info(
+                    f"Recommendation engine loaded for catalog version {version} "
+                    f"({len(engine.courses)} courses)"
+                )
+            return self._current[1]
+
+    def clear(self) -> None:
+        self._current = None
+
+
+recommendation_store = RecommendationStore()
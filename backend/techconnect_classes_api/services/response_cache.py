@@ -0,0 +1,117 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable
+from urllib.parse import parse_qsl, urlencode
+
+from techconnect_classes_api.core.config import settings
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Serialized body and headers of a response, ready to be sent as is."""
+
+    body: bytes
+    headers: dict[str, str]
+    expires_at: float
+
+
+def canonical_query(query_string: str, unordered: Iterable[str] = ()) -> str:
+    """Query string with parameters sorted by name, so equivalent queries share a
+    cache key. Repeated values of parameters in `unordered` (filters that match
+    any of their values) are also sorted and deduplicated; others keep their
+    order."""
+    unordered = set(unordered)
+    params: dict[str, list[str]] = {}
+    for key, value in parse_qsl(query_string, keep_blank_values=True):
+        params.setdefault(key, []).append(value)
+    pairs = []
+    for key in sorted(params):
+        values = params[key]
+        if key in unordered:
+            values = sorted(set(values))
+        pairs.extend((key, value) for value in values)
+    return urlencode(pairs)
+
+
+class ResponseCache:
+    """LRU cache of serialized responses, bounded by the total size of the cached
+    bodies. Each entry expires after the TTL it was stored with.
+
+    Entries are keyed by route and canonical query, followed by the catalog
+    version they were built from, so entries of an older catalog are never
+    hit; `invalidate()` frees them once the new version is seen.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(
+        self, key: str, body: bytes, headers: dict[str, str], ttl_seconds: float
+    ) -> None:
+        if ttl_seconds <= 0 or len(body) > self.max_bytes:
+            return
+        entry = CachedResponse(body, headers, time.monotonic() + ttl_seconds)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, prefix: str = "") -> int:
+        """Drop every entry whose key starts with `prefix`; all of them by default.
+        Returns the number of dropped entries."""
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+        log.info(f"Response cache invalidated ({len(keys)} entries)")
+        return len(keys)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._size,
+        }
+
+    def _remove(self, key: str) -> None:
+        self._size -= len(self._entries.pop(key).body)
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MAX_BYTES)
@@ -1,8 +1,36 @@
 import pytest
 
-from sqlalchemy import create_engine
+from fastapi.testclient import TestClient
+from scripts.core.create_tables import (
+    create_course_details_view,
+    create_indexes,
+    refresh_course_details_view,
+    upgrade_courses_table,
+)
+from sqlalchemy import create_engine, delete
 from sqlalchemy.orm import sessionmaker
+from techconnect_classes_api.api.limiter import limiter
 from techconnect_classes_api.core.config import settings as _settings
+from techconnect_classes_api.core.security import create_access_token
+from techconnect_classes_api.database.db import Base
+from techconnect_classes_api.main import app
+from techconnect_classes_api.services.auth_cache import user_cache
+from techconnect_classes_api.services.catalog import catalog_version_tracker
+from techconnect_classes_api.models import (
+    AdditionalMaterial,
+    CatalogVersion,
+    Course,
+    CourseSeries,
+    CourseTaken,
+    Format,
+    Handout,
+    Language,
+    Level,
+    Prerequisite,
+    Series,
+    SeriesInterested,
+    User,
+)
 
 TEST_DB_URL = f"postgresql://{_settings.POSTGRES_USER}:{_settings.POSTGRES_PASSWORD}@{_settings.POSTGRES_HOST}:{_settings.POSTGRES_PORT}/{_settings.POSTGRES_DB}"
 
@@ -15,3 +43,143 @@ def _engine():
 @pytest.fixture(scope="session")
 def test_session(_engine):
     yield sessionmaker(bind=_engine, autocommit=False, autoflush=False)
+
+
+@pytest.fixture(scope="session")
+def _tables(_engine):
+    Base.metadata.create_all(bind=_engine)
+    upgrade_courses_table(_engine)
+    create_indexes(_engine)
+    create_course_details_view(_engine)
+
+
+@pytest.fixture
+def client():
+    limiter.enabled = False
+    with TestClient(app) as test_client:
+        yield test_client
+    limiter.enabled = _settings.RATE_LIMIT_ENABLED
+
+
+@pytest.fixture
+def course_catalog(_engine, _tables, test_session):
+    """Small catalog: one course with several series, prerequisites, handouts and
+    materials, one with a single series, and one with no series at all."""
+    with test_session() as session:
+        level = Level(level_name="test level")
+        fmt = Format(format_name="test format")
+        language = Language(language_code="zz", language_name="test language")
+        series = [Series(series_name=f"test series {i}") for i in range(4)]
+        session.add_all([level, fmt, language, *series])
+        session.flush()
+
+        def new_course(name: str) -> Course:
+            return Course(
+                course_name=name,
+                description=f"{name} description",
+                level_id=level.id,
+                format_id=fmt.id,
+            )
+
+        basics = new_course("Test Course Basics")
+        intermediate = new_course("Test Course Intermediate")
+        advanced = new_course("Test Course Advanced")
+        standalone = new_course("Test Course Without Series")
+        session.add_all([basics, intermediate, advanced, standalone])
+        session.flush()
+
+        session.add_all(
+            [CourseSeries(course_id=basics.id, series_id=series[0].id)]
+            + [CourseSeries(course_id=advanced.id, series_id=s.id) for s in series]
+            + [
+                Prerequisite(course_id=intermediate.id, prereq_id=basics.id),
+                Prerequisite(course_id=advanced.id, prereq_id=basics.id),
+                Prerequisite(course_id=advanced.id, prereq_id=intermediate.id),
+            ]
+            + [
+                Handout(
+                    course_id=advanced.id,
+                    language_code="zz",
+                    url=f"https://example.com/advanced-{i}",
+                )
+                for i in range(3)
+            ]
+            + [
+                AdditionalMaterial(
+                    course_id=advanced.id, url=f"https://example.com/material-{i}"
+                )
+                for i in range(2)
+            ]
+        )
+        session.commit()
+
+        refresh_course_details_view(_engine)
+
+        catalog = {
+            "basics": basics.id,
+            "intermediate": intermediate.id,
+            "advanced": advanced.id,
+            "standalone": standalone.id,
+        }
+
+    yield catalog
+
+    course_ids = list(catalog.values())
+    with test_session() as session:
+        session.execute(delete(CourseSeries).where(CourseSeries.course_id.in_(course_ids)))
+        session.execute(delete(Prerequisite).where(Prerequisite.course_id.in_(course_ids)))
+        session.execute(delete(Handout).where(Handout.course_id.in_(course_ids)))
+        session.execute(
+            delete(AdditionalMaterial).where(AdditionalMaterial.course_id.in_(course_ids))
+        )
+        session.execute(delete(Course).where(Course.id.in_(course_ids)))
+        session.execute(delete(Series).where(Series.series_name.like("test series %")))
+        session.execute(delete(Language).where(Language.language_code == "zz"))
+        session.execute(delete(Level).where(Level.level_name == "test level"))
+        session.execute(delete(Format).where(Format.format_name == "test format"))
+        session.commit()
+    refresh_course_details_view(_engine)
+
+
+@pytest.fixture
+def auth_headers(course_catalog, test_session):
+    """Headers of a signed-in user; depends on `course_catalog` so the user's
+    rows are deleted before the catalog is."""
+    with test_session() as session:
+        user = User(username="test me", hashed_password="unused")
+        session.add(user)
+        session.commit()
+        user_id = user.id
+    user_cache.clear()
+    yield {"Authorization": f"Bearer {create_access_token(subject=user_id)}"}
+    with test_session() as session:
+        session.execute(delete(CourseTaken).where(CourseTaken.user_id == user_id))
+        session.execute(
+            delete(SeriesInterested).where(SeriesInterested.user_id == user_id)
+        )
+        session.execute(delete(User).where(User.id == user_id))
+        session.commit()
+    user_cache.clear()
+
+
+@pytest.fixture
+def catalog_version(_tables, test_session):
+    """Inserts a catalog version row; yields a function to insert newer ones."""
+    inserted = []
+
+    def insert(version: str) -> str:
+        with test_session() as session:
+            row = CatalogVersion(version=version)
+            session.add(row)
+            session.commit()
+            inserted.append(row.id)
+        catalog_version_tracker.clear()
+        return version
+
+    insert("test-catalog-v1")
+    yield insert
+
+    with test_session() as session:
+        session.execute(delete(CatalogVersion).where(CatalogVersion.id.in_(inserted)))
+        session.commit()
+    catalog_version_tracker.clear()
@@ -0,0 +1,141 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete, event
+from sqlalchemy.engine import Engine
+
+from techconnect_classes_api.api.dependencies import (
+    get_current_active_user,
+    get_current_user,
+)
+from techconnect_classes_api.core.security import (
+    PasswordHashQueueFullError,
+    bcrypt_context,
+    password_hasher,
+)
+from techconnect_classes_api.crud.user import user_crud
+from techconnect_classes_api.models import User
+from techconnect_classes_api.schemas.auth import TokenPayload
+from techconnect_classes_api.services.auth_cache import user_cache
+
+USERNAME = "test user"
+PASSWORD = "test password"
+
+
+@pytest.fixture
+def user(_tables, test_session):
+    with test_session() as session:
+        session.add(
+            User(username=USERNAME, hashed_password=bcrypt_context(4).hash(PASSWORD))
+        )
+        session.commit()
+    yield USERNAME
+    with test_session() as session:
+        session.execute(delete(User).where(User.username == USERNAME))
+        session.commit()
+
+
+@pytest.fixture
+def hash_rounds():
+    rounds = password_hasher.rounds
+    password_hasher.set_rounds(5)
+    yield 5
+    password_hasher.set_rounds(rounds)
+
+
+def stored_hash(test_session) -> str:
+    with test_session() as session:
+        return session.query(User).filter_by(username=USERNAME).one().hashed_password
+
+
+def test_login_rehashes_outdated_cost(client, user, hash_rounds, test_session):
+    response = client.post("/token", data={"username": user, "password": PASSWORD})
+
+    assert response.status_code == 200
+    assert response.json()["token_type"] == "bearer"
+    new_hash = stored_hash(test_session)
+    assert new_hash.startswith(f"$2b$0{hash_rounds}$")
+
+    # Current hashes are kept as is
+    assert client.post(
+        "/token", data={"username": user, "password": PASSWORD}
+    ).status_code == 200
+    assert stored_hash(test_session) == new_hash
+
+
+def test_login_with_wrong_password_keeps_hash(client, user, hash_rounds, test_session):
+    old_hash = stored_hash(test_session)
+
+    response = client.post("/token", data={"username": user, "password": "wrong"})
+
+    assert response.status_code == 401
+    assert stored_hash(test_session) == old_hash
+
+
+def test_login_succeeds_when_rehash_is_rejected(
+    client, user, hash_rounds, test_session, monkeypatch
+):
+    def queue_full(password):
+        raise PasswordHashQueueFullError
+
+    old_hash = stored_hash(test_session)
+    monkeypatch.setattr(password_hasher, "hash", queue_full)
+
+    response = client.post("/token", data={"username": user, "password": PASSWORD})
+
+    assert response.status_code == 200
+    # Upgraded on a later login instead
+    assert stored_hash(test_session) == old_hash
+
+
+@pytest.fixture
+def user_id(user, test_session):
+    user_cache.clear()
+    with test_session() as session:
+        yield session.query(User).filter_by(username=user).one().id
+    user_cache.clear()
+
+
+def count_user_queries(test_session, token: TokenPayload) -> int:
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with test_session() as session:
+            current_user = get_current_active_user(get_current_user(session, token))
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+    assert current_user.username == USERNAME
+    return len(statements)
+
+
+def test_current_user_is_cached(user_id, test_session):
+    token = TokenPayload(sub=str(user_id))
+
+    assert count_user_queries(test_session, token) == 1
+    assert count_user_queries(test_session, token) == 0
+    assert user_cache.get(user_id).is_active
+
+
+def test_deactivating_user_invalidates_cache(user_id, test_session):
+    token = TokenPayload(sub=str(user_id))
+    count_user_queries(test_session, token)
+
+    with test_session() as session:
+        user_crud.deactivate_user(session, session.get(User, user_id))
+
+        assert user_cache.get(user_id) is None
+        with pytest.raises(HTTPException) as error:
+            get_current_active_user(get_current_user(session, token))
+    assert error.value.detail == "Inactive user"
+
+
+def test_unknown_user_is_not_cached(_tables, test_session):
+    user_cache.clear()
+    with test_session() as session, pytest.raises(HTTPException) as error:
+        get_current_user(session, TokenPayload(sub="0"))
+
+    assert error.value.status_code == 401
+    assert len(user_cache) == 0
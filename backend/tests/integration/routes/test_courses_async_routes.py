@@ -0,0 +1,101 @@
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from techconnect_classes_api.api.limiter import limiter
+from techconnect_classes_api.api.routes import courses, courses_async
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.database import (
+    close_async_db,
+    close_db,
+    init_async_db,
+    init_db,
+)
+
+# Headers both routers must agree on; the rest is set by the server
+COMPARED_HEADERS = ("content-type", "etag", "cache-control", "location")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_db()
+    init_async_db()
+    yield
+    close_db()
+    await close_async_db()
+
+
+def router_client(router) -> TestClient:
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(router)
+    app.state.limiter = limiter
+    return TestClient(app)
+
+
+@pytest.fixture
+def router_clients():
+    """Clients of apps serving the sync and the async course router."""
+    limiter.enabled = False
+    with router_client(courses.router) as sync_client:
+        with router_client(courses_async.router) as async_client:
+            yield sync_client, async_client
+    limiter.enabled = settings.RATE_LIMIT_ENABLED
+
+
+def course_urls(catalog: dict[str, int]) -> list[str]:
+    advanced, basics = catalog["advanced"], catalog["basics"]
+    return [
+        "/courses/all",
+        "/courses/all?limit=2",
+        "/courses/all?series=test%20series%200&series=test%20series%201",
+        "/courses/all?search=course",
+        "/courses/all?cursor=not-a-cursor",
+        "/courses/facets?level=test%20level&limit=1",
+        "/courses/formats",
+        "/courses/languages",
+        "/courses/levels",
+        "/courses/series",
+        f"/courses/batch?ids={advanced},{basics},999999999",
+        "/courses/export.ndjson",
+        "/courses/bundle",
+        f"/courses/bundle/{'0' * 64}/courses.parquet",
+        f"/courses/{advanced}",
+        f"/courses/{advanced}/handouts",
+        f"/courses/{advanced}/additional-materials",
+        f"/courses/{advanced}/upcoming",
+        f"/courses/{advanced}/prerequisites?transitive=true",
+        f"/courses/{advanced}/learning-path",
+        "/courses/999999999/prerequisites",
+        "/courses/999999999/learning-path",
+        "/courses/999999999/upcoming",
+    ]
+
+
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_async_router_matches_sync_router(
+    router_clients, course_catalog, catalog_version, monkeypatch, fast_json
+):
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast_json)
+    sync_client, async_client = router_clients
+
+    for url in course_urls(course_catalog):
+        expected = sync_client.get(url, follow_redirects=False)
+        response = async_client.get(url, follow_redirects=False)
+
+        assert response.status_code == expected.status_code, url
+        assert response.content == expected.content, url
+        for header in COMPARED_HEADERS:
+            assert response.headers.get(header) == expected.headers.get(header), url
+
+
+def test_async_router_not_modified(router_clients, course_catalog, catalog_version):
+    _, async_client = router_clients
+    url = f"/courses/{course_catalog['advanced']}"
+    etag = async_client.get(url).headers["etag"]
+
+    response = async_client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
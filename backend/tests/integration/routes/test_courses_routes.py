@@ -0,0 +1,912 @@
+import json
+import math
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+
+from sqlalchemy import delete, event, func, select, update
+from sqlalchemy.engine import Engine
+
+from scripts.core.create_tables import refresh_course_details_view
+from techconnect_classes_api.api.compression import compressed_variants
+from techconnect_classes_api.api.limiter import limiter
+from techconnect_classes_api.core.config import settings
+from techconnect_classes_api.crud.course import course_crud
+from techconnect_classes_api.database import get_managed_db
+from techconnect_classes_api.models import (
+    AdditionalMaterial,
+    Course,
+    CourseSeries,
+    Prerequisite,
+    Series,
+)
+from techconnect_classes_api.services.catalog import (
+    catalog_store,
+    catalog_version_tracker,
+)
+from techconnect_classes_api.services.catalog_bundle import (
+    BUNDLE_TABLES,
+    write_catalog_bundle,
+)
+from techconnect_classes_api.services.prerequisite_graph import PrerequisiteCycleError
+from techconnect_classes_api.services.response_cache import response_cache
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    # Listen on the Engine class to also count the async engine's statements.
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_course_detail(client, course_catalog):
+    response = client.get(f"/courses/{course_catalog['advanced']}")
+
+    assert response.status_code == 200
+    detail = response.json()
+    assert detail["course_name"] == "Test Course Advanced"
+    assert detail["level"] == "test level"
+    assert detail["format"] == "test format"
+    assert sorted(detail["series"]) == [f"test series {i}" for i in range(4)]
+    assert sorted(detail["prereqs"]) == ["Test Course Basics", "Test Course Intermediate"]
+    assert len(detail["available_handouts"]) == 3
+    assert len(detail["additional_materials"]) == 2
+
+
+def test_course_detail_without_series(client, course_catalog):
+    response = client.get(f"/courses/{course_catalog['standalone']}")
+
+    assert response.status_code == 200
+    assert response.json()["series"] == []
+
+
+def test_course_detail_query_count_is_constant(client, course_catalog):
+    """The detail endpoint must not issue one query per series or prerequisite."""
+    with count_queries() as small:
+        client.get(f"/courses/{course_catalog['basics']}")
+    with count_queries() as large:
+        client.get(f"/courses/{course_catalog['advanced']}")
+
+    assert len(large) == len(small)
+    assert len(large) <= 5
+
+
+def test_catalog_cache_mode_serves_without_queries(client, course_catalog, monkeypatch):
+    expected = client.get(f"/courses/{course_catalog['advanced']}").json()
+
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        with count_queries() as statements:
+            response = client.get(f"/courses/{course_catalog['advanced']}")
+            client.get("/courses/all", params={"series": "test series 0"})
+    finally:
+        catalog_store.clear()
+
+    assert statements == []
+    assert response.json() == expected
+
+
+def test_new_catalog_version_reloads_catalog_snapshot(
+    client, course_catalog, catalog_version, test_session, monkeypatch
+):
+    path = f"/courses/{course_catalog['basics']}"
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        assert client.get(path).json()["course_name"] == "Test Course Basics"
+        # A reseed from another process: new rows, then a new version
+        with test_session() as session:
+            session.execute(
+                update(Course)
+                .where(Course.id == course_catalog["basics"])
+                .values(course_name="Test Course Reseeded")
+            )
+            session.commit()
+        assert client.get(path).json()["course_name"] == "Test Course Basics"
+
+        catalog_version("test-catalog-v2")
+        with count_queries() as statements:
+            client.get(f"{path}/handouts")
+        response = client.get(path)
+        snapshot = catalog_store.snapshot
+    finally:
+        catalog_store.clear()
+
+    # Any course route notices the new version and reloads the snapshot
+    assert statements
+    assert response.json()["course_name"] == "Test Course Reseeded"
+    assert response.headers["etag"] == '"test-catalog-v2"'
+    assert snapshot.catalog_version == "test-catalog-v2"
+
+
+def test_multi_valued_filters_match_with_and_without_cache(
+    client, course_catalog, monkeypatch
+):
+    params = {"series": ["test series 0", "test series 3"], "level": "test level"}
+    from_db = client.get("/courses/all", params=params).json()["courses"]
+
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        from_cache = client.get("/courses/all", params=params).json()["courses"]
+    finally:
+        catalog_store.clear()
+
+    assert [course["id"] for course in from_db] == [
+        course_catalog["advanced"],
+        course_catalog["basics"],
+    ]
+    assert from_cache == from_db
+
+
+def test_search_ranks_and_combines_with_filters(client, course_catalog):
+    response = client.get(
+        "/courses/all",
+        params={"search": "advanced", "level": "test level", "series": "test series 3"},
+    )
+
+    assert response.status_code == 200
+    assert [course["id"] for course in response.json()["courses"]] == [
+        course_catalog["advanced"]
+    ]
+
+    ranked = client.get("/courses/all", params={"search": "test course basics"}).json()
+    assert ranked["courses"][0]["id"] == course_catalog["basics"]
+
+
+def test_search_bypasses_catalog_cache(client, course_catalog, monkeypatch):
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        response = client.get("/courses/all", params={"search": "intermediate"})
+    finally:
+        catalog_store.clear()
+
+    assert course_catalog["intermediate"] in [
+        course["id"] for course in response.json()["courses"]
+    ]
+
+
+def fetch_all_pages(client, params: dict) -> list[list[int]]:
+    pages = []
+    cursor = None
+    while True:
+        response = client.get("/courses/all", params={**params, "cursor": cursor})
+        assert response.status_code == 200
+        page = response.json()
+        pages.append([course["id"] for course in page["courses"]])
+        if not (cursor := page["next_cursor"]):
+            return pages
+
+
+def test_cursor_pagination_with_and_without_cache(client, course_catalog, monkeypatch):
+    params = {"level": "test level", "limit": 3}
+    from_db = fetch_all_pages(client, params)
+
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        from_cache = fetch_all_pages(client, params)
+    finally:
+        catalog_store.clear()
+
+    # Test Course Advanced, Basics, Intermediate, Without Series
+    expected = [
+        course_catalog[name]
+        for name in ["advanced", "basics", "intermediate", "standalone"]
+    ]
+    assert from_db == [expected[:3], expected[3:]]
+    assert from_cache == from_db
+
+
+def test_cursor_pagination_of_search_results(client, course_catalog):
+    ranked = client.get("/courses/all", params={"search": "test course"}).json()
+    pages = fetch_all_pages(client, {"search": "test course", "limit": 1})
+
+    assert [course["id"] for course in ranked["courses"]] == sum(pages, [])
+    assert len(pages) == 4
+
+
+def test_invalid_cursor_is_rejected(client, course_catalog):
+    response = client.get("/courses/all", params={"cursor": "garbage"})
+    search_cursor = client.get(
+        "/courses/all", params={"search": "test course", "limit": 1}
+    ).json()["next_cursor"]
+    mismatched = client.get("/courses/all", params={"cursor": search_cursor})
+
+    assert response.status_code == 400
+    assert mismatched.status_code == 400
+
+
+def test_crud_base_get_page(test_session, course_catalog):
+    with test_session() as db:
+        course_ids = [
+            course_catalog[name]
+            for name in ["basics", "intermediate", "advanced", "standalone"]
+        ]
+        first, cursor = course_crud.get_page(db, Course.id.in_(course_ids), limit=3)
+        second, last_cursor = course_crud.get_page(
+            db, Course.id.in_(course_ids), cursor=cursor, limit=3
+        )
+
+    assert [c.id for c in first] + [c.id for c in second] == sorted(course_ids)
+    assert last_cursor is None
+
+
+def test_course_details_batch(client, course_catalog):
+    ids = [course_catalog["advanced"], 999_999, course_catalog["basics"]]
+    response = client.get(
+        "/courses/batch", params={"ids": ",".join(str(i) for i in ids + ids[:1])}
+    )
+
+    assert response.status_code == 200
+    batch = response.json()
+    assert [course["id"] for course in batch["courses"]] == [ids[0], ids[2]]
+    assert batch["missing_ids"] == [999_999]
+    for course in batch["courses"]:
+        detail = client.get(f"/courses/{course.pop('id')}").json()
+        assert course == detail
+
+
+def test_course_details_batch_query_count_is_constant(client, course_catalog):
+    with count_queries() as one:
+        client.get("/courses/batch", params={"ids": course_catalog["basics"]})
+    with count_queries() as many:
+        client.get("/courses/batch", params={"ids": list(course_catalog.values())})
+
+    assert len(many) == len(one)
+    assert len(many) <= 5
+
+
+def test_course_details_batch_with_cache(client, course_catalog, monkeypatch):
+    params = {"ids": [*course_catalog.values(), 999_999]}
+    expected = client.get("/courses/batch", params=params).json()
+
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        response = client.get("/courses/batch", params=params)
+    finally:
+        catalog_store.clear()
+
+    assert response.json() == expected
+
+
+def test_course_details_batch_rejects_bad_ids(client):
+    assert client.get("/courses/batch", params={"ids": "1,two"}).status_code == 422
+    assert client.get("/courses/batch").status_code == 422
+
+
+def test_not_modified_skips_route(client, course_catalog, catalog_version):
+    path = f"/courses/{course_catalog['advanced']}"
+    response = client.get(path)
+
+    assert response.headers["etag"] == '"test-catalog-v1"'
+    assert response.headers["cache-control"] == settings.CACHE_CONTROL_COURSE_DETAIL
+
+    with count_queries() as statements:
+        not_modified = client.get(path, headers={"If-None-Match": '"test-catalog-v1"'})
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == '"test-catalog-v1"'
+    assert statements == []
+
+
+def test_reference_routes_send_cache_headers(client, catalog_version):
+    for path in ["/courses/formats", "/courses/levels", "/courses/series"]:
+        response = client.get(path)
+        assert response.headers["etag"] == '"test-catalog-v1"'
+        assert response.headers["cache-control"] == settings.CACHE_CONTROL_COURSE_REFERENCE
+
+    response = client.get("/courses/all")
+    assert response.headers["cache-control"] == settings.CACHE_CONTROL_COURSE_LIST
+
+
+def test_new_catalog_version_invalidates_etag(client, catalog_version):
+    old_etag = client.get("/courses/formats").headers["etag"]
+    catalog_version("test-catalog-v2")
+
+    response = client.get("/courses/formats", headers={"If-None-Match": old_etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"test-catalog-v2"'
+
+
+def test_etag_names_the_version_of_the_served_snapshot(
+    client, course_catalog, catalog_version, monkeypatch
+):
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        # The tracker already knows a version the snapshot wasn't built from
+        catalog_version("test-catalog-v2")
+        catalog_version_tracker.set("test-catalog-v2")
+        response = client.get(f"/courses/{course_catalog['advanced']}")
+    finally:
+        catalog_store.clear()
+
+    assert response.headers["etag"] == '"test-catalog-v1"'
+
+
+def test_response_cache_serves_equivalent_queries_without_queries(
+    client, course_catalog, catalog_version, monkeypatch
+):
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+    response_cache.invalidate()
+    hits = response_cache.hits
+    try:
+        first = client.get(
+            "/courses/all?series=test+series+0&series=test+series+3&level=test+level"
+        )
+        with count_queries() as statements:
+            second = client.get(
+                "/courses/all?level=test+level&series=test+series+3&series=test+series+0"
+            )
+            not_modified = client.get(
+                f"/courses/{course_catalog['advanced']}",
+                headers={"If-None-Match": '"test-catalog-v1"'},
+            )
+    finally:
+        response_cache.invalidate()
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["cache-control"] == settings.CACHE_CONTROL_COURSE_LIST
+    assert not_modified.status_code == 304
+    assert statements == []
+    assert response_cache.hits == hits + 1
+
+
+def test_response_cache_hits_are_rate_limited(
+    client, course_catalog, catalog_version, monkeypatch
+):
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+    monkeypatch.setattr(limiter, "enabled", True)
+    path = f"/courses/{course_catalog['basics']}"
+    response_cache.invalidate()
+    limiter.reset()
+    hits = response_cache.hits
+    try:
+        first = client.get(path)
+        second = client.get(path)
+    finally:
+        response_cache.invalidate()
+        limiter.reset()
+
+    # The route allows one request per second, cached or not
+    assert first.status_code == 200
+    assert second.status_code == 429
+    assert response_cache.hits == hits
+
+
+def test_response_cache_is_not_served_after_reseed(
+    client, course_catalog, catalog_version, test_session, monkeypatch
+):
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+    path = f"/courses/{course_catalog['basics']}"
+    response_cache.invalidate()
+    try:
+        client.get(path)
+        with test_session() as session:
+            session.execute(
+                update(Course)
+                .where(Course.id == course_catalog["basics"])
+                .values(course_name="Test Course Reseeded")
+            )
+            session.commit()
+        cached = client.get(path)
+
+        catalog_version("test-catalog-v2")
+        reseeded = client.get(path)
+        cached_again = client.get(path)
+    finally:
+        response_cache.invalidate()
+
+    assert cached.json()["course_name"] == "Test Course Basics"
+    assert reseeded.json()["course_name"] == "Test Course Reseeded"
+    assert reseeded.headers["etag"] == '"test-catalog-v2"'
+    assert cached_again.content == reseeded.content
+
+
+def test_fast_json_responses_match_validated_responses(
+    client, course_catalog, catalog_version, monkeypatch
+):
+    paths = [
+        f"/courses/{course_catalog['advanced']}",
+        f"/courses/{course_catalog['advanced']}/handouts",
+        f"/courses/batch?ids={course_catalog['advanced']},0",
+        "/courses/all?level=test+level",
+        "/courses/series",
+    ]
+    validated = [client.get(path) for path in paths]
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = [client.get(path) for path in paths]
+
+    for slow_response, fast_response in zip(validated, fast):
+        assert fast_response.status_code == 200
+        assert fast_response.content == slow_response.content
+        assert fast_response.headers["content-type"] == "application/json"
+        assert fast_response.headers.get("etag") == slow_response.headers.get("etag")
+
+
+def test_sub_resources_use_one_column_only_query(client, course_catalog):
+    advanced = course_catalog["advanced"]
+    client.get("/courses/formats")  # reads the catalog version once per TTL
+    with count_queries() as statements:
+        handouts = client.get(f"/courses/{advanced}/handouts")
+        materials = client.get(f"/courses/{advanced}/additional-materials")
+        upcoming = client.get(f"/courses/{advanced}/upcoming", follow_redirects=False)
+
+    assert len(statements) == 3
+    assert all("description" not in statement for statement in statements)
+    assert [h["url"] for h in handouts.json()["handouts"]] == [
+        f"https://example.com/advanced-{i}" for i in range(3)
+    ]
+    assert materials.json()["additional_materials"] == [
+        f"https://example.com/material-{i}" for i in range(2)
+    ]
+    assert upcoming.status_code == 307
+    assert upcoming.headers["location"].endswith("keyword=Test+Course+Advanced")
+
+
+def test_sub_resources_of_course_without_them_or_missing_course(client, course_catalog):
+    basics = course_catalog["basics"]
+    assert client.get(f"/courses/{basics}/handouts").json() == {"handouts": []}
+    assert client.get(f"/courses/{basics}/additional-materials").json() == {
+        "additional_materials": []
+    }
+
+    missing = max(course_catalog.values()) + 1000
+    with count_queries() as statements:
+        assert client.get(f"/courses/{missing}/handouts").json() is None
+        assert client.get(f"/courses/{missing}/additional-materials").json() is None
+        upcoming = client.get(f"/courses/{missing}/upcoming", follow_redirects=False)
+    assert upcoming.status_code == 404
+    assert len(statements) == 3
+
+
+def test_prerequisites_and_learning_path_with_and_without_cache(
+    client, course_catalog, monkeypatch
+):
+    advanced = course_catalog["advanced"]
+    paths = [
+        f"/courses/{advanced}/prerequisites",
+        f"/courses/{advanced}/prerequisites?transitive=true",
+        f"/courses/{course_catalog['intermediate']}/learning-path",
+    ]
+    from_db = [client.get(path).json() for path in paths]
+
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        with count_queries() as statements:
+            from_cache = [client.get(path).json() for path in paths]
+    finally:
+        catalog_store.clear()
+
+    assert statements == []
+    assert from_cache == from_db
+    assert [c["course_name"] for c in from_db[0]["prerequisites"]] == [
+        "Test Course Basics",
+        "Test Course Intermediate",
+    ]
+    assert [c["id"] for c in from_db[2]["steps"]] == [
+        course_catalog["basics"],
+        course_catalog["intermediate"],
+    ]
+
+
+def test_prerequisites_of_missing_course(client, course_catalog):
+    missing = max(course_catalog.values()) + 1000
+    assert client.get(f"/courses/{missing}/prerequisites").status_code == 404
+    assert client.get(f"/courses/{missing}/learning-path").status_code == 404
+
+
+def test_learning_path_order_matches_with_and_without_cache(
+    client, course_catalog, test_session, monkeypatch
+):
+    # basics and intermediate have no prerequisites, advanced requires
+    # intermediate, and standalone requires advanced and basics
+    ids = course_catalog
+    with test_session() as session:
+        session.execute(
+            delete(Prerequisite).where(Prerequisite.course_id.in_(ids.values()))
+        )
+        session.add_all(
+            [
+                Prerequisite(course_id=ids["advanced"], prereq_id=ids["intermediate"]),
+                Prerequisite(course_id=ids["standalone"], prereq_id=ids["advanced"]),
+                Prerequisite(course_id=ids["standalone"], prereq_id=ids["basics"]),
+            ]
+        )
+        session.commit()
+    paths = [
+        f"/courses/{ids['standalone']}/learning-path",
+        f"/courses/{ids['standalone']}/prerequisites?transitive=true",
+        f"/courses/{ids['standalone']}/prerequisites",
+    ]
+    from_db = [client.get(path).json() for path in paths]
+
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        from_cache = [client.get(path).json() for path in paths]
+    finally:
+        catalog_store.clear()
+
+    # Farthest prerequisites first, then by id
+    names = {course_id: name for name, course_id in ids.items()}
+    assert [names[c["id"]] for c in from_db[0]["steps"]] == [
+        "intermediate",
+        "basics",
+        "advanced",
+        "standalone",
+    ]
+    assert from_cache == from_db
+
+
+def test_recursive_ancestry_and_unlocks(test_session, course_catalog):
+    names = {course_id: name for name, course_id in course_catalog.items()}
+    with test_session() as db:
+        with count_queries() as statements:
+            ancestry = course_crud.get_ancestry(db, course_catalog["advanced"])
+        unlocks = course_crud.get_unlocks(db, course_catalog["basics"])
+        nearest = course_crud.get_unlocks(db, course_catalog["basics"], max_depth=1)
+        standalone = course_crud.get_ancestry(db, course_catalog["standalone"])
+        missing = course_crud.get_ancestry(db, max(course_catalog.values()) + 1000)
+
+    assert len(statements) == 1
+    assert "WITH RECURSIVE" in statements[0]
+    assert [names[c.id] for c in ancestry] == ["basics", "intermediate"]
+    assert [names[c.id] for c in unlocks] == ["intermediate", "advanced"]
+    assert [names[c.id] for c in nearest] == ["intermediate", "advanced"]
+    assert standalone == []
+    assert missing is None
+
+
+def test_recursive_ancestry_detects_cycles(test_session, course_catalog):
+    with test_session() as db:
+        db.add(
+            Prerequisite(
+                course_id=course_catalog["basics"], prereq_id=course_catalog["advanced"]
+            )
+        )
+        db.flush()
+        with pytest.raises(PrerequisiteCycleError):
+            course_crud.get_ancestry(db, course_catalog["advanced"])
+        db.rollback()
+
+
+@pytest.fixture
+def prerequisite_cycle(course_catalog, test_session):
+    """Makes basics require advanced, which already requires basics."""
+    with test_session() as session:
+        session.add(
+            Prerequisite(
+                course_id=course_catalog["basics"], prereq_id=course_catalog["advanced"]
+            )
+        )
+        session.commit()
+
+
+def test_prerequisite_cycle_is_a_conflict(client, course_catalog, prerequisite_cycle):
+    path = f"/courses/{course_catalog['advanced']}"
+
+    for response in [
+        client.get(f"{path}/prerequisites", params={"transitive": True}),
+        client.get(f"{path}/learning-path"),
+    ]:
+        assert response.status_code == 409
+        assert "Prerequisite cycle" in response.json()["detail"]
+
+
+def test_reload_with_prerequisite_cycle_keeps_snapshot(
+    client, course_catalog, catalog_version, test_session, monkeypatch
+):
+    path = f"/courses/{course_catalog['advanced']}/learning-path"
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        before = client.get(path).json()
+        with test_session() as session:
+            session.add(
+                Prerequisite(
+                    course_id=course_catalog["basics"],
+                    prereq_id=course_catalog["advanced"],
+                )
+            )
+            session.commit()
+        catalog_version("test-catalog-v2")
+        response = client.get(path)
+        formats = client.get("/courses/formats")
+        snapshot = catalog_store.snapshot
+    finally:
+        catalog_store.clear()
+
+    assert response.status_code == 200
+    assert response.json() == before
+    assert formats.status_code == 200
+    assert snapshot.catalog_version == "test-catalog-v1"
+
+
+def test_compressed_catalog_responses_reuse_variants(
+    client, course_catalog, catalog_version, monkeypatch
+):
+    monkeypatch.setattr(settings, "COMPRESSION_ENABLED", True)
+    monkeypatch.setattr(settings, "COMPRESSION_MIN_SIZE", 200)
+    compressed_variants.invalidate()
+    path = f"/courses/{course_catalog['advanced']}"
+    plain = client.get(path, headers={"Accept-Encoding": "identity"})
+    hits = compressed_variants.hits
+
+    responses = [client.get(path, headers={"Accept-Encoding": "gzip"}) for _ in range(2)]
+
+    assert compressed_variants.hits == hits + 1
+    for response in responses:
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == 'W/"test-catalog-v1"'
+        assert response.content == plain.content
+        assert int(response.headers["content-length"]) < len(plain.content)
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+
+    not_modified = client.get(
+        path, headers={"Accept-Encoding": "gzip", "If-None-Match": 'W/"test-catalog-v1"'}
+    )
+    assert not_modified.status_code == 304
+
+
+def test_small_responses_are_not_compressed(client, catalog_version, monkeypatch):
+    monkeypatch.setattr(settings, "COMPRESSION_ENABLED", True)
+    monkeypatch.setattr(settings, "COMPRESSION_MIN_SIZE", 1024)
+    response = client.get("/courses/levels", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+def test_export_streams_every_course_with_chunked_loading(
+    client, test_session, course_catalog, monkeypatch
+):
+    monkeypatch.setattr(settings, "COURSE_EXPORT_CHUNK_SIZE", 3)
+    with count_queries() as statements:
+        response = client.get("/courses/export.ndjson")
+    with test_session() as session:
+        chunks = math.ceil(session.scalar(select(func.count(Course.id))) / 3)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    ids = [line["id"] for line in lines]
+    assert ids == sorted(ids)
+    assert set(course_catalog.values()) <= set(ids)
+    # One cursor over the courses, then one IN query per collection per chunk
+    collection_queries = [s for s in statements if " IN (" in s]
+    assert len(collection_queries) == 4 * chunks
+    assert len(statements) - len(collection_queries) <= 2
+
+    for line in lines:
+        if line["id"] not in course_catalog.values():
+            continue
+        course_id = line.pop("id")
+        assert line == client.get(f"/courses/{course_id}").json()
+
+
+def test_export_from_catalog_cache_matches_database(client, course_catalog, monkeypatch):
+    def parse(export: str) -> list[dict]:
+        # Collections come back in no particular order
+        lines = [json.loads(line) for line in export.splitlines()]
+        for line in lines:
+            line["series"].sort()
+            line["prereqs"].sort()
+        return lines
+
+    monkeypatch.setattr(settings, "COURSE_EXPORT_CHUNK_SIZE", 3)
+    from_db = parse(client.get("/courses/export.ndjson").text)
+
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        with count_queries() as statements:
+            from_cache = parse(client.get("/courses/export.ndjson").text)
+    finally:
+        catalog_store.clear()
+
+    assert statements == []
+    assert from_cache == from_db
+
+
+@pytest.fixture
+def catalog_bundle(catalog_version, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CATALOG_BUNDLE_DIR", str(tmp_path))
+    version = catalog_version("0123456789abcdef" * 4)
+    tables = {table: pd.DataFrame({"id": [1, 2]}) for table in BUNDLE_TABLES}
+    tables["courses"] = pd.DataFrame(
+        {"id": range(1, 201), "course_name": [f"Course {i}" for i in range(200)]}
+    )
+    write_catalog_bundle(tmp_path, version, tables)
+    return version
+
+
+def test_catalog_bundle_manifest(client, catalog_bundle):
+    response = client.get("/courses/bundle")
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == f'"{catalog_bundle}"'
+    manifest = response.json()
+    assert manifest["version"] == catalog_bundle
+    courses = next(t for t in manifest["tables"] if t["name"] == "courses")
+    assert courses["rows"] == 200
+    assert courses["columns"] == ["id", "course_name"]
+    assert courses["url"].endswith(f"/courses/bundle/{catalog_bundle}/courses.parquet")
+
+    table = client.get(courses["url"])
+    assert table.status_code == 200
+    assert table.headers["cache-control"] == settings.CACHE_CONTROL_CATALOG_BUNDLE
+    assert len(table.content) == courses["size"]
+
+
+def test_catalog_bundle_serves_byte_ranges_uncompressed(
+    client, catalog_bundle, monkeypatch
+):
+    monkeypatch.setattr(settings, "COMPRESSION_ENABLED", True)
+    monkeypatch.setattr(settings, "COMPRESSION_MIN_SIZE", 0)
+    path = f"/courses/bundle/{catalog_bundle}/courses.parquet"
+    full = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    # A Parquet file starts and ends with its magic number; the footer
+    # length precedes the trailing one
+    head = client.get(path, headers={"Range": "bytes=0-3", "Accept-Encoding": "gzip"})
+    tail = client.get(path, headers={"Range": "bytes=-8"})
+
+    assert "content-encoding" not in full.headers
+    assert full.content[:4] == b"PAR1"
+    assert head.status_code == 206
+    assert "content-encoding" not in head.headers
+    assert head.content == b"PAR1"
+    assert tail.status_code == 206
+    assert tail.content == full.content[-8:]
+    size = len(full.content)
+    assert tail.headers["content-range"] == f"bytes {size - 8}-{size - 1}/{size}"
+
+
+def test_catalog_bundle_not_found(client, catalog_version, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CATALOG_BUNDLE_DIR", str(tmp_path))
+    version = "0123456789abcdef" * 4
+
+    assert client.get("/courses/bundle").status_code == 404
+    assert client.get(f"/courses/bundle/{version}/courses.parquet").status_code == 404
+    assert client.get("/courses/bundle/..%2F..%2Fetc/courses.parquet").status_code == 404
+    assert client.get(f"/courses/bundle/{version}/users.parquet").status_code == 404
+
+
+def test_facets_with_and_without_cache(client, course_catalog, monkeypatch):
+    params = {"series": ["test series 0", "test series 1"], "limit": 1}
+    with count_queries() as statements:
+        from_db = client.get("/courses/facets", params=params).json()
+
+    monkeypatch.setattr(settings, "CATALOG_CACHE_MODE", True)
+    with get_managed_db() as db:
+        course_crud.reload_catalog(db)
+    try:
+        with count_queries() as cached_statements:
+            from_cache = client.get("/courses/facets", params=params).json()
+    finally:
+        catalog_store.clear()
+
+    # The page, then every count from one grouped query
+    assert len([s for s in statements if "catalog_versions" not in s]) == 2
+    assert cached_statements == []
+    assert from_cache == from_db
+    assert from_db["total"] == 2
+    assert [c["course_name"] for c in from_db["courses"]] == ["Test Course Advanced"]
+    assert from_db["next_cursor"] is not None
+    assert from_db["facets"]["level"]["test level"] == 2
+    assert from_db["facets"]["format"]["test format"] == 2
+    # Series are counted without the series filter
+    assert [from_db["facets"]["series"][f"test series {i}"] for i in range(4)] == [
+        2,
+        1,
+        1,
+        1,
+    ]
+
+
+def test_facets_of_search_results(client, course_catalog):
+    response = client.get(
+        "/courses/facets",
+        params={"search": "Test Course Advanced", "level": "test level"},
+    )
+
+    facets = response.json()["facets"]
+    assert response.json()["total"] == 1
+    assert facets["level"]["test level"] == 1
+    assert all(count == 1 for count in facets["series"].values() if count)
+    assert sorted(s for s, count in facets["series"].items() if count) == [
+        f"test series {i}" for i in range(4)
+    ]
+
+
+def test_course_detail_view_reads_one_row(client, course_catalog, monkeypatch):
+    paths = [f"/courses/{course_id}" for course_id in course_catalog.values()]
+    ids = ",".join(str(i) for i in course_catalog.values())
+    from_joins = [client.get(path).json() for path in paths]
+    batch_from_joins = client.get(f"/courses/batch?ids={ids}").json()
+
+    monkeypatch.setattr(settings, "COURSE_DETAIL_VIEW_ENABLED", True)
+    with count_queries() as statements:
+        from_view = [client.get(path).json() for path in paths]
+    batch_from_view = client.get(f"/courses/batch?ids={ids}").json()
+    missing = client.get(f"/courses/{max(course_catalog.values()) + 1000}")
+
+    detail_queries = [s for s in statements if "catalog_versions" not in s]
+    assert len(detail_queries) == len(paths)
+    assert all("FROM course_details" in s for s in detail_queries)
+    assert from_view == from_joins
+    assert batch_from_view == batch_from_joins
+    assert missing.status_code == 200
+    assert missing.json() is None
+
+
+@pytest.mark.parametrize("view", [False, True])
+def test_course_detail_orders_series_by_name(
+    client, course_catalog, _engine, test_session, monkeypatch, view
+):
+    with test_session() as session:
+        # Added last, but sorts first
+        series = Series(series_name="test series -1")
+        session.add(series)
+        session.flush()
+        session.add(
+            CourseSeries(course_id=course_catalog["advanced"], series_id=series.id)
+        )
+        session.commit()
+    refresh_course_details_view(_engine)
+    monkeypatch.setattr(settings, "COURSE_DETAIL_VIEW_ENABLED", view)
+
+    detail = client.get(f"/courses/{course_catalog['advanced']}").json()
+
+    names = [f"test series {i}" for i in range(-1, 4)]
+    assert detail["series"] == names
+    assert detail["prereqs"] == ["Test Course Basics", "Test Course Intermediate"]
+
+
+@pytest.mark.parametrize("view", [False, True])
+def test_course_with_invalid_detail_data_is_left_out(
+    client, course_catalog, _engine, test_session, monkeypatch, view
+):
+    with test_session() as session:
+        session.add(AdditionalMaterial(course_id=course_catalog["advanced"], url="bad"))
+        session.commit()
+    refresh_course_details_view(_engine)
+    monkeypatch.setattr(settings, "COURSE_DETAIL_VIEW_ENABLED", view)
+    ids = [course_catalog["advanced"], course_catalog["basics"]]
+
+    detail = client.get(f"/courses/{course_catalog['advanced']}")
+    batch = client.get("/courses/batch", params={"ids": ",".join(map(str, ids))})
+
+    assert detail.status_code == 200
+    assert detail.json() is None
+    assert [course["id"] for course in batch.json()["courses"]] == ids[1:]
@@ -0,0 +1,103 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+from sqlalchemy.engine import Engine
+
+from techconnect_classes_api.main import app
+from techconnect_classes_api.models import Course
+from techconnect_classes_api.services.recommendation_service import (
+    recommendation_store,
+)
+
+
+@pytest.fixture
+def engine_reset():
+    """Rebuilds the recommendation engine on first use, once the catalog
+    fixtures exist, and drops it afterwards."""
+    recommendation_store.clear()
+    yield
+    recommendation_store.clear()
+
+
+def test_recommendation_requires_authentication(client):
+    assert client.get("/me/recommendation").status_code == 401
+
+
+def test_recommendation(client, course_catalog, auth_headers, engine_reset):
+    body = {"course_ids": [course_catalog["basics"]]}
+    client.put("/users/me/courses-taken", json=body, headers=auth_headers)
+
+    response = client.get("/me/recommendation?limit=2", headers=auth_headers)
+
+    assert response.status_code == 200
+    courses = response.json()["courses"]
+    # The next step of the taken course first, then the course sharing its
+    # level and format; the advanced course still misses a prerequisite
+    assert [c["id"] for c in courses] == [
+        course_catalog["intermediate"],
+        course_catalog["standalone"],
+    ]
+    assert courses[0]["course_name"] == "Test Course Intermediate"
+    assert courses[0]["score"] > courses[1]["score"]
+
+
+def test_recommendation_follows_interests(
+    client, course_catalog, auth_headers, engine_reset
+):
+    body = {"series": ["test series 3"]}
+    client.put("/users/me/series-interested", json=body, headers=auth_headers)
+
+    response = client.get("/me/recommendation?limit=1", headers=auth_headers)
+
+    # The only course of the series needs prerequisites the user hasn't taken
+    assert response.json()["courses"][0]["id"] != course_catalog["advanced"]
+
+    body = {"course_ids": [course_catalog["basics"], course_catalog["intermediate"]]}
+    client.put("/users/me/courses-taken", json=body, headers=auth_headers)
+    response = client.get("/me/recommendation?limit=1", headers=auth_headers)
+    assert response.json()["courses"][0]["id"] == course_catalog["advanced"]
+
+
+def test_recommendation_limit_is_bounded(client, auth_headers):
+    response = client.get("/me/recommendation?limit=51", headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_recommendation_follows_reseed(
+    client, course_catalog, auth_headers, catalog_version, test_session, engine_reset
+):
+    body = {"course_ids": [course_catalog["basics"]]}
+    client.put("/users/me/courses-taken", json=body, headers=auth_headers)
+    client.get("/me/recommendation?limit=1", headers=auth_headers)
+    with test_session() as session:
+        session.execute(
+            update(Course)
+            .where(Course.id == course_catalog["intermediate"])
+            .values(course_name="Test Course Reseeded")
+        )
+        session.commit()
+
+    stale = client.get("/me/recommendation?limit=1", headers=auth_headers)
+    catalog_version("test-catalog-v2")
+    reseeded = client.get("/me/recommendation?limit=1", headers=auth_headers)
+
+    assert stale.json()["courses"][0]["course_name"] == "Test Course Intermediate"
+    assert reseeded.json()["courses"][0]["course_name"] == "Test Course Reseeded"
+
+
+def test_startup_does_not_load_the_catalog(engine_reset):
+    """The engine is built on first use, so the app starts on an unseeded
+    database."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with TestClient(app):
+            pass
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+    assert statements == []
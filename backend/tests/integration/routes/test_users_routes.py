@@ -0,0 +1,160 @@
+import pytest
+from sqlalchemy import delete, event, select
+from sqlalchemy.engine import Engine
+
+from techconnect_classes_api.core.security import bcrypt_context
+from techconnect_classes_api.crud.user import user_crud
+from techconnect_classes_api.models import User
+
+PREFIX = "test import "
+
+
+@pytest.fixture
+def cleanup_users(_tables, test_session):
+    yield
+    with test_session() as session:
+        session.execute(delete(User).where(User.username.like(f"{PREFIX}%")))
+        session.commit()
+
+
+def test_sign_up_is_one_insert(client, cleanup_users, test_session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    body = {"username": f"{PREFIX}new", "password": "password"}
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.post("/users/", json=body)
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+    assert response.status_code == 201
+    assert response.json() == {"username": f"{PREFIX}new"}
+    assert len(statements) == 1
+    assert "ON CONFLICT (username) DO NOTHING" in statements[0]
+
+    response = client.post("/users/", json=body)
+    assert response.status_code == 409
+    with test_session() as session:
+        assert user_crud.authenticate_user(session, f"{PREFIX}new", "password")
+
+
+def test_bulk_import(cleanup_users, test_session):
+    hashed = bcrypt_context(4).hash("password")
+    users = ((f"{PREFIX}{i}", hashed) for i in range(25))
+
+    with test_session() as session:
+        assert user_crud.bulk_import(session, users, batch_size=10) == 25
+        # Existing usernames are skipped, also within a batch
+        again = [(f"{PREFIX}0", hashed), (f"{PREFIX}25", hashed), (f"{PREFIX}25", hashed)]
+        assert user_crud.bulk_import(session, iter(again), batch_size=10) == 1
+
+        usernames = session.scalars(
+            select(User.username).where(User.username.like(f"{PREFIX}%"))
+        ).all()
+    assert len(usernames) == 26
+
+
+def test_bulk_import_rejects_plain_passwords(cleanup_users, test_session):
+    hashed = bcrypt_context(4).hash("password")
+    users = [(f"{PREFIX}0", hashed), (f"{PREFIX}1", hashed), (f"{PREFIX}2", "password")]
+
+    with test_session() as session:
+        with pytest.raises(ValueError, match=f"{PREFIX}2"):
+            user_crud.bulk_import(session, iter(users), batch_size=2)
+
+        usernames = session.scalars(
+            select(User.username).where(User.username.like(f"{PREFIX}%"))
+        ).all()
+    # The batch before the invalid hash stays imported
+    assert sorted(usernames) == [f"{PREFIX}0", f"{PREFIX}1"]
+
+
+def test_courses_taken_requires_authentication(client):
+    assert client.get("/users/me/courses-taken").status_code == 401
+
+
+def test_replace_courses_taken(client, course_catalog, auth_headers):
+    url = "/users/me/courses-taken"
+    assert client.get(url, headers=auth_headers).json() == {"courses": []}
+
+    body = {"course_ids": [course_catalog["basics"], course_catalog["advanced"]]}
+    response = client.put(url, json=body, headers=auth_headers)
+    assert response.status_code == 200
+
+    body = {"course_ids": [course_catalog["advanced"], course_catalog["standalone"]]}
+    response = client.put(url, json=body, headers=auth_headers)
+    expected = {
+        "courses": [
+            {"id": course_catalog["advanced"], "course_name": "Test Course Advanced"},
+            {
+                "id": course_catalog["standalone"],
+                "course_name": "Test Course Without Series",
+            },
+        ]
+    }
+    assert response.json() == expected
+    assert client.get(url, headers=auth_headers).json() == expected
+
+    response = client.put(url, json={"course_ids": []}, headers=auth_headers)
+    assert response.json() == {"courses": []}
+
+
+def test_replace_courses_taken_is_one_transaction(
+    client, course_catalog, auth_headers
+):
+    url = "/users/me/courses-taken"
+    client.get(url, headers=auth_headers)  # caches the user
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    course_ids = list(course_catalog.values())
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        client.put(url, json={"course_ids": course_ids[:2]}, headers=auth_headers)
+        client.put(url, json={"course_ids": course_ids[1:]}, headers=auth_headers)
+        client.get(url, headers=auth_headers)
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+    # Lock, lookup, delete and insert per replacement whatever the list sizes,
+    # and one joined query per read
+    replacement = ["SELECT", "SELECT", "DELETE", "INSERT"]
+    assert [s.split()[0] for s in statements] == replacement * 2 + ["SELECT"]
+
+
+def test_replace_with_unknown_course_changes_nothing(
+    client, course_catalog, auth_headers
+):
+    url = "/users/me/courses-taken"
+    body = {"course_ids": [course_catalog["basics"]]}
+    client.put(url, json=body, headers=auth_headers)
+
+    body = {"course_ids": [course_catalog["advanced"], 999_999_999]}
+    response = client.put(url, json=body, headers=auth_headers)
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Unknown courses: [999999999]"
+    courses = client.get(url, headers=auth_headers).json()["courses"]
+    assert [c["id"] for c in courses] == [course_catalog["basics"]]
+
+
+def test_replace_series_interested(client, course_catalog, auth_headers):
+    url = "/users/me/series-interested"
+    body = {"series": ["test series 2", "test series 0", "test series 2"]}
+
+    response = client.put(url, json=body, headers=auth_headers)
+    assert response.json() == {"series": ["test series 0", "test series 2"]}
+
+    body = {"series": ["test series 1"]}
+    assert client.put(url, json=body, headers=auth_headers).json() == body
+    assert client.get(url, headers=auth_headers).json() == body
+
+    body = {"series": ["no such series"]}
+    response = client.put(url, json=body, headers=auth_headers)
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Unknown series: ['no such series']"
@@ -0,0 +1,56 @@
+import pytest
+
+from techconnect_classes_api.services import auth_cache
+from techconnect_classes_api.services.auth_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(auth_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire(clock):
+    cache = TTLCache(max_entries=10, ttl_seconds=30)
+    cache.set(1, "a")
+    cache.set(2, "b", ttl_seconds=5)
+    cache.set(3, "c", ttl_seconds=60)
+
+    clock[0] = 10
+    assert cache.get(1) == "a"
+    assert cache.get(2) is None
+    # Stored TTLs are capped by the cache's
+    clock[0] = 30
+    assert cache.get(3) is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "entries": 1}
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    cache = TTLCache(max_entries=2, ttl_seconds=30)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    cache.get(1)
+    cache.set(3, "c")
+
+    assert cache.get(2) is None
+    assert cache.get(1) == "a"
+    assert cache.get(3) == "c"
+
+
+def test_invalidate(clock):
+    cache = TTLCache(max_entries=2, ttl_seconds=30)
+    cache.set(1, "a")
+    cache.invalidate(1)
+    cache.invalidate(2)
+
+    assert cache.get(1) is None
+
+
+@pytest.mark.parametrize("max_entries, ttl_seconds", [(0, 30), (10, 0)])
+def test_disabled_cache_stores_nothing(clock, max_entries, ttl_seconds):
+    cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+    cache.set(1, "a")
+
+    assert len(cache) == 0
+    assert cache.get(1) is None
@@ -0,0 +1,208 @@
+import pytest
+
+from techconnect_classes_api.schemas.course import (
+    CourseAdditionalMaterialsResponse,
+    CourseDetailResponse,
+    CourseFormatsResponse,
+    CourseHandoutsResponse,
+    CourseLanguagesResponse,
+    CourseLevelsResponse,
+    CourseNodeQuery,
+    CourseNodeResponse,
+    CourseSeriesResponse,
+)
+from techconnect_classes_api.services.bitmap_index import BitmapIndex
+from techconnect_classes_api.services.catalog import CatalogSnapshot, CatalogStore
+from techconnect_classes_api.services.pagination import InvalidCursorError, encode_cursor
+from techconnect_classes_api.services.prerequisite_graph import PrerequisiteGraph
+
+
+def make_snapshot(courses: list[tuple[int, str, str, str, list[str]]]) -> CatalogSnapshot:
+    courses = sorted(courses, key=lambda c: (c[1], c[0]))
+    details = {
+        course_id: CourseDetailResponse(
+            course_name=name,
+            description=f"{name} description",
+            series=series,
+            level=level,
+            format=fmt,
+            prereqs=[],
+            available_handouts=[],
+            additional_materials=[],
+            link_to_upcoming_sessions=f"https://www.nypl.org/techconnect?keyword={name}",
+        )
+        for course_id, name, level, fmt, series in courses
+    }
+    nodes = [CourseNodeResponse(id=c[0], course_name=c[1]) for c in courses]
+    return CatalogSnapshot(
+        courses=nodes,
+        index=BitmapIndex.build(
+            len(courses),
+            {
+                "level": [[c[2]] for c in courses],
+                "format": [[c[3]] for c in courses],
+                "series": [c[4] for c in courses],
+            },
+        ),
+        prerequisites=PrerequisiteGraph.build(nodes, []),
+        details=details,
+        handouts={c[0]: CourseHandoutsResponse(handouts=[]) for c in courses},
+        additional_materials={
+            c[0]: CourseAdditionalMaterialsResponse(additional_materials=[])
+            for c in courses
+        },
+        upcoming_links={c[0]: details[c[0]].link_to_upcoming_sessions for c in courses},
+        formats=CourseFormatsResponse(formats=["class", "lab"]),
+        levels=CourseLevelsResponse(levels=["beginner", "advanced"]),
+        series=CourseSeriesResponse(series=["python", "excel", "programming"]),
+        languages=CourseLanguagesResponse(languages={"english": "en"}),
+    )
+
+
+@pytest.fixture
+def snapshot():
+    return make_snapshot(
+        [
+            (1, "Excel For Beginners", "beginner", "class", ["excel"]),
+            (2, "Python For Beginners", "beginner", "class", ["python", "programming"]),
+            (3, "Intermediate Python Functions", "advanced", "class", ["python"]),
+            (4, "Open Lab", "beginner", "lab", []),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "query, expected_ids",
+    [
+        ({}, [1, 3, 4, 2]),
+        ({"level": "beginner"}, [1, 4, 2]),
+        ({"format": "lab"}, [4]),
+        ({"series": "python"}, [3, 2]),
+        ({"series": "python", "level": "beginner"}, [2]),
+        ({"series": "python", "format": "lab"}, []),
+        ({"level": "unknown"}, []),
+        ({"series": ["excel", "programming"]}, [1, 2]),
+        ({"series": ["excel", "python"], "level": ["beginner"]}, [1, 2]),
+        ({"level": ["beginner", "advanced"], "format": ["lab"]}, [4]),
+        ({"series": ["unknown", "excel"]}, [1]),
+    ],
+)
+def test_filter_courses(snapshot, query, expected_ids):
+    res = snapshot.filter_courses(CourseNodeQuery(**query))
+
+    assert [course.id for course in res.courses] == expected_ids
+    assert res.next_cursor is None
+
+
+@pytest.mark.parametrize(
+    "query, expected_pages",
+    [
+        ({"limit": 2}, [[1, 3], [4, 2]]),
+        ({"limit": 3}, [[1, 3, 4], [2]]),
+        ({"limit": 1, "level": "beginner"}, [[1], [4], [2]]),
+    ],
+)
+def test_filter_courses_pages(snapshot, query, expected_pages):
+    pages = []
+    cursor = None
+    while True:
+        res = snapshot.filter_courses(CourseNodeQuery(**query, cursor=cursor))
+        pages.append([course.id for course in res.courses])
+        if not (cursor := res.next_cursor):
+            break
+
+    assert pages == expected_pages
+
+
+@pytest.mark.parametrize(
+    "query, total, facets",
+    [
+        (
+            {},
+            4,
+            {
+                "level": {"advanced": 1, "beginner": 3},
+                "format": {"class": 3, "lab": 1},
+                "series": {"excel": 1, "programming": 1, "python": 2},
+            },
+        ),
+        (
+            # A field's own filter doesn't narrow its counts
+            {"level": "beginner", "series": "python"},
+            1,
+            {
+                "level": {"advanced": 1, "beginner": 1},
+                "format": {"class": 1, "lab": 0},
+                "series": {"excel": 1, "programming": 1, "python": 1},
+            },
+        ),
+        (
+            {"format": "lab"},
+            1,
+            {
+                "level": {"advanced": 0, "beginner": 1},
+                "format": {"class": 3, "lab": 1},
+                "series": {"excel": 0, "programming": 0, "python": 0},
+            },
+        ),
+    ],
+)
+def test_facets(snapshot, query, total, facets):
+    res = snapshot.facets(CourseNodeQuery(**query, limit=1))
+
+    assert res.total == total
+    assert res.facets.model_dump() == facets
+    assert [course.id for course in res.courses] == [
+        course.id for course in snapshot.filter_courses(CourseNodeQuery(**query, limit=1)).courses
+    ]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not base64!", encode_cursor([1, 2]), encode_cursor(["a"]), encode_cursor({})],
+)
+def test_filter_courses_invalid_cursor(snapshot, cursor):
+    with pytest.raises(InvalidCursorError):
+        snapshot.filter_courses(CourseNodeQuery(cursor=cursor))
+
+
+def test_catalog_store_swap_increments_version(snapshot):
+    store = CatalogStore()
+    assert store.snapshot is None
+    assert store.version == 0
+
+    first = store.swap(snapshot)
+    second = store.swap(snapshot)
+
+    assert (first.version, second.version) == (1, 2)
+    assert store.snapshot is second
+    assert first.filter_courses(CourseNodeQuery(level="beginner")) == second.filter_courses(
+        CourseNodeQuery(level="beginner")
+    )
+
+    store.clear()
+    assert store.snapshot is None
+    assert store.version == 2
+
+
+def test_bitmap_index_count():
+    index = BitmapIndex.build(10, {"parity": [["even" if i % 2 == 0 else "odd"] for i in range(10)]})
+
+    assert index.count(index.bitset("parity", ["even"])) == 5
+    assert index.count(index.bitset("parity", ["even", "odd"])) == 10
+    assert index.positions(index.bitset("parity", ["odd"])).tolist() == [1, 3, 5, 7, 9]
+    assert index.match({"parity": None}) is None
+
+
+def test_bitmap_index_counts():
+    index = BitmapIndex.build(
+        10, {"mod": [[str(i % 3)] + (["zero"] if i == 0 else []) for i in range(10)]}
+    )
+
+    assert index.counts("mod") == {"0": 4, "zero": 1, "1": 3, "2": 3}
+    assert index.counts("mod", index.bitset("mod", ["1", "2"])) == {
+        "0": 0,
+        "zero": 0,
+        "1": 3,
+        "2": 3,
+    }
@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from techconnect_classes_api.core.config import Settings
+from techconnect_classes_api.services.catalog_bundle import (
+    BUNDLE_TABLES,
+    bundle_dir,
+    write_catalog_bundle,
+)
+
+VERSION = "0123456789abcdef" * 4
+
+
+def bundle_tables() -> dict[str, pd.DataFrame]:
+    tables = {table: pd.DataFrame({"id": [1, 2]}) for table in BUNDLE_TABLES}
+    tables["courses"] = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "course_name": ["Excel For Beginners", "Open Lab", "Photoshop Basics"],
+            "description": ["excel", "lab", "photoshop"],
+            "level_id": [2, 4, 3],
+            "format_id": [1, 2, 1],
+        }
+    )
+    return tables
+
+
+@pytest.mark.parametrize("version", ["", "latest", "../" + VERSION, VERSION[:-1]])
+def test_bundle_dir_rejects_malformed_versions(version):
+    assert bundle_dir(version) is None
+
+
+def test_write_catalog_bundle(tmp_path):
+    directory = write_catalog_bundle(tmp_path, VERSION, bundle_tables())
+
+    assert directory == tmp_path / VERSION
+    assert sorted(p.name for p in directory.iterdir()) == sorted(
+        [f"{table}.parquet" for table in BUNDLE_TABLES] + ["manifest.json"]
+    )
+    manifest = json.loads((directory / "manifest.json").read_text())
+    assert manifest["version"] == VERSION
+    assert list(manifest["tables"]) == list(BUNDLE_TABLES)
+    assert manifest["tables"]["courses"]["rows"] == 3
+    assert manifest["tables"]["courses"]["columns"][:2] == ["id", "course_name"]
+
+    # Consumers can read only the columns they need
+    courses = pd.read_parquet(directory / "courses.parquet", columns=["course_name"])
+    assert courses["course_name"].tolist()[1] == "Open Lab"
+
+
+def test_write_catalog_bundle_replaces_same_version(tmp_path):
+    tables = bundle_tables()
+    write_catalog_bundle(tmp_path, VERSION, tables)
+
+    tables["courses"] = tables["courses"].head(1)
+    directory = write_catalog_bundle(tmp_path, VERSION, tables)
+
+    assert [p.name for p in tmp_path.iterdir()] == [VERSION]
+    assert len(pd.read_parquet(directory / "courses.parquet")) == 1
+
+
+
+def test_default_bundle_dir_does_not_depend_on_the_working_directory():
+    default = Path(Settings.model_fields["CATALOG_BUNDLE_DIR"].default)
+    assert default.is_absolute()
+    assert default.parent == Path(__file__).resolve().parents[2]
@@ -0,0 +1,96 @@
+import asyncio
+import gzip
+
+import brotli
+import pytest
+
+from techconnect_classes_api.api.compression import (
+    CompressionResponder,
+    StreamCompressor,
+    negotiate_encoding,
+)
+from techconnect_classes_api.services.response_cache import ResponseCache
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("gzip, deflate, br", "br"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("br;q=0, gzip;q=0.1", "gzip"),
+        ("*", "br"),
+        ("*;q=0.2, gzip;q=0", "br"),
+        ("gzip;q=0", None),
+        ("GZIP;q=bad", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+def test_stream_compressor_gzip():
+    compressor = StreamCompressor("gzip")
+    chunks = [b'{"id": 1}\n' * 100, b'{"id": 2}\n' * 100]
+    data = compressor.compress(chunks[0], final=False)
+    data += compressor.compress(chunks[1], final=True)
+    assert gzip.decompress(data) == b"".join(chunks)
+
+
+def test_stream_compressor_brotli():
+    compressor = StreamCompressor("br")
+    chunks = [b'{"id": 1}\n' * 100, b'{"id": 2}\n' * 100]
+    data = compressor.compress(chunks[0], final=False)
+    data += compressor.compress(chunks[1], final=True)
+    assert brotli.decompress(data) == b"".join(chunks)
+
+
+def respond(encoding, content_type, chunks):
+    """Messages sent by a responder wrapping an app that streams `chunks`."""
+
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", content_type)],
+            }
+        )
+        for i, chunk in enumerate(chunks):
+            more_body = i < len(chunks) - 1
+            await send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    responder = CompressionResponder(app, 100, encoding, ResponseCache(1024))
+    asyncio.run(responder({"type": "http"}, None, send))
+    return dict(sent[0]["headers"]), b"".join(m["body"] for m in sent[1:])
+
+
+def test_responder_compresses_streamed_responses():
+    chunks = [b'{"id": 1}\n' * 100, b'{"id": 2}\n' * 100]
+    headers, body = respond("gzip", b"application/x-ndjson", chunks)
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"vary"] == b"Accept-Encoding"
+    assert gzip.decompress(body) == b"".join(chunks)
+
+
+def test_responder_leaves_event_streams_alone():
+    chunks = [b"data: 1\n\n" * 100, b"data: 2\n\n" * 100]
+    headers, body = respond("gzip", b"text/event-stream", chunks)
+    assert b"content-encoding" not in headers
+    assert body == b"".join(chunks)
+
+
+def test_identity_responses_vary_by_accept_encoding():
+    headers, body = respond(None, b"application/json", [b"[]" * 100])
+    assert headers[b"vary"] == b"Accept-Encoding"
+    assert body == b"[]" * 100
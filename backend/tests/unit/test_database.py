@@ -0,0 +1,39 @@
+import pytest
+
+import techconnect_classes_api.models  # noqa: F401
+from techconnect_classes_api.database import close_db, init_db
+from techconnect_classes_api.database.db import Base
+
+
+def test_init_db_reuses_pooled_engine(test_settings):
+    close_db()
+    session_local = init_db(test_settings)
+
+    assert init_db(test_settings) is session_local
+    engine = session_local.kw["bind"]
+    assert engine.pool.size() == test_settings.POSTGRES_POOL_SIZE
+    assert engine.pool._max_overflow == test_settings.POSTGRES_MAX_OVERFLOW
+
+    close_db()
+    assert init_db(test_settings) is not session_local
+    close_db()
+
+
+@pytest.mark.parametrize(
+    "table, column",
+    [
+        ("courses", "level_id"),
+        ("courses", "format_id"),
+        ("handouts", "course_id"),
+        ("additional_materials", "course_id"),
+        ("course_series", "series_id"),
+        ("prerequisites", "prereq_id"),
+    ],
+)
+def test_catalog_foreign_keys_are_indexed(table, column):
+    indexes = {
+        index.name: [c.name for c in index.columns]
+        for index in Base.metadata.tables[table].indexes
+    }
+
+    assert indexes[f"{table}_{column}_idx"] == [column]
@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from techconnect_classes_api.api import dependencies
+from techconnect_classes_api.api.dependencies import etag_matches, get_token
+from techconnect_classes_api.core.security import create_access_token
+from techconnect_classes_api.services.auth_cache import token_cache
+from techconnect_classes_api.services.catalog import CatalogVersionTracker
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (None, False),
+        ("", False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"abcd"', False),
+        ("abc", False),
+    ],
+)
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, '"abc"') is expected
+
+
+def test_catalog_version_tracker_ttl(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    tracker = CatalogVersionTracker(ttl_seconds=30)
+    assert tracker.is_stale()
+
+    tracker.set("v1")
+    assert tracker.version == "v1"
+    assert not tracker.is_stale()
+
+    now += 30
+    assert tracker.is_stale()
+
+    tracker.clear()
+    assert tracker.version is None
+    assert tracker.is_stale()
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    token_cache.clear()
+    calls = []
+    decode = dependencies.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(dependencies.jwt, "decode", counting_decode)
+    yield calls
+    token_cache.clear()
+
+
+def test_get_token_caches_verified_payload(decode_calls):
+    token = create_access_token(subject=42)
+
+    assert get_token(token).sub == "42"
+    assert get_token(token).sub == "42"
+    assert len(decode_calls) == 1
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        create_access_token(subject=42, expires_delta=timedelta(minutes=-1)),
+        "not.a.token",
+    ],
+)
+def test_get_token_never_caches_rejected_tokens(decode_calls, token):
+    for _ in range(2):
+        with pytest.raises(HTTPException) as error:
+            get_token(token)
+        assert error.value.status_code == 401
+    assert len(decode_calls) == 2
+    assert len(token_cache) == 0
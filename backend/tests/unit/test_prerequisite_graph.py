@@ -0,0 +1,61 @@
+import pytest
+
+from techconnect_classes_api.schemas.course import CourseNodeResponse
+from techconnect_classes_api.services.prerequisite_graph import (
+    PrerequisiteCycleError,
+    PrerequisiteGraph,
+)
+
+# 1 -> 2 -> 4, 1 -> 3 -> 4, 5 -> 3; 6 stands alone
+COURSES = [CourseNodeResponse(id=i, course_name=f"course {i}") for i in range(1, 7)]
+EDGES = [(2, 1), (3, 1), (3, 5), (4, 2), (4, 3)]
+
+
+@pytest.fixture
+def graph():
+    return PrerequisiteGraph.build(COURSES, EDGES)
+
+
+def ids(courses):
+    return [c.id for c in courses]
+
+
+def test_topological_order(graph):
+    assert graph.order == (1, 2, 5, 3, 4, 6)
+    for course_id, prereq_id in EDGES:
+        assert graph.order.index(prereq_id) < graph.order.index(course_id)
+
+
+@pytest.mark.parametrize(
+    "course_id, transitive, expected",
+    [
+        (4, False, [2, 3]),
+        (4, True, [1, 5, 2, 3]),
+        (3, True, [1, 5]),
+        (1, True, []),
+        (6, False, []),
+    ],
+)
+def test_prerequisites(graph, course_id, transitive, expected):
+    assert ids(graph.prerequisites(course_id, transitive=transitive)) == expected
+
+
+def test_learning_path(graph):
+    # Farthest prerequisites first, then by id
+    assert ids(graph.learning_path(4)) == [1, 5, 2, 3, 4]
+    assert ids(graph.learning_path(6)) == [6]
+
+
+def test_unknown_course(graph):
+    assert graph.prerequisites(99) is None
+    assert graph.learning_path(99) is None
+
+
+def test_cycle_fails_build():
+    with pytest.raises(PrerequisiteCycleError, match="course 2 -> course 4 -> course 2"):
+        PrerequisiteGraph.build(COURSES, EDGES + [(2, 4)])
+
+
+def test_self_prerequisite_fails_build():
+    with pytest.raises(PrerequisiteCycleError, match="course 6 -> course 6"):
+        PrerequisiteGraph.build(COURSES, [(6, 6)])
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from techconnect_classes_api.schemas.course import CourseNodeResponse
+from techconnect_classes_api.services.recommendation_service import (
+    RecommendationEngine,
+    RecommendationStore,
+)
+
+EXCEL, EXCEL_2, PYTHON, PYTHON_2, RESUME = 1, 2, 3, 4, 5
+EXCEL_SERIES, PYTHON_SERIES, CAREER_SERIES = 10, 20, 30
+
+
+@pytest.fixture
+def engine():
+    names = ["Excel", "Excel 2", "Python", "Python 2", "Resume"]
+    return RecommendationEngine.build(
+        [CourseNodeResponse(id=i, course_name=n) for i, n in enumerate(names, 1)],
+        level_ids=[1, 2, 1, 2, 1],
+        format_ids=[1, 1, 1, 1, 2],
+        course_series=[
+            (EXCEL, EXCEL_SERIES),
+            (EXCEL_2, EXCEL_SERIES),
+            (PYTHON, PYTHON_SERIES),
+            (PYTHON_2, PYTHON_SERIES),
+            (RESUME, CAREER_SERIES),
+        ],
+        prerequisites=[(EXCEL_2, EXCEL), (PYTHON_2, PYTHON)],
+    )
+
+
+def recommended_ids(engine, taken, series, limit=10):
+    return [course.id for course, _ in engine.recommend(taken, series, limit)]
+
+
+def test_features_are_normalized(engine):
+    assert engine.features.shape == (5, 3 + 2 + 2)
+    np.testing.assert_allclose(np.linalg.norm(engine.features, axis=1), 1, rtol=1e-6)
+
+
+def test_cold_start_recommends_courses_without_prerequisites(engine):
+    scores = engine.score([], [])
+    assert np.isneginf(scores).tolist() == [False, True, False, True, False]
+    # Ties keep course order
+    assert recommended_ids(engine, [], []) == [EXCEL, PYTHON, RESUME]
+
+
+def test_taken_courses_and_unmet_prerequisites_are_excluded(engine):
+    assert recommended_ids(engine, [EXCEL], []) == [EXCEL_2, PYTHON, RESUME]
+
+
+def test_next_steps_rank_first(engine):
+    recommendations = engine.recommend([EXCEL, PYTHON], [], 10)
+    assert [course.id for course, _ in recommendations] == [EXCEL_2, PYTHON_2, RESUME]
+    assert recommendations[0][1] == pytest.approx(recommendations[1][1])
+    assert recommendations[1][1] > recommendations[2][1] + 0.5
+
+
+def test_interests_steer_recommendations(engine):
+    assert recommended_ids(engine, [], [CAREER_SERIES]) == [RESUME, EXCEL, PYTHON]
+    # A stated interest outweighs the next step of the history
+    assert recommended_ids(engine, [EXCEL], [PYTHON_SERIES]) == [
+        PYTHON,
+        EXCEL_2,
+        RESUME,
+    ]
+
+
+def test_unknown_ids_are_ignored(engine):
+    assert recommended_ids(engine, [EXCEL, 999], [999]) == recommended_ids(
+        engine, [EXCEL], []
+    )
+
+
+def test_limit(engine):
+    assert recommended_ids(engine, [], [], limit=2) == [EXCEL, PYTHON]
+    assert recommended_ids(engine, [], [], limit=1) == [EXCEL]
+    everything = [EXCEL, EXCEL_2, PYTHON, PYTHON_2, RESUME]
+    assert recommended_ids(engine, everything, [], limit=3) == []
+
+
+def test_store_builds_once_per_catalog_version(engine):
+    store = RecommendationStore()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return engine
+
+    assert store.get("v1", build) is engine
+    assert store.get("v1", build) is engine
+    assert len(builds) == 1
+    store.get("v2", build)
+    store.get("v2", build)
+    assert len(builds) == 2
+    store.clear()
+    store.get("v2", build)
+    assert len(builds) == 3
@@ -0,0 +1,68 @@
+import pytest
+
+from techconnect_classes_api.services.response_cache import ResponseCache, canonical_query
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("", ""),
+        ("level=beginner", "level=beginner"),
+        ("limit=5&level=b&level=a", "level=a&level=b&limit=5"),
+        ("level=a&level=b&level=a", "level=a&level=b"),
+        ("ids=3&ids=1", "ids=3&ids=1"),
+        ("search=web+design&cursor=", "cursor=&search=web+design"),
+    ],
+)
+def test_canonical_query(query, expected):
+    assert canonical_query(query, unordered=("level",)) == expected
+
+
+def test_response_cache_lru_eviction():
+    cache = ResponseCache(max_bytes=10)
+    cache.set("a", b"1234", {}, ttl_seconds=60)
+    cache.set("b", b"1234", {}, ttl_seconds=60)
+    assert cache.get("a").body == b"1234"
+
+    cache.set("c", b"1234", {}, ttl_seconds=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats() == {
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "entries": 2,
+        "bytes": 8,
+    }
+
+
+def test_response_cache_skips_oversized_bodies():
+    cache = ResponseCache(max_bytes=4)
+    cache.set("a", b"12345", {}, ttl_seconds=60)
+    assert len(cache) == 0
+
+
+def test_response_cache_ttl(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    cache = ResponseCache(max_bytes=100)
+    cache.set("a", b"body", {}, ttl_seconds=30)
+    assert cache.get("a") is not None
+
+    now += 30
+    assert cache.get("a") is None
+    assert cache.size == 0
+
+
+def test_response_cache_invalidate():
+    cache = ResponseCache(max_bytes=100)
+    cache.set("/courses/all?", b"1", {}, ttl_seconds=60)
+    cache.set("/courses/1?", b"2", {}, ttl_seconds=60)
+    cache.set("/users/me?", b"3", {}, ttl_seconds=60)
+
+    assert cache.invalidate("/courses/") == 2
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert cache.size == 0
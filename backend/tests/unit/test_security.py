@@ -0,0 +1,96 @@
+import threading
+import time
+
+import pytest
+
+from techconnect_classes_api.core import security
+from techconnect_classes_api.core.security import (
+    MAX_BCRYPT_ROUNDS,
+    MIN_BCRYPT_ROUNDS,
+    PasswordHasher,
+    PasswordHashQueueFullError,
+    calibrate_rounds,
+)
+
+
+@pytest.fixture
+def hasher():
+    return PasswordHasher(workers=1, max_queued=4, rounds=4)
+
+
+def test_hash_and_verify(hasher):
+    hashed = hasher.hash("secret")
+
+    assert hashed.startswith("$2b$04$")
+    assert hasher.verify("secret", hashed)
+    assert not hasher.verify("wrong", hashed)
+    assert hasher.stats()["completed"] == 3
+    assert hasher.stats()["queued"] == hasher.stats()["running"] == 0
+
+
+def test_verify_and_update_rehashes_other_costs(hasher):
+    hashed = hasher.hash("secret")
+    assert hasher.verify_and_update("secret", hashed) == (True, None)
+
+    hasher.set_rounds(5)
+
+    assert hasher.verify_and_update("wrong", hashed) == (False, None)
+    valid, new_hash = hasher.verify_and_update("secret", hashed)
+    assert valid
+    assert new_hash.startswith("$2b$05$")
+    assert hasher.verify("secret", new_hash)
+
+
+def test_verify_and_update_defers_rehash_on_full_queue(hasher, monkeypatch):
+    hashed = hasher.hash("secret")
+    hasher.set_rounds(5)
+
+    def queue_full(password):
+        raise PasswordHashQueueFullError
+
+    monkeypatch.setattr(hasher, "hash", queue_full)
+
+    assert hasher.verify_and_update("secret", hashed) == (True, None)
+
+
+def test_full_queue_rejects():
+    hasher = PasswordHasher(workers=1, max_queued=1, rounds=4)
+    release = threading.Event()
+    blocked = []
+    # One call occupies the only worker and a second one waits behind it
+    for stat in ["running", "queued"]:
+        thread = threading.Thread(target=hasher._run, args=(release.wait,))
+        thread.start()
+        blocked.append(thread)
+        while hasher.stats()[stat] < 1:
+            time.sleep(0.001)
+
+    with pytest.raises(PasswordHashQueueFullError):
+        hasher.hash("secret")
+
+    release.set()
+    for thread in blocked:
+        thread.join()
+    assert hasher.stats()["peak_queued"] == 1
+    assert hasher.stats()["rejected"] == 1
+    assert hasher.stats()["completed"] == 2
+
+
+def test_calibrate_rounds(monkeypatch):
+    # A hash at the minimum cost takes 20 ms: 80 ms fits two more rounds
+    clock = iter([0.0, 0.02])
+    monkeypatch.setattr(security.time, "perf_counter", lambda: next(clock))
+    monkeypatch.setattr(security.bcrypt, "hashpw", lambda password, salt: b"")
+
+    assert calibrate_rounds(80) == MIN_BCRYPT_ROUNDS + 2
+
+
+@pytest.mark.parametrize(
+    "target_ms, expected", [(1, MIN_BCRYPT_ROUNDS), (10**9, MAX_BCRYPT_ROUNDS)]
+)
+def test_calibrate_rounds_is_bounded(monkeypatch, target_ms, expected):
+    clock = iter([0.0, 0.02])
+    monkeypatch.setattr(security.time, "perf_counter", lambda: next(clock))
+    monkeypatch.setattr(security.bcrypt, "hashpw", lambda password, salt: b"")
+
+    assert calibrate_rounds(target_ms) == expected
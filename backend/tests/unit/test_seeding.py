@@ -0,0 +1,28 @@
+import pandas as pd
+
+from scripts.core.seeding import hash_catalog
+
+
+def seeded_tables():
+    return {
+        "levels": pd.DataFrame({"id": [1, 2], "level_name": ["none", "beginner"]}),
+        "courses": pd.DataFrame(
+            {"id": [1, 2], "course_name": ["Open Lab", "Excel for Beginners"]}
+        ),
+    }
+
+
+def test_hash_catalog_is_stable():
+    assert hash_catalog(seeded_tables()) == hash_catalog(seeded_tables())
+
+
+def test_hash_catalog_changes_with_seeded_rows():
+    version = hash_catalog(seeded_tables())
+
+    renamed = seeded_tables()
+    renamed["courses"].loc[1, "course_name"] = "Excel Basics"
+    renumbered = seeded_tables()
+    renumbered["courses"]["id"] = [2, 3]
+
+    assert hash_catalog(renamed) != version
+    assert hash_catalog(renumbered) != version